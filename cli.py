@@ -0,0 +1,278 @@
+# ------------------ LÍNEA DE COMANDOS (SIN INTERFAZ GRÁFICA) ------------------
+# Genera números con cualquier generador del registro, les aplica las pruebas y
+# escribe los Ri (CSV o binario) y un reporte JSON. No importa PyQt6 ni
+# matplotlib, así que sirve en servidores y trabajos por lotes:
+#
+#   python -m cli listar
+#   python -m cli generar "Cuadrados Medios" -n 10000 -p semilla=5735 -p d=4 \
+#       --salida ri.csv --pruebas medias varianza uniformidad --reporte reporte.json
+#   python -m cli generar PCG32 -n 1000000000 --salida ri.npy
+#   python -m cli probar ri.npy --pruebas medias varianza
+#   python -m cli bateria ri.npy --pruebas poker huecos kolmogorov_smirnov
+#   python -m cli bits ri.npy --bits-por-numero 32
+#   python -m cli meta ri.npy --bloques 100 --pruebas uniformidad series
+#   python -m cli meta --generador PCG32 -n 100000 --semillas 1 2 3 4 5 6 7 8
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from generators import GENERADORES, crear_generador
+from utils.exporter import (
+    cargar_secuencia, exportar_binario_bloques, exportar_csv_bloques, exportar_secuencia_bloques, ruta_secuencia
+)
+
+PRUEBAS = ["medias", "varianza", "uniformidad"]
+
+# npy: secuencia con metadatos (ver utils.exporter), se reabre mapeada en memoria
+FORMATOS = ["binario", "csv", "npy"]
+
+
+def _a_json(valor):
+    """Convierte escalares y arrays NumPy a tipos que json sabe escribir."""
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def _buscar_generador(nombre: str) -> str:
+    for registrado in GENERADORES:
+        if registrado.lower() == nombre.lower():
+            return registrado
+    raise ValueError(f"Generador desconocido: {nombre}. Disponibles: {', '.join(GENERADORES)}")
+
+
+def _parametros(pares) -> dict:
+    parametros = {}
+    for par in pares or []:
+        clave, separador, valor = par.partition("=")
+        if not separador:
+            raise ValueError(f"Parámetro mal formado '{par}': se espera clave=valor")
+        try:
+            parametros[clave.strip()] = int(valor)
+        except ValueError:
+            raise ValueError(f"El parámetro {clave.strip()} debe ser entero")
+    return parametros
+
+
+def _formato(args) -> str:
+    if args.formato:
+        return args.formato
+    if args.salida.endswith(".npy"):
+        return "npy"
+    return "binario" if args.salida.endswith((".bin", ".f8")) else "csv"
+
+
+def _acumuladores(args) -> dict:
+    if not args.pruebas:
+        return {}
+    # pruebas importa scipy.stats (lento): solo se carga si se piden pruebas
+    from pruebas.acumuladores import crear_acumulador
+    return {prueba: crear_acumulador(prueba, args.k) for prueba in args.pruebas}
+
+
+def _bloques_con_pruebas(bloques, acumuladores, segundos):
+    """Deja pasar los bloques alimentando de paso los acumuladores: la secuencia nunca está entera en memoria."""
+    for bloque in bloques:
+        for prueba, acumulador in acumuladores.items():
+            inicio = time.perf_counter()
+            acumulador.agregar(bloque)
+            segundos[prueba] += time.perf_counter() - inicio
+        yield bloque
+
+
+def _resultados_pruebas(acumuladores, segundos, args) -> dict:
+    resultados = {}
+    for prueba, acumulador in acumuladores.items():
+        inicio = time.perf_counter()
+        resultado = acumulador.resultado(args.alpha)
+        resultado["segundos"] = segundos[prueba] + time.perf_counter() - inicio
+        resultados[prueba] = resultado
+    return resultados
+
+
+def _escribir_reporte(reporte, args):
+    texto = json.dumps(reporte, default=_a_json, ensure_ascii=False, indent=2)
+    if args.reporte and args.reporte != "-":
+        with open(args.reporte, mode="w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+
+
+def listar(args):
+    for nombre, clase in GENERADORES.items():
+        parametros = ", ".join(f"{clave}={defecto}" for clave, _, defecto in clase.PARAMETROS)
+        print(f"{nombre}: {parametros}")
+    return 0
+
+
+def generar(args):
+    nombre = _buscar_generador(args.generador)
+    parametros = _parametros(args.parametro)
+    if args.n <= 0:
+        raise ValueError("La cantidad n debe ser positiva")
+    generador = crear_generador(nombre, args.n, **parametros)
+    reporte = {"generador": nombre, "parametros": parametros, "n": args.n}
+    estado_inicial = generador.obtener_estado()
+
+    acumuladores = _acumuladores(args)
+    segundos = dict.fromkeys(acumuladores, 0.0)
+    inicio = time.perf_counter()
+    # Generación, exportación y pruebas por bloques, con memoria constante
+    bloques = _bloques_con_pruebas(generador.iterar_bloques(args.bloque, args.n), acumuladores, segundos)
+    if args.salida:
+        formato = _formato(args)
+        if formato == "npy":
+            args.salida = ruta_secuencia(args.salida)
+            exportar_secuencia_bloques(args.salida, bloques, args.n, algoritmo=nombre,
+                                       parametros=parametros, estado=estado_inicial)
+        elif formato == "binario":
+            exportar_binario_bloques(args.salida, bloques)
+        else:
+            exportar_csv_bloques(args.salida, bloques)
+        reporte["salida"] = {"ruta": args.salida, "formato": formato}
+    else:
+        for _ in bloques:
+            pass
+    reporte["segundos_generacion"] = time.perf_counter() - inicio - sum(segundos.values())
+
+    reporte["pruebas"] = _resultados_pruebas(acumuladores, segundos, args)
+    _escribir_reporte(reporte, args)
+    return 0
+
+
+def probar(args):
+    ri, metadatos = cargar_secuencia(args.secuencia)
+    reporte = {"secuencia": args.secuencia, "metadatos": metadatos, "n": len(ri)}
+    acumuladores = _acumuladores(args)
+    segundos = dict.fromkeys(acumuladores, 0.0)
+    # Bloques del archivo mapeado: solo se lee de disco lo que se está probando
+    bloques = (ri[i:i + args.bloque] for i in range(0, len(ri), args.bloque))
+    for _ in _bloques_con_pruebas(bloques, acumuladores, segundos):
+        pass
+    reporte["pruebas"] = _resultados_pruebas(acumuladores, segundos, args)
+    _escribir_reporte(reporte, args)
+    return 0
+
+
+def bateria(args):
+    # La batería necesita la secuencia completa: el archivo mapeado se lee sin copiarlo
+    from pruebas.bateria import ejecutar_bateria
+    ri, metadatos = cargar_secuencia(args.secuencia)
+    reporte = {"secuencia": args.secuencia, "metadatos": metadatos}
+    reporte.update(ejecutar_bateria(ri, args.pruebas, args.alpha, hilos=args.hilos))
+    _escribir_reporte(reporte, args)
+    return 0
+
+
+def bits(args):
+    from pruebas_bits import bits_desde_ri, ejecutar_bateria_bits
+    ri, metadatos = cargar_secuencia(args.secuencia)
+    cadena = bits_desde_ri(ri, args.bits_por_numero)
+    reporte = {"secuencia": args.secuencia, "metadatos": metadatos, "bits_por_numero": args.bits_por_numero}
+    reporte.update(ejecutar_bateria_bits(cadena, args.pruebas, args.alpha, hilos=args.hilos))
+    _escribir_reporte(reporte, args)
+    return 0
+
+
+def meta(args):
+    from pruebas.meta import prueba_dos_niveles, prueba_dos_niveles_semillas
+    if args.generador:
+        # Una corrida por semilla, generada dentro de cada proceso
+        if not args.semillas or not args.n:
+            raise ValueError("Con --generador hay que indicar -n y --semillas")
+        nombre = _buscar_generador(args.generador)
+        parametros = _parametros(args.parametro)
+        reporte = {"generador": nombre, "parametros": parametros, "n": args.n}
+        reporte.update(prueba_dos_niveles_semillas(nombre, args.semillas, args.n, args.pruebas, args.alpha,
+                                                   parametros, procesos=args.procesos))
+    elif args.secuencia:
+        ri, metadatos = cargar_secuencia(args.secuencia)
+        reporte = {"secuencia": args.secuencia, "metadatos": metadatos, "n": len(ri)}
+        reporte.update(prueba_dos_niveles(ri, args.bloques, args.pruebas, args.alpha, procesos=args.procesos))
+    else:
+        raise ValueError("Indique una secuencia .npy o --generador")
+    _escribir_reporte(reporte, args)
+    return 0
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Generación y pruebas de números pseudoaleatorios sin interfaz gráfica.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_listar = sub.add_parser("listar", help="Muestra los generadores registrados y sus parámetros")
+    p_listar.set_defaults(funcion=listar)
+
+    p_generar = sub.add_parser("generar", help="Genera n Ri, los exporta y aplica las pruebas")
+    p_generar.add_argument("generador", help="Nombre del generador (ver 'listar')")
+    p_generar.add_argument("-n", type=int, required=True, help="Cantidad de números")
+    p_generar.add_argument("-p", "--parametro", action="append", metavar="CLAVE=VALOR",
+                           help="Parámetro del generador; se puede repetir")
+    p_generar.add_argument("--salida", help="Archivo de salida de los Ri")
+    p_generar.add_argument("--formato", choices=FORMATOS,
+                           help="binario (float64 crudo), csv o npy (con metadatos); por defecto según la extensión")
+    _argumentos_pruebas(p_generar)
+    p_generar.set_defaults(funcion=generar)
+
+    p_probar = sub.add_parser("probar", help="Aplica las pruebas a una secuencia .npy guardada (mapeada en memoria)")
+    p_probar.add_argument("secuencia", help="Archivo .npy escrito con --salida ... .npy")
+    _argumentos_pruebas(p_probar)
+    p_probar.set_defaults(funcion=probar)
+
+    p_bateria = sub.add_parser("bateria", help="Aplica la batería de pruebas (corridas, póker, huecos, KS, series, ...) a una secuencia .npy")
+    p_bateria.add_argument("secuencia", help="Archivo .npy escrito con --salida ... .npy")
+    p_bateria.add_argument("--pruebas", nargs="+", help="Pruebas de la batería a aplicar (por defecto todas)")
+    p_bateria.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia")
+    p_bateria.add_argument("--hilos", type=int, help="Hilos del pool (por defecto uno por núcleo)")
+    p_bateria.add_argument("--reporte", help="Archivo JSON del reporte ('-' o sin indicar: salida estándar)")
+    p_bateria.set_defaults(funcion=bateria)
+
+    p_bits = sub.add_parser("bits", help="Convierte una secuencia .npy en bits y aplica el subconjunto de NIST SP 800-22")
+    p_bits.add_argument("secuencia", help="Archivo .npy escrito con --salida ... .npy")
+    p_bits.add_argument("--bits-por-numero", type=int, default=32, help="Bits que aporta cada Ri (los más significativos)")
+    p_bits.add_argument("--pruebas", nargs="+", help="Pruebas de bits a aplicar (por defecto todas)")
+    p_bits.add_argument("--alpha", type=float, default=0.01, help="Nivel de significancia (NIST usa 0.01)")
+    p_bits.add_argument("--hilos", type=int, help="Hilos del pool (por defecto uno por núcleo)")
+    p_bits.add_argument("--reporte", help="Archivo JSON del reporte ('-' o sin indicar: salida estándar)")
+    p_bits.set_defaults(funcion=bits)
+
+    p_meta = sub.add_parser("meta", help="Prueba de dos niveles: la batería sobre M bloques (o M semillas) y KS/χ² a sus p-valores")
+    p_meta.add_argument("secuencia", nargs="?", help="Archivo .npy a dividir en bloques")
+    p_meta.add_argument("--bloques", type=int, default=100, help="Cantidad de bloques de la secuencia")
+    p_meta.add_argument("--generador", help="En vez de una secuencia: generador del registro, una corrida por semilla")
+    p_meta.add_argument("-n", type=int, help="Números por corrida (con --generador)")
+    p_meta.add_argument("--semillas", type=int, nargs="+", help="Semillas de las corridas (con --generador)")
+    p_meta.add_argument("-p", "--parametro", action="append", metavar="CLAVE=VALOR",
+                        help="Parámetro del generador; se puede repetir")
+    p_meta.add_argument("--pruebas", nargs="+", default=["uniformidad"], help="Pruebas de la batería a aplicar")
+    p_meta.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia")
+    p_meta.add_argument("--procesos", type=int, help="Procesos del pool (por defecto uno por núcleo)")
+    p_meta.add_argument("--reporte", help="Archivo JSON del reporte ('-' o sin indicar: salida estándar)")
+    p_meta.set_defaults(funcion=meta)
+    return parser
+
+
+def _argumentos_pruebas(parser):
+    parser.add_argument("--pruebas", nargs="+", choices=PRUEBAS, help="Pruebas a aplicar")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia")
+    parser.add_argument("-k", type=int, default=10, help="Intervalos de la prueba de uniformidad")
+    parser.add_argument("--bloque", type=int, default=1 << 16, help="Tamaño de bloque al generar, exportar y probar")
+    parser.add_argument("--reporte", help="Archivo JSON del reporte ('-' o sin indicar: salida estándar)")
+
+
+def main(argv=None) -> int:
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.funcion(args)
+    except ValueError as e:
+        parser.exit(2, f"Error: {e}\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+# Registro de generadores: todos comparten la misma interfaz
+# (generar_array, generar_columnas, generar_tabla, iterar_bloques,
+# obtener_estado/restaurar_estado) y declaran sus PARAMETROS.
+from .cuadrados_medios import CuadradosMedios
+from .productos_medios import ProductosMedios
+from .multiplicador_constante import MultiplicadorConstante
+from .congruencial_lineal import LCG
+from .xorshift128p import Xorshift128Plus
+from .pcg32 import PCG32
+from .splitmix64 import SplitMix64
+from .mrg32k3a import MRG32k3a
+from .cuasi_aleatorios import Halton, Sobol
+
+GENERADORES = {
+    "Cuadrados Medios": CuadradosMedios,
+    "Productos Medios": ProductosMedios,
+    "Multiplicador Constante": MultiplicadorConstante,
+    "Congruencial Lineal (LCG)": LCG,
+    "Xorshift128+": Xorshift128Plus,
+    "PCG32": PCG32,
+    "SplitMix64": SplitMix64,
+    "MRG32k3a": MRG32k3a,
+    "Halton": Halton,
+    "Sobol": Sobol,
+}
+
+
+def crear_generador(nombre: str, n: int, **parametros):
+    """Instancia un generador del registro; los parámetros omitidos toman su valor por defecto."""
+    if nombre not in GENERADORES:
+        raise ValueError(f"Generador desconocido: {nombre}")
+    clase = GENERADORES[nombre]
+    argumentos = {clave: defecto for clave, _, defecto in clase.PARAMETROS}
+    desconocidos = [clave for clave in parametros if clave not in argumentos]
+    if desconocidos:
+        raise ValueError(f"Parámetros desconocidos para {nombre}: {', '.join(desconocidos)}. "
+                         f"Válidos: {', '.join(argumentos)}")
+    argumentos.update(parametros)
+    return clase(n=n, **argumentos)
@@ -0,0 +1,311 @@
+# ------------------ BARRIDO DE SEMILLAS ------------------
+# Evalúa todas las semillas válidas de los tres métodos de dígitos centrales:
+# cada semilla es un "carril" de un array NumPy y los bloques de carriles se
+# reparten en un pool de procesos. El resultado es una tabla ordenada por
+# periodo con media, varianza y χ² de los primeros n Ri, guardada en disco para
+# que el siguiente barrido igual sea inmediato.
+# Cuadrados Medios admite cualquier d par hasta D_MAX_TABLA (su grafo se tabula
+# completo). Productos Medios y Multiplicador Constante se barren solo con
+# d = 4: sus espacios son pares de valores (~10^(2d) carriles, ~10^12 con d = 6).
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import scipy.stats as stats
+
+from .grafo_funcional import D_MAX_TABLA, analisis_cuadrados_medios, analizar_grafo, tabla_sucesores
+
+D = 4
+MODULO = 10 ** D
+SEMILLA_MIN, SEMILLA_MAX = 10 ** (D - 1), MODULO - 1
+DIVISOR = 10 ** (D // 2)
+
+DIRECTORIO_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "proyecto_simulacion", "barridos")
+VERSION_CACHE = 1
+
+# Carriles por tarea del pool (acota la memoria de cada proceso)
+CARRILES_POR_TAREA = 1 << 16
+
+
+# ---------------- Estadísticas por carril ----------------
+class _EstadisticasCarriles:
+    """Acumula suma, suma de cuadrados y frecuencias χ² de cada carril, paso a paso."""
+
+    def __init__(self, carriles: int, k: int):
+        self.k = k
+        self.n = 0
+        self.suma = np.zeros(carriles)
+        self.suma_cuadrados = np.zeros(carriles)
+        self.frecuencias = np.zeros(carriles * k, dtype=np.int64)
+        self._base = np.arange(carriles, dtype=np.int64) * k
+        self._intervalos = np.linspace(0, 1, k + 1)
+
+    def agregar(self, ri):
+        # Desplazar por 0.5 mantiene estable la varianza calculada con sumas
+        centrado = ri - 0.5
+        self.suma += centrado
+        self.suma_cuadrados += centrado * centrado
+        # Mismos intervalos que np.histogram en prueba_uniformidad (el último es cerrado)
+        idx = np.minimum(np.searchsorted(self._intervalos, ri, side="right") - 1, self.k - 1)
+        self.frecuencias += np.bincount(self._base + idx, minlength=len(self.frecuencias))
+        self.n += 1
+
+    def resultados(self, alpha: float) -> dict:
+        n, k = self.n, self.k
+        media = 0.5 + self.suma / n
+        varianza = (self.suma_cuadrados - self.suma ** 2 / n) / (n - 1)
+        fe = n / k
+        chi = ((self.frecuencias.reshape(-1, k) - fe) ** 2 / fe).sum(axis=1)
+
+        # Mismos límites que prueba_medias, prueba_varianza y prueba_uniformidad
+        z = stats.norm.ppf(1 - alpha / 2)
+        media_inf, media_sup = 0.5 - z / np.sqrt(12 * n), 0.5 + z / np.sqrt(12 * n)
+        var_inf = stats.chi2.ppf(alpha / 2, n - 1) / (12 * (n - 1))
+        var_sup = stats.chi2.ppf(1 - alpha / 2, n - 1) / (12 * (n - 1))
+        chi_critico = stats.chi2.ppf(1 - alpha, k - 1)
+
+        return {
+            "media": media,
+            "varianza": varianza,
+            "chi_cuadrado": chi,
+            "acepta_medias": (media_inf <= media) & (media <= media_sup),
+            "acepta_varianza": (var_inf <= varianza) & (varianza <= var_sup),
+            "acepta_uniformidad": chi < chi_critico
+        }
+
+
+def _estadisticas_por_tabla(sucesor, semillas, n, k, alpha):
+    """Estadísticas de los primeros n Ri de cada semilla recorriendo una tabla de sucesores."""
+    acumulador = _EstadisticasCarriles(len(semillas), k)
+    x = np.asarray(semillas, dtype=np.int64)
+    modulo = len(sucesor)
+    for _ in range(n):
+        x = sucesor[x]
+        acumulador.agregar(x / modulo)
+    return acumulador.resultados(alpha)
+
+
+# ---------------- Detección de ciclos por carriles (Brent) ----------------
+def _paso_productos(estado):
+    x, y = np.divmod(estado, MODULO)
+    return y * MODULO + (x * y // DIVISOR) % MODULO
+
+
+def _brent_carriles(paso, estados, max_pasos):
+    """
+    Algoritmo de Brent aplicado a todos los carriles a la vez.
+    Devuelve (cola, periodo) por carril; -1 donde no se encontró ciclo en max_pasos.
+    """
+    carriles = len(estados)
+    periodo = np.full(carriles, -1, dtype=np.int64)
+    cola = np.full(carriles, -1, dtype=np.int64)
+
+    # Fase 1: longitud del ciclo
+    idx = np.arange(carriles)
+    tortuga = estados.copy()
+    liebre = paso(estados)
+    potencia = np.ones(carriles, dtype=np.int64)
+    lam = np.ones(carriles, dtype=np.int64)
+    for _ in range(max_pasos):
+        listo = tortuga == liebre
+        periodo[idx[listo]] = lam[listo]
+        seguir = ~listo
+        if not seguir.any():
+            break
+        idx, tortuga, liebre, potencia, lam = idx[seguir], tortuga[seguir], liebre[seguir], potencia[seguir], lam[seguir]
+        reinicio = potencia == lam
+        tortuga[reinicio] = liebre[reinicio]
+        potencia[reinicio] *= 2
+        lam[reinicio] = 0
+        liebre = paso(liebre)
+        lam += 1
+
+    # Fase 2: longitud de la cola (solo donde se conoce el periodo)
+    idx = np.flatnonzero(periodo > 0)
+    tortuga = estados[idx]
+    liebre = estados[idx].copy()
+    faltan = periodo[idx].copy()
+    while (faltan > 0).any():
+        mover = faltan > 0
+        liebre[mover] = paso(liebre[mover])
+        faltan[mover] -= 1
+    mu = np.zeros(len(idx), dtype=np.int64)
+    for _ in range(max_pasos + 1):
+        listo = tortuga == liebre
+        cola[idx[listo]] = mu[listo]
+        seguir = ~listo
+        if not seguir.any():
+            break
+        idx, tortuga, liebre, mu = idx[seguir], paso(tortuga[seguir]), paso(liebre[seguir]), mu[seguir] + 1
+    return cola, periodo
+
+
+# ---------------- Tareas del pool (funciones de módulo para poder serializarlas) ----------------
+def _tarea_multiplicador(constantes, semillas, n, k, alpha, mejores):
+    semillas = np.asarray(semillas, dtype=np.int64)
+    x = np.arange(MODULO, dtype=np.int64)
+    partes = []
+    for constante in constantes:
+        sucesor = (x * constante // DIVISOR) % MODULO
+        analisis = analizar_grafo(sucesor)
+        res = _estadisticas_por_tabla(sucesor, semillas, n, k, alpha)
+        res["semilla"] = semillas
+        res["k"] = np.full(len(semillas), constante, dtype=np.int64)
+        res["cola"] = analisis["cola"][semillas]
+        res["periodo"] = analisis["longitud_ciclo"][semillas]
+        res["distintos"] = _distintos(res["cola"], res["periodo"], 1)
+        partes.append(res)
+    return _ordenar(_concatenar(partes), mejores)
+
+
+def _tarea_productos(semillas1, semillas2, n, k, alpha, max_pasos, mejores):
+    s1, s2 = np.meshgrid(np.asarray(semillas1, dtype=np.int64), np.asarray(semillas2, dtype=np.int64), indexing="ij")
+    s1, s2 = s1.ravel(), s2.ravel()
+    estados = s1 * MODULO + s2
+
+    acumulador = _EstadisticasCarriles(len(estados), k)
+    x, y = s1.copy(), s2.copy()
+    for _ in range(n):
+        centro = (x * y // DIVISOR) % MODULO
+        x, y = y, centro
+        acumulador.agregar(centro / MODULO)
+    res = acumulador.resultados(alpha)
+
+    res["semilla1"], res["semilla2"] = s1, s2
+    res["cola"], res["periodo"] = _brent_carriles(_paso_productos, estados, max_pasos)
+    res["distintos"] = _distintos(res["cola"], res["periodo"], 2)
+    return _ordenar(res, mejores)
+
+
+def _concatenar(partes):
+    return {clave: np.concatenate([p[clave] for p in partes]) for clave in partes[0]}
+
+
+def _ejecutar(tarea, lotes, procesos):
+    if procesos == 1 or len(lotes) == 1:
+        return _concatenar([tarea(*lote) for lote in lotes])
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return _concatenar(list(pool.map(tarea, *zip(*lotes))))
+
+
+def _rango(desde, hasta, d=D):
+    minimo, maximo = 10 ** (d - 1), 10 ** d - 1
+    if not minimo <= desde <= hasta <= maximo:
+        raise ValueError(f"El barrido trabaja con valores de {d} dígitos ({minimo}-{maximo})")
+    return np.arange(desde, hasta + 1, dtype=np.int64)
+
+
+# ---------------- Ordenamiento y caché ----------------
+def _distintos(cola, periodo, desfase):
+    """
+    Iteraciones antes de que la salida se repita. El estado de Cuadrados Medios y
+    Multiplicador es el último Xi (desfase 1); el de Productos Medios, los dos últimos (desfase 2).
+    """
+    return np.where(periodo > 0, periodo + np.maximum(cola - desfase, 0), -1)
+
+
+def _ordenar(res, mejores=None):
+    # Más iteraciones antes de repetirse primero; luego ciclo más largo y menor χ²
+    orden = np.lexsort((res["chi_cuadrado"], -res["periodo"], -res["distintos"]))[:mejores]
+    return {clave: valores[orden] for clave, valores in res.items()}
+
+
+def _ruta_cache(parametros):
+    clave = json.dumps({"version": VERSION_CACHE, **parametros}, sort_keys=True)
+    return os.path.join(DIRECTORIO_CACHE, hashlib.sha1(clave.encode("utf-8")).hexdigest() + ".npz")
+
+
+def _con_cache(parametros, calcular, usar_cache):
+    ruta = _ruta_cache(parametros)
+    if usar_cache and os.path.exists(ruta):
+        with np.load(ruta) as datos:
+            return {clave: datos[clave] for clave in datos.files}
+    res = _ordenar(calcular(), parametros["mejores"])
+    if usar_cache:
+        os.makedirs(DIRECTORIO_CACHE, exist_ok=True)
+        np.savez(ruta, **res)
+    return res
+
+
+# ---------------- API pública ----------------
+def barrer_cuadrados_medios(n=100, k=10, alpha=0.05, desde=None, hasta=None, mejores=None, usar_cache=True, d=D):
+    """
+    Barrido de todas las semillas de d dígitos de Cuadrados Medios en [desde, hasta]
+    (por defecto todas: 10^(d-1) a 10^d - 1; d par hasta D_MAX_TABLA).
+    Devuelve columnas NumPy ordenadas por periodo (distintos): semilla, cola, periodo,
+    distintos, media, varianza, chi_cuadrado y acepta_* de los primeros n Ri.
+    mejores limita la tabla a las primeras filas del ranking (None = todas).
+    """
+    if d <= 0 or d % 2 or d > D_MAX_TABLA:
+        raise ValueError(f"El barrido de Cuadrados Medios requiere d par entre 2 y {D_MAX_TABLA}")
+    desde = 10 ** (d - 1) if desde is None else desde
+    hasta = 10 ** d - 1 if hasta is None else hasta
+    parametros = {"metodo": "cuadrados_medios", "n": n, "k": k, "alpha": alpha, "desde": desde, "hasta": hasta,
+                  "mejores": mejores, "d": d}
+
+    def calcular():
+        semillas = _rango(desde, hasta, d)
+        analisis = analisis_cuadrados_medios(d)
+        res = _estadisticas_por_tabla(tabla_sucesores(d), semillas, n, k, alpha)
+        res["semilla"] = semillas
+        res["cola"] = analisis["cola"][semillas]
+        res["periodo"] = analisis["longitud_ciclo"][semillas]
+        res["distintos"] = _distintos(res["cola"], res["periodo"], 1)
+        return res
+
+    return _con_cache(parametros, calcular, usar_cache)
+
+
+def barrer_multiplicador_constante(n=100, k=10, alpha=0.05, semillas=(SEMILLA_MIN, SEMILLA_MAX),
+                                   constantes=(SEMILLA_MIN, SEMILLA_MAX), mejores=1000, procesos=None,
+                                   usar_cache=True):
+    """
+    Barrido de todos los pares (semilla, k) de 4 dígitos de Multiplicador Constante.
+    semillas y constantes son rangos (desde, hasta); el grafo de cada constante
+    da cola y periodo exactos para todas las semillas a la vez. Cada tarea del
+    pool conserva solo sus mejores filas, así la memoria no crece con el barrido.
+    """
+    parametros = {"metodo": "multiplicador_constante", "n": n, "k": k, "alpha": alpha, "mejores": mejores,
+                  "semillas": list(semillas), "constantes": list(constantes)}
+
+    def calcular():
+        valores_semilla = _rango(*semillas)
+        valores_constante = _rango(*constantes)
+        por_tarea = max(1, CARRILES_POR_TAREA // len(valores_semilla))
+        lotes = [(valores_constante[i:i + por_tarea], valores_semilla, n, k, alpha, mejores)
+                 for i in range(0, len(valores_constante), por_tarea)]
+        return _ejecutar(_tarea_multiplicador, lotes, procesos)
+
+    return _con_cache(parametros, calcular, usar_cache)
+
+
+def barrer_productos_medios(n=100, k=10, alpha=0.05, semillas1=(SEMILLA_MIN, SEMILLA_MAX),
+                            semillas2=(SEMILLA_MIN, SEMILLA_MAX), max_pasos=5000, mejores=1000, procesos=None,
+                            usar_cache=True):
+    """
+    Barrido de todos los pares (semilla1, semilla2) de 4 dígitos de Productos Medios.
+    El espacio de estados es de pares, así que el periodo se busca con Brent
+    por carriles; periodo = -1 indica que no se cerró el ciclo en max_pasos.
+    """
+    parametros = {"metodo": "productos_medios", "n": n, "k": k, "alpha": alpha, "max_pasos": max_pasos,
+                  "mejores": mejores,
+                  "semillas1": list(semillas1), "semillas2": list(semillas2)}
+
+    def calcular():
+        valores1 = _rango(*semillas1)
+        valores2 = _rango(*semillas2)
+        por_tarea = max(1, CARRILES_POR_TAREA // len(valores2))
+        lotes = [(valores1[i:i + por_tarea], valores2, n, k, alpha, max_pasos, mejores)
+                 for i in range(0, len(valores1), por_tarea)]
+        return _ejecutar(_tarea_productos, lotes, procesos)
+
+    return _con_cache(parametros, calcular, usar_cache)
+
+
+def filas_barrido(res, inicio=0, fin=None) -> list:
+    """Convierte las columnas de un barrido en filas (diccionarios) para mostrarlas."""
+    total = len(res["periodo"])
+    fin = total if fin is None else min(fin, total)
+    return [{clave: valores[i].item() for clave, valores in res.items()} for i in range(inicio, fin)]
@@ -0,0 +1,198 @@
+# ------------------ CACHÉ DE SECUENCIAS ------------------
+# Memoriza los arrays (Xi, Ri) generados desde el estado inicial, con clave
+# (algoritmo, parámetros). Como n valores son el prefijo de cualquier corrida
+# más larga con la misma clave, se guarda solo la más larga y se sirven
+# prefijos (vistas, sin copiar). En memoria rige un presupuesto de bytes con
+# desalojo LRU; lo desalojado pasa a disco (.npy) y de ahí se lee mapeado, por
+# lo que también sobrevive entre sesiones. El disco tiene su propio presupuesto,
+# también LRU (la fecha de modificación de los archivos marca el último uso).
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from .nucleo import TAM_BLOQUE, TablaPorBloques, tamanos_bloque
+
+DIRECTORIO_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "proyecto_simulacion", "secuencias")
+VERSION_CACHE = 1
+PRESUPUESTO_BYTES = 256 * 1024 * 1024
+PRESUPUESTO_DISCO = 2 * 1024 * 1024 * 1024
+SUFIJOS = (".xi.npy", ".ri.npy")
+
+
+class CacheSecuencias:
+    def __init__(self, presupuesto_bytes: int = PRESUPUESTO_BYTES, directorio: str = DIRECTORIO_CACHE,
+                 usar_disco: bool = True, presupuesto_disco: int = PRESUPUESTO_DISCO):
+        if presupuesto_bytes < 0 or presupuesto_disco < 0:
+            raise ValueError("El presupuesto de bytes no puede ser negativo")
+        self.presupuesto_bytes = presupuesto_bytes
+        self.presupuesto_disco = presupuesto_disco
+        self.directorio = directorio
+        self.usar_disco = usar_disco
+        self._memoria = OrderedDict()  # clave -> (xi, ri), de menos a más reciente
+        self.bytes_en_memoria = 0
+        self.aciertos = 0
+        self.fallos = 0
+
+    # ---------------- Claves y rutas ----------------
+    @staticmethod
+    def clave(algoritmo: str, parametros: dict):
+        return algoritmo, tuple(sorted(parametros.items()))
+
+    def _ruta(self, clave) -> str:
+        texto = json.dumps({"version": VERSION_CACHE, "algoritmo": clave[0], "parametros": clave[1]})
+        return os.path.join(self.directorio, hashlib.sha1(texto.encode("utf-8")).hexdigest())
+
+    # ---------------- Disco ----------------
+    def _leer_disco(self, clave):
+        if not self.usar_disco:
+            return None
+        ruta = self._ruta(clave)
+        try:
+            xi = np.load(ruta + ".xi.npy", mmap_mode="r", allow_pickle=False)
+            ri = np.load(ruta + ".ri.npy", mmap_mode="r", allow_pickle=False)
+            for sufijo in SUFIJOS:
+                os.utime(ruta + sufijo)  # Marca el uso para el desalojo LRU del disco
+        except (FileNotFoundError, ValueError):
+            return None
+        return xi, ri
+
+    def _escribir_disco(self, clave, xi, ri):
+        # Xi de objetos (enteros de Python, d > 19) no se guarda: requeriría pickle
+        if not self.usar_disco or xi.dtype == object or xi.nbytes + ri.nbytes > self.presupuesto_disco:
+            return
+        anterior = self._leer_disco(clave)
+        if anterior is not None and len(anterior[1]) >= len(ri):
+            return
+        os.makedirs(self.directorio, exist_ok=True)
+        ruta = self._ruta(clave)
+        for sufijo, valores in zip(SUFIJOS, (xi, ri)):
+            temporal = f"{ruta}.{os.getpid()}.tmp.npy"
+            np.save(temporal, valores, allow_pickle=False)
+            os.replace(temporal, ruta + sufijo)
+        self._recortar_disco()
+
+    def _corridas_en_disco(self) -> dict:
+        """Ruta base -> (bytes, último uso) de cada corrida guardada en el directorio."""
+        corridas = {}
+        for nombre in os.listdir(self.directorio):
+            base, _, sufijo = nombre.partition(".")
+            if "." + sufijo not in SUFIJOS:
+                continue  # Temporales de escrituras en curso u otros archivos
+            try:
+                info = os.stat(os.path.join(self.directorio, nombre))
+            except FileNotFoundError:
+                continue
+            ruta = os.path.join(self.directorio, base)
+            tam, uso = corridas.get(ruta, (0, 0))
+            corridas[ruta] = (tam + info.st_size, max(uso, info.st_mtime_ns))
+        return corridas
+
+    def _recortar_disco(self):
+        """Borra las corridas usadas hace más tiempo hasta volver al presupuesto de disco."""
+        corridas = self._corridas_en_disco()
+        total = sum(tam for tam, _ in corridas.values())
+        for ruta, (tam, _) in sorted(corridas.items(), key=lambda corrida: corrida[1][1]):
+            if total <= self.presupuesto_disco:
+                break
+            for sufijo in SUFIJOS:
+                try:
+                    os.remove(ruta + sufijo)
+                except FileNotFoundError:
+                    pass
+            total -= tam
+
+    # ---------------- Memoria (LRU) ----------------
+    def _guardar_memoria(self, clave, xi, ri):
+        if clave in self._memoria:
+            viejo_xi, viejo_ri = self._memoria.pop(clave)
+            self.bytes_en_memoria -= viejo_xi.nbytes + viejo_ri.nbytes
+        self._memoria[clave] = (xi, ri)
+        self.bytes_en_memoria += xi.nbytes + ri.nbytes
+        # Desalojar las menos usadas (puede ser la recién agregada si sola supera el presupuesto)
+        while self.bytes_en_memoria > self.presupuesto_bytes and self._memoria:
+            clave_vieja, (viejo_xi, viejo_ri) = self._memoria.popitem(last=False)
+            self.bytes_en_memoria -= viejo_xi.nbytes + viejo_ri.nbytes
+            self._escribir_disco(clave_vieja, viejo_xi, viejo_ri)
+
+    # ---------------- API ----------------
+    def buscar(self, algoritmo: str, parametros: dict, n: int):
+        """(Xi, Ri) de n valores si hay en memoria o en disco una corrida de al menos n; si no, None."""
+        clave = self.clave(algoritmo, parametros)
+        guardado = self._memoria.get(clave)
+        if guardado is not None and len(guardado[1]) >= n:
+            self._memoria.move_to_end(clave)
+            self.aciertos += 1
+            return guardado[0][:n], guardado[1][:n]
+        guardado = self._leer_disco(clave)
+        if guardado is not None and len(guardado[1]) >= n:
+            self.aciertos += 1
+            return guardado[0][:n], guardado[1][:n]
+        self.fallos += 1
+        return None
+
+    def guardar(self, algoritmo: str, parametros: dict, xi, ri):
+        """Memoriza una corrida completa desde el estado inicial (queda de solo lectura)."""
+        xi.flags.writeable = False
+        ri.flags.writeable = False
+        self._guardar_memoria(self.clave(algoritmo, parametros), xi, ri)
+
+    def obtener(self, algoritmo: str, parametros: dict, n: int, generar):
+        """
+        (Xi, Ri) de n valores para la clave dada. generar(n) solo se llama si no
+        hay en memoria ni en disco una corrida de al menos n valores; el resultado
+        (puede ser una vista de solo lectura) no debe modificarse.
+        """
+        guardado = self.buscar(algoritmo, parametros, n)
+        if guardado is not None:
+            return guardado
+        xi, ri = generar(n)
+        self.guardar(algoritmo, parametros, xi, ri)
+        return xi, ri
+
+    def limpiar(self, disco: bool = False):
+        """Vacía la memoria y, si disco=True, también los archivos del directorio de caché."""
+        self._memoria.clear()
+        self.bytes_en_memoria = 0
+        if disco and os.path.isdir(self.directorio):
+            for nombre in os.listdir(self.directorio):
+                if nombre.endswith(".npy"):
+                    os.remove(os.path.join(self.directorio, nombre))
+
+
+# Caché compartida por las pestañas de la aplicación
+CACHE = CacheSecuencias()
+
+
+def generar_columnas_en_cache(generador, algoritmo: str, parametros: dict, cache: CacheSecuencias = CACHE,
+                              al_bloque=None, tam_bloque: int = TAM_BLOQUE):
+    """
+    generador.generar_columnas() para un generador recién creado, sirviendo los
+    arrays desde la caché: si hay una corrida guardada la tabla se arma con
+    generar_columnas(xi=..., ri=...) y el estado del generador no avanza (se
+    descarta después). Si no, se genera y la corrida completa queda en la caché.
+
+    Si hay que generar y se indica al_bloque, se genera de a tam_bloque filas y
+    se llama al_bloque(tabla_parcial) tras cada bloque; si devuelve False la
+    generación se corta ahí y se devuelve lo generado, sin guardarlo en la caché.
+    """
+    n = generador.n
+    guardado = cache.buscar(algoritmo, parametros, n)
+    if guardado is not None:
+        resultados = generador.generar_columnas(xi=guardado[0], ri=guardado[1])
+        if al_bloque is not None:
+            al_bloque(resultados)
+        return resultados
+
+    if al_bloque is None:
+        resultados = generador.generar_columnas()
+    else:
+        resultados = TablaPorBloques(generador.COLUMNAS)
+        for m in tamanos_bloque(tam_bloque, n):
+            resultados.agregar(generador.generar_columnas(m))
+            if al_bloque(resultados) is False:
+                return resultados
+    cache.guardar(algoritmo, parametros, resultados.xi, resultados.ri)
+    return resultados
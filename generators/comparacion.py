@@ -0,0 +1,34 @@
+# ------------------ COMPARACIÓN DE GENERADORES ------------------
+# Mide el throughput de cada generador registrado y le aplica las pruebas de
+# medias, varianza y uniformidad, para comparar los métodos lado a lado.
+import time
+
+from pruebas import prueba_medias, prueba_uniformidad, prueba_varianza
+
+from . import GENERADORES, crear_generador
+
+
+def comparar_generadores(n: int = 1000000, nombres=None, alpha: float = 0.05, k: int = 10) -> list:
+    """Una fila por generador: segundos, Ri por segundo y resultado de cada prueba."""
+    filas = []
+    for nombre in (nombres or GENERADORES):
+        generador = crear_generador(nombre, n)
+        inicio = time.perf_counter()
+        _, ri = generador.generar_array()
+        segundos = time.perf_counter() - inicio
+        medias = prueba_medias(ri, alpha)
+        varianza = prueba_varianza(ri, alpha)
+        uniformidad = prueba_uniformidad(ri, alpha, k)
+        filas.append({
+            "generador": nombre,
+            "n": n,
+            "segundos": segundos,
+            "valores_por_segundo": n / segundos if segundos > 0 else float("inf"),
+            "media": medias["media"],
+            "acepta_medias": medias["acepta_hipotesis"],
+            "varianza": varianza["varianza"],
+            "acepta_varianza": varianza["acepta_hipotesis"],
+            "chi_cuadrado": uniformidad["chi_cuadrado"],
+            "acepta_uniformidad": uniformidad["acepta_hipotesis"]
+        })
+    return filas
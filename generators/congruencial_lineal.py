@@ -0,0 +1,160 @@
+# ------------------ CONGRUENCIAL LINEAL (LCG) ------------------
+# X_{i+1} = (a * X_i + c) mod m,  R_i = X_{i+1} / m
+# j pasos del generador son otra transformación afín X -> A_j * X + C_j (mod m),
+# lo que permite generar bloques enteros de forma vectorizada y saltar n pasos
+# en O(log n) para repartir subflujos disjuntos entre procesos.
+from functools import lru_cache
+
+import numpy as np
+
+from .nucleo import TAM_BLOQUE, TablaColumnar, tamanos_bloque
+
+# Con m <= 2^32 los productos A_j * X caben en uint64 y el bloque se vectoriza
+M_MAX_VECTORIZADO = 1 << 32
+
+
+def componer_afin(a1: int, c1: int, a2: int, c2: int, m: int):
+    """Composición (X -> a2*X + c2) ∘ (X -> a1*X + c1) módulo m."""
+    return (a2 * a1) % m, (a2 * c1 + c2) % m
+
+
+def potencia_afin(a: int, c: int, m: int, pasos: int):
+    """(A, C) tales que aplicar pasos veces X -> a*X + c equivale a X -> A*X + C (mod m)."""
+    if pasos < 0:
+        raise ValueError("La cantidad de pasos no puede ser negativa")
+    a_total, c_total = 1, 0
+    a_pot, c_pot = a % m, c % m
+    while pasos:
+        if pasos & 1:
+            a_total, c_total = componer_afin(a_total, c_total, a_pot, c_pot, m)
+        a_pot, c_pot = componer_afin(a_pot, c_pot, a_pot, c_pot, m)
+        pasos >>= 1
+    return a_total, c_total
+
+
+@lru_cache(maxsize=32)
+def _coeficientes_bloque(a: int, c: int, m: int, largo: int):
+    """Arrays A_j, C_j para j = 1..largo (uint64, m <= 2^32), por duplicación."""
+    coef_a = np.empty(largo, dtype=np.uint64)
+    coef_c = np.empty(largo, dtype=np.uint64)
+    coef_a[0], coef_c[0] = a % m, c % m
+    m64 = np.uint64(m)
+    k = 1
+    while k < largo:
+        cuantos = min(k, largo - k)
+        # F_{k+j} = F_j ∘ F_k  =>  A_{k+j} = A_j*A_k, C_{k+j} = A_j*C_k + C_j
+        a_k, c_k = coef_a[k - 1], coef_c[k - 1]
+        coef_a[k:k + cuantos] = coef_a[:cuantos] * a_k % m64
+        coef_c[k:k + cuantos] = (coef_a[:cuantos] * c_k % m64 + coef_c[:cuantos]) % m64
+        k += cuantos
+    coef_a.flags.writeable = False
+    coef_c.flags.writeable = False
+    return coef_a, coef_c
+
+
+def _validar_parametros(a: int, c: int, m: int):
+    if m <= 1:
+        raise ValueError("El módulo m debe ser mayor que 1")
+    if not 0 < a < m:
+        raise ValueError("El multiplicador a debe cumplir 0 < a < m")
+    if not 0 <= c < m:
+        raise ValueError("El incremento c debe cumplir 0 <= c < m")
+
+
+class LCG:
+    COLUMNAS = ["Iteración", "Xi", "(a*Xi + c) mod m", "Ri"]
+    PARAMETROS = [("semilla", "Semilla X0", 12345), ("a", "Multiplicador a", 1103515245),
+                  ("c", "Incremento c", 12345), ("m", "Módulo m", 2 ** 31)]
+
+    def __init__(self, semilla: int, n: int, a: int = 1103515245, c: int = 12345, m: int = 2 ** 31):
+        _validar_parametros(a, c, m)
+        if semilla < 0:
+            raise ValueError("La semilla no puede ser negativa")
+        self.a = a
+        self.c = c
+        self.m = m
+        self.n = n
+        self.x = semilla % m
+
+    def _columnas(self, x: int, n: int):
+        """Xi = X_{i+1} (uint64) y Ri (float64) de n pasos partiendo de x."""
+        a, c, m = self.a, self.c, self.m
+        if m <= M_MAX_VECTORIZADO:
+            xi = np.empty(n, dtype=np.uint64)
+            largo = min(n, TAM_BLOQUE)
+            coef_a, coef_c = _coeficientes_bloque(a, c, m, largo) if largo else (None, None)
+            m64 = np.uint64(m)
+            for inicio in range(0, n, largo or 1):
+                cuantos = min(largo, n - inicio)
+                xi[inicio:inicio + cuantos] = (coef_a[:cuantos] * np.uint64(x) % m64 + coef_c[:cuantos]) % m64
+                x = int(xi[inicio + cuantos - 1])
+            ri = xi / float(m)
+        else:
+            xi = np.empty(n, dtype=np.uint64 if m <= 1 << 64 else object)
+            for i in range(n):
+                x = (a * x + c) % m
+                xi[i] = x
+            ri = np.fromiter((v / m for v in xi.tolist()), dtype=np.float64, count=n)
+        return xi, ri, x
+
+    def generar_array(self, n: int = None):
+        """Modo columnar: devuelve (Xi, Ri) como arrays NumPy y avanza el estado."""
+        xi, ri, self.x = self._columnas(self.x, self.n if n is None else n)
+        return xi, ri
+
+    def obtener_estado(self) -> dict:
+        return {"x": self.x, "a": self.a, "c": self.c, "m": self.m}
+
+    def restaurar_estado(self, estado: dict):
+        """Restaura X y también (a, c, m): el estado de otro LCG continúa su propia secuencia."""
+        a, c, m = (int(estado.get(clave, actual)) for clave, actual in (("a", self.a), ("c", self.c), ("m", self.m)))
+        _validar_parametros(a, c, m)
+        x = int(estado["x"])
+        if not 0 <= x < m:
+            raise ValueError("El estado x debe cumplir 0 <= x < m")
+        self.a, self.c, self.m, self.x = a, c, m, x
+
+    def iterar_bloques(self, tam_bloque: int = TAM_BLOQUE, total: int = None):
+        """Genera Ri en bloques NumPy de tam_bloque valores, continuando desde el estado actual."""
+        for m in tamanos_bloque(tam_bloque, total):
+            _, ri, self.x = self._columnas(self.x, m)
+            yield ri
+
+    # ---------------- Saltos y subflujos ----------------
+    def saltar(self, pasos: int):
+        """Avanza el estado pasos posiciones en O(log pasos), sin generar los valores intermedios."""
+        a_j, c_j = potencia_afin(self.a, self.c, self.m, pasos)
+        self.x = (a_j * self.x + c_j) % self.m
+        return self
+
+    def subflujo(self, indice: int, longitud: int, n: int = None) -> "LCG":
+        """
+        Nuevo LCG que arranca indice * longitud pasos después del estado actual.
+        Con la misma longitud, los subflujos 0..N-1 son disjuntos: cada proceso
+        toma el suyo sin generar el prefijo de los demás.
+        """
+        hijo = LCG(self.x, longitud if n is None else n, self.a, self.c, self.m)
+        return hijo.saltar(indice * longitud)
+
+    def subflujos(self, cantidad: int, longitud: int) -> list:
+        return [self.subflujo(i, longitud) for i in range(cantidad)]
+
+    def generar_columnas(self, n: int = None, xi=None, ri=None) -> TablaColumnar:
+        """Tabla de n pasos; con xi y ri ya generados (p. ej. de la caché) solo la arma, sin avanzar."""
+        x0 = self.x
+        if xi is None:
+            xi, ri = self.generar_array(n)
+
+        def formatear_fila(i):
+            x_previo = x0 if i == 0 else int(xi[i - 1])
+            return {
+                "Iteración": i + 1,
+                "Xi": str(x_previo),
+                "(a*Xi + c) mod m": str(int(xi[i])),
+                "Ri": float(ri[i])
+            }
+
+        return TablaColumnar(self.COLUMNAS, xi, ri, formatear_fila)
+
+    def generar_tabla(self):
+        return self.generar_columnas().filas()
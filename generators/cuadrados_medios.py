@@ -1,31 +1,193 @@
 # ------------------ CUADRADOS MEDIOS ------------------
+import time
+
+import numpy as np
+
+from .grafo_funcional import (
+    D_MAX_TABLA, analisis_cuadrados_medios, miembros_ciclo, tabla_sucesores, valores_distintos
+)
+from .nucleo import (
+    MAX_ESTADOS_VISTOS, TAM_BLOQUE, TablaColumnar, array_xi, completar_periodico, digitos_centrales, normalizar,
+    tamanos_bloque
+)
+
+# Mayor d cuyo Xi^2 cabe en uint64 (ruta vectorizada por carriles)
+D_MAX_VECTORIZADO = 9
+
+
+def generar_carriles(semillas, n: int, d: int = 4):
+    """
+    Cuadrados Medios para muchas semillas a la vez (una por carril) en uint64.
+    Solo para d <= 9, donde Xi^2 < 10^18 no desborda. Devuelve matrices
+    (semillas x n) de Xi y Ri.
+    """
+    if d <= 0 or d % 2 or d > D_MAX_VECTORIZADO:
+        raise ValueError(f"La ruta vectorizada requiere d par entre 2 y {D_MAX_VECTORIZADO}")
+    x = np.asarray(semillas, dtype=np.uint64)
+    modulo = np.uint64(10 ** d)
+    if (x >= modulo).any():
+        raise ValueError(f"Las semillas deben tener como máximo {d} dígitos")
+    divisor = np.uint64(10 ** (d // 2))
+    xi = np.empty((len(x), n), dtype=np.uint64)
+    for j in range(n):
+        x = (x * x // divisor) % modulo
+        xi[:, j] = x
+    return xi, xi / float(modulo)
+
+
 class CuadradosMedios:
-    def __init__(self, semilla: int, n: int):
-        if len(str(semilla)) < 4:
-            raise ValueError("La semilla debe tener al menos 4 dígitos")
+    COLUMNAS = ["Iteración", "Xi-1", "Xi^2", "Xi", "Ri"]
+    PARAMETROS = [("semilla", "Semilla X0", 5735), ("d", "Dígitos d", 4)]
+
+    def __init__(self, semilla: int, n: int, d: int = 4):
+        if d <= 0 or d % 2:
+            raise ValueError("La cantidad de dígitos d debe ser un entero par positivo")
+        if len(str(semilla)) < d:
+            raise ValueError(f"La semilla debe tener al menos {d} dígitos")
         self.semilla = semilla
+        self.x = semilla  # Estado actual para la generación por bloques
         self.n = n
-        self.d = 4  # Siempre extraer 4 dígitos centrales
+        self.d = d  # Dígitos centrales a extraer (4 por defecto)
+
+    def _columnas(self, x: int, n: int):
+        """
+        Xi y Ri (float64) de n iteraciones partiendo de x. Con d > 6 la recurrencia
+        de una semilla es secuencial: se itera paso a paso con enteros de Python y
+        se corta al detectar el ciclo. Xi es uint64 hasta 19 dígitos y object por encima.
+        """
+        if self.d <= D_MAX_TABLA:
+            return self._columnas_tabla(x, n)
+
+        d, ancho = self.d, 2 * self.d
+        tope, modulo = 10 ** ancho, 10 ** d
+        divisor = 10 ** (ancho - (ancho - d) // 2 - d)
+        xi = array_xi(n, d)
+        vistos = {}
+
+        for i in range(n):
+            if x in vistos:
+                # Estado repetido: el resto de la secuencia es el mismo ciclo
+                completar_periodico(xi, i, vistos[x])
+                x = int(xi[-1])
+                break
+            if len(vistos) < MAX_ESTADOS_VISTOS:
+                vistos[x] = i
+            x_cuadrado = x * x
+            if x_cuadrado < tope:
+                # Extracción por divmod, sin pasar por texto (sirve igual para enteros grandes)
+                x = divmod(x_cuadrado // divisor, modulo)[1]
+            else:
+                x = digitos_centrales(x_cuadrado, d, ancho)
+            xi[i] = x
+
+        return xi, normalizar(xi, modulo), x
+
+    def _columnas_tabla(self, x: int, n: int):
+        """Igual que _columnas, pero recorriendo la tabla de sucesores precalculada."""
+        d = self.d
+        modulo = 10 ** d
+        xi = np.empty(n, dtype=np.uint64)
+        i = 0
+        if n > 0 and x >= modulo:
+            # Semilla con más de d dígitos: el primer paso se calcula directo
+            x = digitos_centrales(x * x, d, 2 * d)
+            xi[0] = x
+            i = 1
+
+        sucesor = tabla_sucesores(d)
+        analisis = analisis_cuadrados_medios(d)
+        longitud_ciclo = int(analisis["longitud_ciclo"][x])
+        m = min(n - i, valores_distintos(int(analisis["cola"][x]), longitud_ciclo))
+        for j in range(i, i + m):
+            x = int(sucesor[x])
+            xi[j] = x
+        if i + m < n:
+            # Después de los valores distintos solo se repite el ciclo terminal
+            completar_periodico(xi, i + m, i + m - longitud_ciclo)
+            x = int(xi[-1])
+
+        ri = xi.astype(np.float64) / modulo
+        return xi, ri, x
+
+    def diagnostico(self) -> dict:
+        """Cola, ciclo terminal y cantidad de Xi distintos que produce la semilla (d <= 6)."""
+        d = self.d
+        if d > D_MAX_TABLA:
+            raise ValueError(f"El diagnóstico por tabla solo está disponible para d <= {D_MAX_TABLA}")
+        x, cola_extra = self.semilla, 0
+        if x >= 10 ** d:
+            x, cola_extra = digitos_centrales(x * x, d, 2 * d), 1
+        analisis = analisis_cuadrados_medios(d)
+        cola = int(analisis["cola"][x]) + cola_extra
+        ciclo = miembros_ciclo(tabla_sucesores(d), int(analisis["ciclo"][x]))
+        return {
+            "cola": cola,
+            "longitud_ciclo": len(ciclo),
+            "ciclo": ciclo,
+            "distintos": valores_distintos(cola, len(ciclo))
+        }
+
+    def generar_array(self, n: int = None):
+        """Modo columnar: devuelve (Xi, Ri) como arrays NumPy y avanza el estado."""
+        xi, ri, self.x = self._columnas(self.x, self.n if n is None else n)
+        return xi, ri
+
+    def obtener_estado(self) -> dict:
+        return {"x": self.x}
+
+    def restaurar_estado(self, estado: dict):
+        self.x = int(estado["x"])
+
+    def iterar_bloques(self, tam_bloque: int = TAM_BLOQUE, total: int = None):
+        """
+        Genera Ri en bloques NumPy de tam_bloque valores, con memoria constante.
+        Continúa desde el estado guardado (obtener_estado/restaurar_estado), por lo
+        que una corrida larga puede retomarse donde quedó. total=None no termina.
+        """
+        for m in tamanos_bloque(tam_bloque, total):
+            _, ri, self.x = self._columnas(self.x, m)
+            yield ri
+
+    def generar_columnas(self, n: int = None, xi=None, ri=None) -> TablaColumnar:
+        """Tabla de n iteraciones; con xi y ri ya generados (p. ej. de la caché) solo la arma, sin avanzar."""
+        x0, d = self.x, self.d
+        if xi is None:
+            xi, ri = self.generar_array(n)
+
+        def formatear_fila(i):
+            x_previo = x0 if i == 0 else int(xi[i - 1])
+            return {
+                "Iteración": i + 1,
+                "Xi-1": str(x_previo).zfill(d),
+                "Xi^2": str(x_previo ** 2).zfill(2 * d),
+                "Xi": str(int(xi[i])).zfill(d),
+                "Ri": float(ri[i])
+            }
+
+        return TablaColumnar(self.COLUMNAS, xi, ri, formatear_fila)
 
     def generar_tabla(self):
-        resultados = []
-        x = self.semilla
-
-        for i in range(1, self.n + 1):
-            x_cuadrado = x ** 2
-            x_cuadrado_str = str(x_cuadrado).zfill(8)  # Siempre 8 dígitos
-            inicio = (len(x_cuadrado_str) - self.d) // 2
-            x_centro = int(x_cuadrado_str[inicio:inicio + self.d])
-            r = x_centro / 10000
-
-            resultados.append({
-                "Iteración": i,
-                "Xi-1": str(x).zfill(self.d),
-                "Xi^2": str(x_cuadrado).zfill(8),
-                "Xi": str(x_centro).zfill(self.d),
-                "Ri": r
-            })
-
-            x = x_centro
-
-        return resultados
+        return self.generar_columnas().filas()
+
+
+def medir_rendimiento(ds=(4, 8, 16, 32, 64), n: int = 100000):
+    """
+    Throughput de generar_array para cada d (valores por segundo).
+    La semilla de cada d son los primeros d dígitos de pi; "distintos" indica
+    cuántos Xi se generaron antes de que la secuencia entrara en un ciclo.
+    """
+    digitos_pi = "31415926535897932384626433832795028841971693993751058209749445923078164062862089986280348253421170679"
+    resultados = []
+    for d in ds:
+        generador = CuadradosMedios(int(digitos_pi[:d]), n, d=d)
+        inicio = time.perf_counter()
+        xi, _ = generador.generar_array()
+        segundos = time.perf_counter() - inicio
+        resultados.append({
+            "d": d,
+            "n": n,
+            "segundos": segundos,
+            "valores_por_segundo": n / segundos if segundos > 0 else float("inf"),
+            "distintos": len(set(xi.tolist()))
+        })
+    return resultados
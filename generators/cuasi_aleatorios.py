@@ -0,0 +1,120 @@
+# ------------------ SECUENCIAS CUASIALEATORIAS (HALTON / SOBOL) ------------------
+# Secuencias de baja discrepancia: cubren [0, 1)^d de forma más pareja que una
+# secuencia pseudoaleatoria, por lo que una integral Monte Carlo converge con
+# menos muestras. Se apoyan en scipy.stats.qmc; la aleatorización (Owen / LMS +
+# desplazamiento) conserva la baja discrepancia y permite estimar el error.
+#
+# Como fuente de Ri, los puntos se entregan aplanados fila a fila:
+# (u_0^1, ..., u_0^d, u_1^1, ...), así que d valores consecutivos forman un punto.
+# Sin aleatorizar, el primer punto es el origen (Ri = 0) y se conserva: omitirlo
+# rompe el equilibrio de Sobol en bloques de 2^m puntos desde el inicio.
+import warnings
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from .nucleo import TAM_BLOQUE, TablaColumnar, tamanos_bloque
+
+
+class _SecuenciaCuasiAleatoria(ABC):
+    COLUMNAS = ["Iteración", "Punto", "Coordenada", "Ri"]
+    PARAMETROS = [("dimensiones", "Dimensiones d", 1), ("aleatorizar", "Aleatorizar (0/1)", 1),
+                  ("semilla", "Semilla de aleatorización", 12345)]
+
+    def __init__(self, n: int, dimensiones: int = 1, aleatorizar: int = 1, semilla: int = 12345):
+        if dimensiones <= 0:
+            raise ValueError("La cantidad de dimensiones debe ser positiva")
+        self.n = n
+        self.dimensiones = dimensiones
+        self.aleatorizar = bool(aleatorizar)
+        self.semilla = semilla
+        self.posicion = 0  # Cantidad de valores (coordenadas) ya entregados
+        self._motor = self._crear_motor()
+
+    def _adelantar(self, puntos: int):
+        if puntos > 0:  # Sobol.fast_forward no admite 0
+            self._motor.fast_forward(puntos)
+
+    @abstractmethod
+    def _crear_motor(self):
+        """Motor de scipy.stats.qmc (Halton, Sobol, ...) con la configuración de la instancia."""
+
+    def _puntos_desde(self, indice: int, cantidad: int):
+        """Puntos indice..indice+cantidad-1 de la secuencia, como matriz (cantidad x d)."""
+        if self._motor.num_generated != indice:
+            self._motor.reset()
+            self._adelantar(indice)
+        with warnings.catch_warnings():
+            # Sobol avisa si cantidad no es potencia de 2; en bloques sucesivos no aplica
+            warnings.simplefilter("ignore", UserWarning)
+            return self._motor.random(cantidad)
+
+    def generar_puntos(self, n: int = None):
+        """Bloque vectorizado de n puntos (n x d) que continúa desde el último punto completo."""
+        n = self.n if n is None else n
+        d = self.dimensiones
+        indice = -(-self.posicion // d)
+        puntos = self._puntos_desde(indice, n)
+        self.posicion = (indice + n) * d
+        return puntos
+
+    def _columnas(self, n: int):
+        d, p = self.dimensiones, self.posicion
+        primero = p // d
+        ultimo = -(-(p + n) // d)
+        puntos = self._puntos_desde(primero, ultimo - primero)
+        desfase = p - primero * d
+        ri = puntos.ravel()[desfase:desfase + n].copy()
+        xi = np.arange(p, p + n, dtype=np.uint64)
+        self.posicion += n
+        return xi, ri
+
+    def generar_array(self, n: int = None):
+        """Modo columnar: devuelve (posición uint64, Ri float64) y avanza la secuencia."""
+        return self._columnas(self.n if n is None else n)
+
+    def saltar(self, pasos: int):
+        self.posicion += pasos
+        return self
+
+    def obtener_estado(self) -> dict:
+        return {"posicion": self.posicion}
+
+    def restaurar_estado(self, estado: dict):
+        self.posicion = int(estado["posicion"])
+
+    def iterar_bloques(self, tam_bloque: int = TAM_BLOQUE, total: int = None):
+        """Genera Ri en bloques NumPy de tam_bloque valores, continuando desde el estado actual."""
+        for m in tamanos_bloque(tam_bloque, total):
+            yield self._columnas(m)[1]
+
+    def generar_columnas(self, n: int = None, xi=None, ri=None) -> TablaColumnar:
+        """Tabla de n valores; con xi y ri ya generados (p. ej. de la caché) solo la arma, sin avanzar."""
+        if xi is None:
+            xi, ri = self.generar_array(n)
+        d = self.dimensiones
+        return TablaColumnar(self.COLUMNAS, xi, ri, lambda i: {
+            "Iteración": i + 1,
+            "Punto": int(xi[i]) // d,
+            "Coordenada": int(xi[i]) % d + 1,
+            "Ri": float(ri[i])
+        })
+
+    def generar_tabla(self):
+        return self.generar_columnas().filas()
+
+
+class Halton(_SecuenciaCuasiAleatoria):
+    """Secuencia de Halton: inversa radical en la base del j-ésimo primo para la coordenada j."""
+
+    def _crear_motor(self):
+        from scipy.stats import qmc  # Import diferido: scipy.stats tarda en cargar
+        return qmc.Halton(self.dimensiones, scramble=self.aleatorizar, seed=self.semilla)
+
+
+class Sobol(_SecuenciaCuasiAleatoria):
+    """Secuencia de Sobol (números de dirección de Joe y Kuo); equilibrada en bloques de 2^k puntos."""
+
+    def _crear_motor(self):
+        from scipy.stats import qmc
+        return qmc.Sobol(self.dimensiones, scramble=self.aleatorizar, seed=self.semilla)
@@ -0,0 +1,121 @@
+# ------------------ GRAFO FUNCIONAL DE CUADRADOS MEDIOS ------------------
+# Con d dígitos el método tiene solo 10^d estados, así que la función
+# x -> dígitos centrales de x^2 se puede tabular completa y analizar como grafo
+# funcional: cada semilla recorre una "cola" y termina en un ciclo.
+from functools import lru_cache
+
+import numpy as np
+
+# Mayor d para el que se tabula el grafo (10^d estados en memoria)
+D_MAX_TABLA = 6
+
+
+@lru_cache(maxsize=None)
+def tabla_sucesores(d: int = 4) -> np.ndarray:
+    """sucesor[x] = dígitos centrales de x^2 (completado a 2d dígitos) para x en [0, 10^d)."""
+    if d <= 0 or d > D_MAX_TABLA:
+        raise ValueError(f"Solo se tabulan sucesores para 1 <= d <= {D_MAX_TABLA}")
+    ancho = 2 * d
+    x = np.arange(10 ** d, dtype=np.int64)
+    sucesor = (x * x // 10 ** (ancho - (ancho - d) // 2 - d)) % 10 ** d
+    sucesor.flags.writeable = False
+    return sucesor
+
+
+def analizar_grafo(sucesor: np.ndarray) -> dict:
+    """
+    Analiza el grafo funcional x -> sucesor[x] en una pasada vectorizada.
+    Para cada estado devuelve:
+    - cola: pasos hasta entrar al ciclo (0 si ya está en él)
+    - longitud_ciclo: longitud del ciclo terminal
+    - ciclo: representante del ciclo terminal (su menor estado)
+    - en_ciclo: si el estado pertenece a un ciclo
+    """
+    sucesor = np.asarray(sucesor, dtype=np.int64)
+    n = len(sucesor)
+
+    # sucesor^(2^b) con 2^b >= n deja a todos los estados dentro de su ciclo
+    salto = sucesor
+    for _ in range(max(1, n.bit_length())):
+        salto = salto[salto]
+    en_ciclo = np.zeros(n, dtype=bool)
+    en_ciclo[salto] = True
+
+    # Longitud y menor elemento de cada ciclo, recorriendo todos los ciclos a la vez
+    nodos = np.flatnonzero(en_ciclo)
+    actual = sucesor[nodos]
+    longitud = np.ones(len(nodos), dtype=np.int64)
+    minimo = np.minimum(nodos, actual)
+    activo = actual != nodos
+    while activo.any():
+        idx = np.flatnonzero(activo)
+        actual[idx] = sucesor[actual[idx]]
+        longitud[idx] += 1
+        minimo[idx] = np.minimum(minimo[idx], actual[idx])
+        activo[idx] = actual[idx] != nodos[idx]
+
+    longitud_nodo = np.zeros(n, dtype=np.int64)
+    longitud_nodo[nodos] = longitud
+    representante = np.full(n, -1, dtype=np.int64)
+    representante[nodos] = minimo
+
+    # Colas por niveles: desde los ciclos hacia atrás (BFS inverso)
+    cola = np.where(en_ciclo, 0, -1)
+    frontera = en_ciclo
+    nivel = 0
+    while True:
+        nuevos = (cola < 0) & frontera[sucesor]
+        if not nuevos.any():
+            break
+        nivel += 1
+        cola[nuevos] = nivel
+        frontera = nuevos
+
+    return {
+        "cola": cola,
+        "longitud_ciclo": longitud_nodo[salto],
+        "ciclo": representante[salto],
+        "en_ciclo": en_ciclo
+    }
+
+
+@lru_cache(maxsize=None)
+def analisis_cuadrados_medios(d: int = 4) -> dict:
+    """Análisis del grafo de Cuadrados Medios con d dígitos (se calcula una sola vez por d)."""
+    analisis = analizar_grafo(tabla_sucesores(d))
+    for arr in analisis.values():
+        arr.flags.writeable = False
+    return analisis
+
+
+def valores_distintos(cola: int, longitud_ciclo: int) -> int:
+    """Cantidad de Xi distintos que produce una semilla antes de repetirse."""
+    return longitud_ciclo + max(cola - 1, 0)
+
+
+def miembros_ciclo(sucesor: np.ndarray, representante: int) -> list:
+    """Estados del ciclo que contiene a representante, en orden de recorrido."""
+    miembros = [int(representante)]
+    x = int(sucesor[representante])
+    while x != miembros[0]:
+        miembros.append(x)
+        x = int(sucesor[x])
+    return miembros
+
+
+def resumen_ciclos(d: int = 4) -> list:
+    """Ciclos terminales de Cuadrados Medios con su cuenca (semillas que caen en cada uno)."""
+    sucesor = tabla_sucesores(d)
+    analisis = analisis_cuadrados_medios(d)
+    representantes, cuenca = np.unique(analisis["ciclo"], return_counts=True)
+    resumen = []
+    for rep, tam in zip(representantes, cuenca):
+        miembros = miembros_ciclo(sucesor, rep)
+        resumen.append({
+            "ciclo": miembros,
+            "longitud": len(miembros),
+            "cuenca": int(tam),
+            "cola_maxima": int(analisis["cola"][analisis["ciclo"] == rep].max())
+        })
+    resumen.sort(key=lambda c: c["cuenca"], reverse=True)
+    return resumen
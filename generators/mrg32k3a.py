@@ -0,0 +1,232 @@
+# ------------------ MRG32k3a ------------------
+# Generador recursivo múltiple combinado de L'Ecuyer (periodo ~2^191).
+# Cada componente es lineal: el estado tras j pasos es A^j * s (mod m), así que
+#  - un bloque de salidas se calcula vectorizado con las filas de A^j, y
+#  - los saltos de flujo (2^127) y subflujo (2^76) son matrices precalculadas.
+# Cada proceso de un pool toma el flujo de su índice a partir de una semilla maestra.
+from functools import lru_cache
+
+import numpy as np
+
+from .nucleo import TAM_BLOQUE, TablaColumnar, tamanos_bloque
+from .splitmix64 import MASCARA_64, splitmix64
+
+M1 = 4294967087
+M2 = 4294944443
+NORMA = 1.0 / (M1 + 1)
+
+# Matrices de transición sobre el estado (x_{n-3}, x_{n-2}, x_{n-1})
+A1 = ((0, 1, 0), (0, 0, 1), (M1 - 810728, 1403580, 0))
+A2 = ((0, 1, 0), (0, 0, 1), (M2 - 1370589, 0, 527612))
+
+SALTO_SUBFLUJO = 76
+SALTO_FLUJO = 127
+
+
+def _mult_matrices(a, b, m):
+    return tuple(tuple(sum(a[i][k] * b[k][j] for k in range(3)) % m for j in range(3)) for i in range(3))
+
+
+def _mult_vector(a, v, m):
+    return tuple(sum(a[i][k] * v[k] for k in range(3)) % m for i in range(3))
+
+
+def _potencia_matriz(a, m, exponente):
+    resultado = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+    while exponente:
+        if exponente & 1:
+            resultado = _mult_matrices(a, resultado, m)
+        a = _mult_matrices(a, a, m)
+        exponente >>= 1
+    return resultado
+
+
+@lru_cache(maxsize=None)
+def matrices_salto(log2_pasos: int):
+    """(A1^(2^e) mod m1, A2^(2^e) mod m2), calculadas por cuadrados sucesivos."""
+    a1, a2 = A1, A2
+    for _ in range(log2_pasos):
+        a1, a2 = _mult_matrices(a1, a1, M1), _mult_matrices(a2, a2, M2)
+    return a1, a2
+
+
+def _filas_np(filas, a, m, largo):
+    """Completa filas[j] = e3^T A^(j+1) (mod m) para j < largo, por duplicación."""
+    filas[0] = a[2]
+    k = 1
+    while k < largo:
+        cuantos = min(k, largo - k)
+        ak = np.array(_potencia_matriz(a, m, k), dtype=np.uint64)
+        m64 = np.uint64(m)
+        bloque = filas[:cuantos]
+        # Cada producto < 2^64; se reduce término a término para no desbordar la suma
+        filas[k:k + cuantos] = (
+            (bloque[:, 0:1] * ak[0] % m64) + (bloque[:, 1:2] * ak[1] % m64) + (bloque[:, 2:3] * ak[2] % m64)
+        ) % m64
+        k += cuantos
+
+
+@lru_cache(maxsize=8)
+def _filas_bloque(largo: int):
+    """Últimas filas de A1^j y A2^j para j = 1..largo: x_{n+j} = fila_j · estado."""
+    filas1 = np.empty((largo, 3), dtype=np.uint64)
+    filas2 = np.empty((largo, 3), dtype=np.uint64)
+    _filas_np(filas1, A1, M1, largo)
+    _filas_np(filas2, A2, M2, largo)
+    filas1.flags.writeable = False
+    filas2.flags.writeable = False
+    return filas1, filas2
+
+
+def _aplicar_filas(filas, estado, m):
+    m64 = np.uint64(m)
+    s = np.array(estado, dtype=np.uint64)
+    return ((filas[:, 0] * s[0] % m64) + (filas[:, 1] * s[1] % m64) + (filas[:, 2] * s[2] % m64)) % m64
+
+
+def estado_desde_semilla(semilla: int):
+    """Estado inicial válido (componentes no nulas y menores que su módulo) a partir de un entero."""
+    valores = [int(v) for v in splitmix64(semilla & MASCARA_64, 6)]
+    s1 = tuple(v % M1 for v in valores[:3])
+    s2 = tuple(v % M2 for v in valores[3:])
+    if not any(s1):
+        s1 = (12345, 12345, 12345)
+    if not any(s2):
+        s2 = (12345, 12345, 12345)
+    return s1, s2
+
+
+class MRG32k3a:
+    COLUMNAS = ["Iteración", "x1", "x2", "Ri"]
+    PARAMETROS = [("semilla", "Semilla maestra", 12345), ("flujo", "Flujo", 0), ("subflujo", "Subflujo", 0)]
+
+    def __init__(self, semilla, n: int, flujo: int = 0, subflujo: int = 0):
+        """
+        semilla puede ser un entero (se expande con SplitMix64) o los 6 valores
+        (x1 x3, x2 x3) de la semilla clásica de L'Ecuyer.
+        """
+        if isinstance(semilla, (int, np.integer)):
+            self.s1, self.s2 = estado_desde_semilla(int(semilla))
+        else:
+            valores = tuple(int(v) for v in semilla)
+            if len(valores) != 6:
+                raise ValueError("La semilla de MRG32k3a debe ser un entero o 6 valores")
+            self.s1, self.s2 = valores[:3], valores[3:]
+            if any(v >= M1 for v in self.s1) or any(v >= M2 for v in self.s2) or not any(self.s1) or not any(self.s2):
+                raise ValueError("Semilla inválida: cada componente debe ser < m y no todas nulas")
+        self.n = n
+        # saltar_* recuerdan el inicio del subflujo actual, para poder pasar al siguiente
+        self.saltar_flujos(flujo)
+        self.saltar_subflujos(subflujo)
+
+    # ---------------- Saltos ----------------
+    def _saltar(self, log2_pasos: int, veces: int):
+        if veces < 0:
+            raise ValueError("La cantidad de saltos no puede ser negativa")
+        if veces == 0:
+            return
+        b1, b2 = matrices_salto(log2_pasos)
+        self.s1 = _mult_vector(_potencia_matriz(b1, M1, veces), self.s1, M1)
+        self.s2 = _mult_vector(_potencia_matriz(b2, M2, veces), self.s2, M2)
+
+    def saltar_flujos(self, veces: int = 1):
+        """Avanza veces * 2^127 pasos."""
+        self._saltar(SALTO_FLUJO, veces)
+        self._inicio_subflujo = (self.s1, self.s2)
+        return self
+
+    def saltar_subflujos(self, veces: int = 1):
+        """Avanza veces * 2^76 pasos."""
+        self._saltar(SALTO_SUBFLUJO, veces)
+        self._inicio_subflujo = (self.s1, self.s2)
+        return self
+
+    def siguiente_subflujo(self):
+        """Va al inicio del subflujo siguiente al actual (como RngStream_ResetNextSubstream)."""
+        self.s1, self.s2 = self._inicio_subflujo
+        return self.saltar_subflujos(1)
+
+    def flujo(self, indice: int, n: int = None) -> "MRG32k3a":
+        """
+        Generador que arranca indice flujos (indice * 2^127 pasos) después del
+        inicio del subflujo actual. Con la misma semilla maestra, el proceso i
+        obtiene siempre el mismo flujo y ninguno se solapa con otro.
+        """
+        s1, s2 = self._inicio_subflujo
+        hijo = MRG32k3a(s1 + s2, self.n if n is None else n)
+        return hijo.saltar_flujos(indice)
+
+    def flujos(self, cantidad: int, n: int = None) -> list:
+        return [self.flujo(i, n) for i in range(cantidad)]
+
+    # ---------------- Generación ----------------
+    def _componentes(self, n: int):
+        x1 = np.empty(n, dtype=np.uint64)
+        x2 = np.empty(n, dtype=np.uint64)
+        largo = min(n, TAM_BLOQUE)
+        if largo:
+            filas1, filas2 = _filas_bloque(largo)
+        for inicio in range(0, n, largo or 1):
+            cuantos = min(largo, n - inicio)
+            x1[inicio:inicio + cuantos] = _aplicar_filas(filas1[:cuantos], self.s1, M1)
+            x2[inicio:inicio + cuantos] = _aplicar_filas(filas2[:cuantos], self.s2, M2)
+            self.s1 = self._avanzar(self.s1, x1[inicio:inicio + cuantos])
+            self.s2 = self._avanzar(self.s2, x2[inicio:inicio + cuantos])
+        return x1, x2
+
+    @staticmethod
+    def _avanzar(estado, salidas):
+        # El nuevo estado son las tres últimas salidas (o el anterior desplazado si hubo menos de 3)
+        return tuple((list(estado) + [int(v) for v in salidas[-3:]])[-3:])
+
+    @staticmethod
+    def _combinar(x1, x2):
+        z = (x1.astype(np.int64) - x2.astype(np.int64)) % M1
+        ri = np.where(z > 0, z, M1) * NORMA
+        return z.astype(np.uint64), ri
+
+    def generar_array(self, n: int = None):
+        """Modo columnar: devuelve (z uint64, Ri float64 en (0, 1)) y avanza el estado."""
+        return self._combinar(*self._componentes(self.n if n is None else n))
+
+    def obtener_estado(self) -> dict:
+        return {"s1": list(self.s1), "s2": list(self.s2),
+                "inicio_subflujo": [list(self._inicio_subflujo[0]), list(self._inicio_subflujo[1])]}
+
+    def restaurar_estado(self, estado: dict):
+        self.s1 = tuple(int(v) for v in estado["s1"])
+        self.s2 = tuple(int(v) for v in estado["s2"])
+        inicio = estado.get("inicio_subflujo")
+        self._inicio_subflujo = (tuple(inicio[0]), tuple(inicio[1])) if inicio else (self.s1, self.s2)
+
+    def iterar_bloques(self, tam_bloque: int = TAM_BLOQUE, total: int = None):
+        """Genera Ri en bloques NumPy de tam_bloque valores, continuando desde el estado actual."""
+        for m in tamanos_bloque(tam_bloque, total):
+            yield self.generar_array(m)[1]
+
+    def generar_columnas(self, n: int = None, xi=None, ri=None) -> TablaColumnar:
+        """
+        Tabla de n salidas. Con xi y ri ya generados (p. ej. de la caché) solo la
+        arma, sin avanzar: x1 y x2 de cada fila se obtienen saltando desde el estado actual.
+        """
+        if xi is None:
+            x1, x2 = self._componentes(self.n if n is None else n)
+            xi, ri = self._combinar(x1, x2)
+
+            def componentes(i):
+                return int(x1[i]), int(x2[i])
+        else:
+            s1, s2 = self.s1, self.s2
+
+            def componentes(i):
+                return (_mult_vector(_potencia_matriz(A1, M1, i + 1), s1, M1)[2],
+                        _mult_vector(_potencia_matriz(A2, M2, i + 1), s2, M2)[2])
+
+        def formatear_fila(i):
+            c1, c2 = componentes(i)
+            return {"Iteración": i + 1, "x1": str(c1), "x2": str(c2), "Ri": float(ri[i])}
+
+        return TablaColumnar(self.COLUMNAS, xi, ri, formatear_fila)
+
+    def generar_tabla(self):
+        return self.generar_columnas().filas()
@@ -1,34 +1,86 @@
+from .nucleo import (
+    MAX_ESTADOS_VISTOS, TAM_BLOQUE, TablaColumnar, array_xi, completar_periodico, digitos_centrales, normalizar,
+    tamanos_bloque
+)
+
+
 class MultiplicadorConstante:
+    COLUMNAS = ["Iteración", "Xi", "k*Xi", "Dígitos del centro", "Ri"]
+    PARAMETROS = [("semilla", "Semilla X0", 9803), ("k", "Constante k", 6965)]
+
     def __init__(self, semilla: int, k: int, n: int):
         self.x = semilla
         self.k = k
         self.n = n
         self.d = max(len(str(semilla)), 4)  # Número de dígitos a usar
 
-    def generar_tabla(self):
-        resultados = []
+    def _columnas(self, x: int, n: int):
+        """Xi (uint64, u object si d > 19) y Ri (float64) de n iteraciones partiendo de x."""
+        d, ancho, k = self.d, 2 * self.d, self.k
+        tope, modulo = 10 ** ancho, 10 ** d
+        divisor = 10 ** (ancho - (ancho - d) // 2 - d)
+        xi = array_xi(n, d)
+        vistos = {}
+
+        for i in range(n):
+            if x in vistos:
+                # Estado repetido: el resto de la secuencia es el mismo ciclo
+                completar_periodico(xi, i, vistos[x])
+                x = int(xi[-1])
+                break
+            if len(vistos) < MAX_ESTADOS_VISTOS:
+                vistos[x] = i
+            multiplicacion = x * k  # Xi * k
+            # Extraer dígitos centrales de k*Xi completado a 2d dígitos
+            if multiplicacion < tope:
+                x = (multiplicacion // divisor) % modulo
+            else:
+                x = digitos_centrales(multiplicacion, d, ancho)
+            xi[i] = x
 
-        for i in range(1, self.n + 1):
-            multiplicacion = self.x * self.k  # Xi * k
-            mult_str = str(multiplicacion).zfill(2 * self.d)  # Completar con ceros para extraer dígitos centrales
+        # Ri normalizado
+        ri = normalizar(xi, modulo)
+        return xi, ri, x
 
-            # Extraer dígitos centrales
-            inicio = (len(mult_str) - self.d) // 2
-            x_centro = int(mult_str[inicio:inicio + self.d])
+    def generar_array(self, n: int = None):
+        """Modo columnar: devuelve (Xi, Ri) como arrays NumPy y avanza el estado."""
+        xi, ri, self.x = self._columnas(self.x, self.n if n is None else n)
+        return xi, ri
 
-            # Ri normalizado
-            r = x_centro / (10 ** self.d)
+    def obtener_estado(self) -> dict:
+        return {"x": self.x, "k": self.k}
 
-            # Guardar resultados
-            resultados.append({
-                "Iteración": i,
-                "Xi": str(self.x).zfill(self.d),
-                "k*Xi": str(multiplicacion).zfill(2 * self.d),  # Se ve en la tabla
-                "Dígitos del centro": str(x_centro).zfill(self.d),
-                "Ri": r
-            })
+    def restaurar_estado(self, estado: dict):
+        self.x = int(estado["x"])
+        self.k = int(estado.get("k", self.k))
 
-            # Preparar siguiente Xi
-            self.x = x_centro
+    def iterar_bloques(self, tam_bloque: int = TAM_BLOQUE, total: int = None):
+        """
+        Genera Ri en bloques NumPy de tam_bloque valores, con memoria constante.
+        Continúa desde el estado guardado (obtener_estado/restaurar_estado), por lo
+        que una corrida larga puede retomarse donde quedó. total=None no termina.
+        """
+        for m in tamanos_bloque(tam_bloque, total):
+            _, ri, self.x = self._columnas(self.x, m)
+            yield ri
 
-        return resultados
+    def generar_columnas(self, n: int = None, xi=None, ri=None) -> TablaColumnar:
+        """Tabla de n iteraciones; con xi y ri ya generados (p. ej. de la caché) solo la arma, sin avanzar."""
+        x0, k, d = self.x, self.k, self.d
+        if xi is None:
+            xi, ri = self.generar_array(n)
+
+        def formatear_fila(i):
+            x_previo = x0 if i == 0 else int(xi[i - 1])
+            return {
+                "Iteración": i + 1,
+                "Xi": str(x_previo).zfill(d),
+                "k*Xi": str(x_previo * k).zfill(2 * d),  # Se ve en la tabla
+                "Dígitos del centro": str(int(xi[i])).zfill(d),
+                "Ri": float(ri[i])
+            }
+
+        return TablaColumnar(self.COLUMNAS, xi, ri, formatear_fila)
+
+    def generar_tabla(self):
+        return self.generar_columnas().filas()
@@ -0,0 +1,163 @@
+# ------------------ NÚCLEO COMÚN DE LOS GENERADORES DE DÍGITOS CENTRALES ------------------
+# Aritmética entera para extraer dígitos centrales y vista perezosa de la tabla
+# de resultados. Los generadores producen columnas NumPy (Xi, Ri) y las filas de
+# texto solo se arman para las filas que realmente se muestran.
+from bisect import bisect_right
+
+import numpy as np
+
+# Límite de estados recordados al buscar ciclos (evita diccionarios gigantes
+# cuando el espacio de estados es enorme, p. ej. pares (x, y) de Productos Medios)
+MAX_ESTADOS_VISTOS = 1 << 20
+
+# Tamaño por defecto de los bloques en la generación por streaming
+TAM_BLOQUE = 1 << 16
+
+# Mayor cantidad de dígitos d cuyo Xi cabe en uint64
+D_MAX_UINT64 = 19
+
+
+def contar_digitos(valor: int) -> int:
+    """Cantidad de dígitos decimales de un entero no negativo, sin pasar por texto."""
+    digitos = 1
+    while valor >= 10 ** digitos:
+        digitos += 1
+    return digitos
+
+
+def digitos_centrales(valor: int, d: int, ancho: int) -> int:
+    """
+    Extrae los d dígitos centrales de valor, completado con ceros a la izquierda
+    hasta ancho dígitos. Equivale a str(valor).zfill(ancho)[inicio:inicio + d]
+    pero usando solo división entera y módulo.
+    """
+    largo = max(contar_digitos(valor), ancho)
+    inicio = (largo - d) // 2
+    return (valor // 10 ** (largo - inicio - d)) % 10 ** d
+
+
+def array_xi(n: int, d: int):
+    """Array vacío para n valores Xi de d dígitos: uint64 si caben, enteros de Python (object) si no."""
+    return np.empty(n, dtype=np.uint64 if d <= D_MAX_UINT64 else object)
+
+
+def normalizar(xi, modulo: int):
+    """Ri = Xi / modulo en float64, también cuando Xi guarda enteros de Python."""
+    if xi.dtype == object:
+        return np.fromiter((v / modulo for v in xi), dtype=np.float64, count=len(xi))
+    return xi.astype(np.float64) / modulo
+
+
+def completar_periodico(xi, hasta: int, inicio_ciclo: int):
+    """Rellena xi[hasta:] repitiendo el ciclo xi[inicio_ciclo:hasta] (in-place)."""
+    n = len(xi)
+    pos = hasta
+    while pos < n:
+        # Se duplica el bloque ya periódico en cada copia: O(log n) copias
+        m = min(pos - inicio_ciclo, n - pos)
+        xi[pos:pos + m] = xi[inicio_ciclo:inicio_ciclo + m]
+        pos += m
+    return xi
+
+
+def tamanos_bloque(tam_bloque: int, total: int = None):
+    """Tamaños de los bloques sucesivos hasta cubrir total (infinitos si total es None)."""
+    if tam_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser positivo")
+    restantes = total
+    while restantes is None or restantes > 0:
+        m = tam_bloque if restantes is None else min(tam_bloque, restantes)
+        if restantes is not None:
+            restantes -= m
+        yield m
+
+
+class TablaColumnar:
+    """
+    Resultado de una corrida en formato columnar.
+    xi (uint64) y ri (float64) son arrays contiguos; las filas en texto
+    (los mismos diccionarios que generar_tabla) se construyen bajo demanda.
+    """
+
+    def __init__(self, columnas, xi, ri, formatear_fila):
+        self.columnas = list(columnas)
+        self.xi = xi
+        self.ri = ri
+        self._formatear_fila = formatear_fila
+
+    def __len__(self):
+        return len(self.ri)
+
+    def fila(self, i: int) -> dict:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Fila fuera de rango")
+        return self._formatear_fila(i)
+
+    def filas(self, inicio: int = 0, fin: int = None) -> list:
+        fin = len(self) if fin is None else min(fin, len(self))
+        return [self._formatear_fila(i) for i in range(inicio, fin)]
+
+    def recortar(self, fin: int) -> "TablaColumnar":
+        """Las primeras fin filas (vistas de xi y ri); sirve para entregar resultados parciales."""
+        return TablaColumnar(self.columnas, self.xi[:fin], self.ri[:fin], self._formatear_fila)
+
+
+class TablaPorBloques:
+    """
+    TablaColumnar de una generación por partes: reúne las tablas de bloques
+    consecutivos (generar_columnas(m) llamado varias veces) sin copiarlas. Puede
+    leerse mientras crece; la numeración de "Iteración" continúa entre bloques.
+    """
+
+    def __init__(self, columnas):
+        self.columnas = list(columnas)
+        self._bloques = []
+        self._inicios = []
+        self._total = 0
+        self._arrays = None
+
+    def agregar(self, tabla):
+        self._bloques.append(tabla)
+        self._inicios.append(self._total)
+        self._arrays = None
+        self._total += len(tabla)  # Al final: una fila cuenta solo cuando su bloque ya está
+
+    def __len__(self):
+        return self._total
+
+    def fila(self, i: int) -> dict:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Fila fuera de rango")
+        b = bisect_right(self._inicios, i) - 1
+        fila = self._bloques[b].fila(i - self._inicios[b])
+        if "Iteración" in fila:
+            fila["Iteración"] = i + 1
+        return fila
+
+    def filas(self, inicio: int = 0, fin: int = None) -> list:
+        fin = len(self) if fin is None else min(fin, len(self))
+        return [self.fila(i) for i in range(inicio, fin)]
+
+    def _concatenar(self):
+        if self._arrays is None:
+            bloques = self._bloques
+            if not bloques:
+                self._arrays = np.empty(0, dtype=np.uint64), np.empty(0)
+            else:
+                self._arrays = np.concatenate([b.xi for b in bloques]), np.concatenate([b.ri for b in bloques])
+        return self._arrays
+
+    @property
+    def xi(self):
+        return self._concatenar()[0]
+
+    @property
+    def ri(self):
+        return self._concatenar()[1]
+
+    def recortar(self, fin: int) -> TablaColumnar:
+        return TablaColumnar(self.columnas, self.xi[:fin], self.ri[:fin], self.fila)
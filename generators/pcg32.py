@@ -0,0 +1,124 @@
+# ------------------ PCG32 ------------------
+# PCG-XSH-RR de 64 bits de estado y 32 de salida (O'Neill). El estado avanza
+# como un LCG módulo 2^64, así que j pasos son X -> A_j*X + C_j y un bloque
+# entero de estados se obtiene vectorizado; la permutación de salida también.
+from functools import lru_cache
+
+import numpy as np
+
+from .congruencial_lineal import potencia_afin
+from .nucleo import TAM_BLOQUE, TablaColumnar, tamanos_bloque
+
+MULTIPLICADOR = 6364136223846793005
+MODULO = 1 << 64
+_U32 = np.uint64(0xFFFFFFFF)
+
+
+@lru_cache(maxsize=16)
+def _coeficientes_bloque(inc: int, largo: int):
+    """A_j, C_j (j = 0..largo-1) del LCG de estado, módulo 2^64 por desborde de uint64."""
+    coef_a = np.empty(largo, dtype=np.uint64)
+    coef_c = np.empty(largo, dtype=np.uint64)
+    coef_a[0], coef_c[0] = 1, 0
+    k = 1
+    a_1, c_1 = np.uint64(MULTIPLICADOR), np.uint64(inc)
+    if largo > 1:
+        coef_a[1], coef_c[1] = a_1, c_1
+        k = 2
+    while k < largo:
+        cuantos = min(k, largo - k)
+        # F_{k+j} = F_j ∘ F_k
+        a_k, c_k = potencia_afin(MULTIPLICADOR, inc, MODULO, k)
+        coef_a[k:k + cuantos] = coef_a[:cuantos] * np.uint64(a_k)
+        coef_c[k:k + cuantos] = coef_a[:cuantos] * np.uint64(c_k) + coef_c[:cuantos]
+        k += cuantos
+    coef_a.flags.writeable = False
+    coef_c.flags.writeable = False
+    return coef_a, coef_c
+
+
+def permutar_salida(estados):
+    """Permutación XSH RR: de estados uint64 a salidas de 32 bits (en uint64)."""
+    xorshifted = (((estados >> np.uint64(18)) ^ estados) >> np.uint64(27)) & _U32
+    rot = estados >> np.uint64(59)
+    return ((xorshifted >> rot) | (xorshifted << ((np.uint64(32) - rot) & np.uint64(31)))) & _U32
+
+
+class PCG32:
+    COLUMNAS = ["Iteración", "Estado", "Salida (uint32)", "Ri"]
+    PARAMETROS = [("semilla", "Semilla", 20251018), ("secuencia", "Secuencia", 54)]
+
+    def __init__(self, semilla: int, n: int, secuencia: int = 54):
+        self.n = n
+        self.inc = ((secuencia << 1) | 1) % MODULO
+        # Inicialización de pcg32_srandom_r
+        self.estado = 0
+        self._avanzar(1)
+        self.estado = (self.estado + semilla) % MODULO
+        self._avanzar(1)
+
+    def _avanzar(self, pasos: int):
+        a_j, c_j = potencia_afin(MULTIPLICADOR, self.inc, MODULO, pasos)
+        self.estado = (a_j * self.estado + c_j) % MODULO
+
+    def _estados(self, n: int):
+        """Estados previos a cada salida de las n siguientes iteraciones."""
+        estados = np.empty(n, dtype=np.uint64)
+        largo = min(n, TAM_BLOQUE)
+        coef_a, coef_c = _coeficientes_bloque(self.inc, largo) if largo else (None, None)
+        for inicio in range(0, n, largo or 1):
+            cuantos = min(largo, n - inicio)
+            estados[inicio:inicio + cuantos] = coef_a[:cuantos] * np.uint64(self.estado) + coef_c[:cuantos]
+            self._avanzar(cuantos)
+        return estados
+
+    def generar_array(self, n: int = None):
+        """Modo columnar: devuelve (salidas uint32 en uint64, Ri float64) y avanza el estado."""
+        xi = permutar_salida(self._estados(self.n if n is None else n))
+        return xi, xi / float(1 << 32)
+
+    def saltar(self, pasos: int):
+        """Avanza pasos posiciones en O(log pasos)."""
+        self._avanzar(pasos)
+        return self
+
+    def obtener_estado(self) -> dict:
+        return {"estado": self.estado, "inc": self.inc}
+
+    def restaurar_estado(self, estado: dict):
+        self.estado = int(estado["estado"])
+        self.inc = int(estado["inc"])
+
+    def iterar_bloques(self, tam_bloque: int = TAM_BLOQUE, total: int = None):
+        """Genera Ri en bloques NumPy de tam_bloque valores, continuando desde el estado actual."""
+        for m in tamanos_bloque(tam_bloque, total):
+            yield self.generar_array(m)[1]
+
+    def generar_columnas(self, n: int = None, xi=None, ri=None) -> TablaColumnar:
+        """
+        Tabla de n salidas. Con xi y ri ya generados (p. ej. de la caché) solo la
+        arma, sin avanzar: el estado de cada fila se obtiene saltando desde el actual.
+        """
+        if xi is None:
+            estados = self._estados(self.n if n is None else n)
+            xi = permutar_salida(estados)
+            ri = xi / float(1 << 32)
+
+            def estado(i):
+                return int(estados[i])
+        else:
+            estado0, inc = self.estado, self.inc
+
+            def estado(i):
+                a_i, c_i = potencia_afin(MULTIPLICADOR, inc, MODULO, i)
+                return (a_i * estado0 + c_i) % MODULO
+
+        return TablaColumnar(self.COLUMNAS, xi, ri, lambda i: {
+            "Iteración": i + 1,
+            "Estado": str(estado(i)),
+            "Salida (uint32)": str(int(xi[i])),
+            "Ri": float(ri[i])
+        })
+
+    def generar_tabla(self):
+        return self.generar_columnas().filas()
@@ -1,31 +1,92 @@
 # ------------------ PRODUCTOS MEDIOS ------------------
+from .nucleo import (
+    MAX_ESTADOS_VISTOS, TAM_BLOQUE, TablaColumnar, array_xi, completar_periodico, digitos_centrales, normalizar,
+    tamanos_bloque
+)
+
+
 class ProductosMedios:
+    COLUMNAS = ["Iteración", "X", "Y", "Producto", "Dígitos del centro", "Ri"]
+    PARAMETROS = [("semilla1", "Semilla X0", 5015), ("semilla2", "Semilla X1", 5734)]
+
     def __init__(self, semilla1: int, semilla2: int, n: int):
         self.x = semilla1
         self.y = semilla2
         self.n = n
         self.d = max(len(str(semilla1)), len(str(semilla2)), 4)  # Al menos 4 dígitos
 
-    def generar_tabla(self):
-        resultados = []
-
-        for i in range(1, self.n + 1):
-            producto = self.x * self.y
-            producto_str = str(producto).zfill(2 * self.d)
-            inicio = (len(producto_str) - self.d) // 2
-            x_centro = int(producto_str[inicio:inicio + self.d])
-            r = x_centro / (10 ** self.d)
-
-            resultados.append({
-                "Iteración": i,
-                "X": str(self.x).zfill(self.d),
-                "Y": str(self.y).zfill(self.d),
-                "Producto": str(producto).zfill(2*self.d),
-                "Dígitos del centro": str(x_centro).zfill(self.d),
-                "Ri": r
-            })
+    def _columnas(self, x: int, y: int, n: int):
+        """Xi (uint64, u object si d > 19) y Ri (float64) de n iteraciones partiendo de (x, y)."""
+        d, ancho = self.d, 2 * self.d
+        tope, modulo = 10 ** ancho, 10 ** d
+        divisor = 10 ** (ancho - (ancho - d) // 2 - d)
+        xi = array_xi(n, d)
+        vistos = {}
+
+        for i in range(n):
+            estado = (x, y)
+            if estado in vistos:
+                # Par repetido: el resto de la secuencia es el mismo ciclo
+                completar_periodico(xi, i, vistos[estado])
+                x, y = int(xi[-2]), int(xi[-1])
+                break
+            if len(vistos) < MAX_ESTADOS_VISTOS:
+                vistos[estado] = i
+            producto = x * y
+            if producto < tope:
+                x_centro = (producto // divisor) % modulo
+            else:
+                x_centro = digitos_centrales(producto, d, ancho)
+            xi[i] = x_centro
 
             # Preparar siguiente iteración
-            self.x, self.y = self.y, x_centro
+            x, y = y, x_centro
+
+        ri = normalizar(xi, modulo)
+        return xi, ri, x, y
+
+    def generar_array(self, n: int = None):
+        """Modo columnar: devuelve (Xi, Ri) como arrays NumPy y avanza el estado (x, y)."""
+        xi, ri, self.x, self.y = self._columnas(self.x, self.y, self.n if n is None else n)
+        return xi, ri
 
-        return resultados
+    def obtener_estado(self) -> dict:
+        return {"x": self.x, "y": self.y}
+
+    def restaurar_estado(self, estado: dict):
+        self.x = int(estado["x"])
+        self.y = int(estado["y"])
+
+    def iterar_bloques(self, tam_bloque: int = TAM_BLOQUE, total: int = None):
+        """
+        Genera Ri en bloques NumPy de tam_bloque valores, con memoria constante.
+        Continúa desde el estado guardado (obtener_estado/restaurar_estado), por lo
+        que una corrida larga puede retomarse donde quedó. total=None no termina.
+        """
+        for m in tamanos_bloque(tam_bloque, total):
+            _, ri, self.x, self.y = self._columnas(self.x, self.y, m)
+            yield ri
+
+    def generar_columnas(self, n: int = None, xi=None, ri=None) -> TablaColumnar:
+        """Tabla de n iteraciones; con xi y ri ya generados (p. ej. de la caché) solo la arma, sin avanzar."""
+        x0, y0, d = self.x, self.y, self.d
+        if xi is None:
+            xi, ri = self.generar_array(n)
+
+        def formatear_fila(i):
+            # X_i = X_{i-2} del centro, Y_i = X_{i-1} del centro
+            x = x0 if i == 0 else (y0 if i == 1 else int(xi[i - 2]))
+            y = y0 if i == 0 else int(xi[i - 1])
+            return {
+                "Iteración": i + 1,
+                "X": str(x).zfill(d),
+                "Y": str(y).zfill(d),
+                "Producto": str(x * y).zfill(2 * d),
+                "Dígitos del centro": str(int(xi[i])).zfill(d),
+                "Ri": float(ri[i])
+            }
+
+        return TablaColumnar(self.COLUMNAS, xi, ri, formatear_fila)
+
+    def generar_tabla(self):
+        return self.generar_columnas().filas()
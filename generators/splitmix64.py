@@ -0,0 +1,77 @@
+# ------------------ SPLITMIX64 ------------------
+# Generador basado en contador: el valor i es una mezcla de semilla + (i+1)*φ,
+# así que cualquier bloque (o cualquier posición) se calcula vectorizado en uint64.
+import numpy as np
+
+from .nucleo import TAM_BLOQUE, TablaColumnar, tamanos_bloque
+
+GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_M2 = np.uint64(0x94D049BB133111EB)
+MASCARA_64 = (1 << 64) - 1
+
+
+def mezclar64(z):
+    """Función de mezcla de SplitMix64 sobre un array uint64 (aritmética módulo 2^64)."""
+    z = (z ^ (z >> np.uint64(30))) * _M1
+    z = (z ^ (z >> np.uint64(27))) * _M2
+    return z ^ (z >> np.uint64(31))
+
+
+def a_unitario(salidas):
+    """uint64 -> float64 en [0, 1) usando los 53 bits altos."""
+    return (salidas >> np.uint64(11)) * (1.0 / (1 << 53))
+
+
+def splitmix64(semilla: int, n: int, inicio: int = 0):
+    """Salidas inicio..inicio+n-1 de SplitMix64 para la semilla dada (uint64)."""
+    contador = np.arange(inicio + 1, inicio + n + 1, dtype=np.uint64)
+    return mezclar64(np.uint64(semilla & MASCARA_64) + contador * GAMMA)
+
+
+class SplitMix64:
+    COLUMNAS = ["Iteración", "Salida (uint64)", "Ri"]
+    PARAMETROS = [("semilla", "Semilla", 20251018)]
+
+    def __init__(self, semilla: int, n: int):
+        self.semilla = semilla & MASCARA_64
+        self.n = n
+        self.posicion = 0  # Cantidad de valores ya entregados
+
+    def _columnas(self, n: int):
+        xi = splitmix64(self.semilla, n, self.posicion)
+        self.posicion += n
+        return xi, a_unitario(xi)
+
+    def generar_array(self, n: int = None):
+        """Modo columnar: devuelve (salidas uint64, Ri float64) y avanza el contador."""
+        return self._columnas(self.n if n is None else n)
+
+    def saltar(self, pasos: int):
+        self.posicion += pasos
+        return self
+
+    def obtener_estado(self) -> dict:
+        return {"semilla": self.semilla, "posicion": self.posicion}
+
+    def restaurar_estado(self, estado: dict):
+        self.semilla = int(estado["semilla"])
+        self.posicion = int(estado["posicion"])
+
+    def iterar_bloques(self, tam_bloque: int = TAM_BLOQUE, total: int = None):
+        """Genera Ri en bloques NumPy de tam_bloque valores, continuando desde el estado actual."""
+        for m in tamanos_bloque(tam_bloque, total):
+            yield self._columnas(m)[1]
+
+    def generar_columnas(self, n: int = None, xi=None, ri=None) -> TablaColumnar:
+        """Tabla de n salidas; con xi y ri ya generados (p. ej. de la caché) solo la arma, sin avanzar."""
+        if xi is None:
+            xi, ri = self.generar_array(n)
+        return TablaColumnar(self.COLUMNAS, xi, ri, lambda i: {
+            "Iteración": i + 1,
+            "Salida (uint64)": str(int(xi[i])),
+            "Ri": float(ri[i])
+        })
+
+    def generar_tabla(self):
+        return self.generar_columnas().filas()
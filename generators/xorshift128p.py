@@ -0,0 +1,83 @@
+# ------------------ XORSHIFT128+ ------------------
+# xorshift128+ (Vigna, desplazamientos 23/17/26) en carriles: se avanzan
+# "carriles" generadores independientes a la vez en uint64 y sus salidas se
+# intercalan (paso 0 de todos los carriles, luego paso 1, ...). Cada carril se
+# siembra con SplitMix64 a partir de la semilla, como recomienda el autor.
+import numpy as np
+
+from .nucleo import TAM_BLOQUE, TablaColumnar, tamanos_bloque
+from .splitmix64 import MASCARA_64, a_unitario, splitmix64
+
+_23, _17, _26 = np.uint64(23), np.uint64(17), np.uint64(26)
+
+
+class Xorshift128Plus:
+    COLUMNAS = ["Iteración", "Carril", "Salida (uint64)", "Ri"]
+    PARAMETROS = [("semilla", "Semilla", 20251018), ("carriles", "Carriles", 1024)]
+
+    def __init__(self, semilla: int, n: int, carriles: int = 1024):
+        if carriles <= 0:
+            raise ValueError("La cantidad de carriles debe ser positiva")
+        self.n = n
+        self.carriles = carriles
+        inicial = splitmix64(semilla & MASCARA_64, 2 * carriles).reshape(carriles, 2)
+        self.s0 = inicial[:, 0].copy()
+        self.s1 = inicial[:, 1].copy()
+        self._pendientes = np.empty(0, dtype=np.uint64)  # Salidas ya calculadas y no entregadas
+
+    def _paso(self):
+        """Un paso en todos los carriles; devuelve una salida por carril."""
+        x, y = self.s0, self.s1
+        salida = x + y
+        x = x ^ (x << _23)
+        self.s0 = y
+        self.s1 = x ^ y ^ (x >> _17) ^ (y >> _26)
+        return salida
+
+    def _salidas(self, n: int):
+        partes = [self._pendientes]
+        faltan = n - len(self._pendientes)
+        if faltan > 0:
+            pasos = -(-faltan // self.carriles)
+            bloque = np.empty((pasos, self.carriles), dtype=np.uint64)
+            for p in range(pasos):
+                bloque[p] = self._paso()
+            partes.append(bloque.ravel())
+        todas = np.concatenate(partes)
+        self._pendientes = todas[n:]
+        return todas[:n]
+
+    def generar_array(self, n: int = None):
+        """Modo columnar: devuelve (salidas uint64, Ri float64) y avanza el estado."""
+        xi = self._salidas(self.n if n is None else n)
+        return xi, a_unitario(xi)
+
+    def obtener_estado(self) -> dict:
+        return {"s0": self.s0.tolist(), "s1": self.s1.tolist(), "pendientes": self._pendientes.tolist()}
+
+    def restaurar_estado(self, estado: dict):
+        self.s0 = np.array(estado["s0"], dtype=np.uint64)
+        self.s1 = np.array(estado["s1"], dtype=np.uint64)
+        self._pendientes = np.array(estado.get("pendientes", []), dtype=np.uint64)
+        self.carriles = len(self.s0)
+
+    def iterar_bloques(self, tam_bloque: int = TAM_BLOQUE, total: int = None):
+        """Genera Ri en bloques NumPy de tam_bloque valores, continuando desde el estado actual."""
+        for m in tamanos_bloque(tam_bloque, total):
+            yield self.generar_array(m)[1]
+
+    def generar_columnas(self, n: int = None, xi=None, ri=None) -> TablaColumnar:
+        """Tabla de n salidas; con xi y ri ya generados (p. ej. de la caché) solo la arma, sin avanzar."""
+        desfase = (self.carriles - len(self._pendientes)) % self.carriles
+        if xi is None:
+            xi, ri = self.generar_array(n)
+        carriles = self.carriles
+        return TablaColumnar(self.COLUMNAS, xi, ri, lambda i: {
+            "Iteración": i + 1,
+            "Carril": (i + desfase) % carriles,
+            "Salida (uint64)": str(int(xi[i])),
+            "Ri": float(ri[i])
+        })
+
+    def generar_tabla(self):
+        return self.generar_columnas().filas()
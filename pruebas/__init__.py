@@ -1,3 +1,13 @@
 from .media import prueba_medias
 from .varianza import prueba_varianza
-from .uniformidad import prueba_uniformidad
+from .uniformidad import prueba_uniformidad, prueba_uniformidad_multiple
+from .acumuladores import AcumuladorMedia, AcumuladorUniformidad, AcumuladorVarianza, probar_bloques
+from .corridas import prueba_corridas_arriba_abajo, prueba_corridas_media
+from .poker import prueba_poker
+from .huecos import prueba_huecos
+from .kolmogorov import prueba_kolmogorov_smirnov
+from .serie import prueba_series, prueba_series_multidimensional
+from .autocorrelacion import analisis_autocorrelacion, autocorrelaciones_fft, periodograma, prueba_autocorrelacion
+from .bateria import BATERIA, ejecutar_bateria
+from .lotes import prueba_medias_lote, prueba_uniformidad_lote, prueba_varianza_lote
+from .meta import p_valor, prueba_dos_niveles, prueba_dos_niveles_semillas
@@ -0,0 +1,107 @@
+# ------------------ ACUMULADORES POR BLOQUES ------------------
+# Versiones incrementales de las pruebas de medias, varianza y uniformidad para
+# secuencias que no caben en memoria: se alimentan bloque a bloque (desde un
+# generador, un archivo mapeado o un lector) y se combinan entre particiones
+# procesadas en paralelo. Los límites de aceptación se calculan al final con las
+# mismas funciones que prueba_medias, prueba_varianza y prueba_uniformidad, así
+# que el resultado es el mismo diccionario.
+import numpy as np
+
+from .media import resultado_medias
+from .uniformidad import resultado_uniformidad
+from .varianza import combinar_momentos, momentos_bloque, resultado_varianza
+
+
+class AcumuladorMedia:
+    def __init__(self):
+        self.n = 0
+        self.suma = 0.0
+
+    def agregar(self, bloque):
+        bloque = np.asarray(bloque, dtype=np.float64)
+        self.n += len(bloque)
+        self.suma += float(np.sum(bloque))
+        return self
+
+    def combinar(self, otro: "AcumuladorMedia"):
+        self.n += otro.n
+        self.suma += otro.suma
+        return self
+
+    def resultado(self, alpha=0.05) -> dict:
+        if self.n == 0:
+            raise ValueError("No se agregaron números")
+        return resultado_medias(self.suma / self.n, self.n, alpha)
+
+
+class AcumuladorVarianza:
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.suma_cuadrados = 0.0  # Σ(x - media)²
+
+    def agregar(self, bloque):
+        bloque = np.asarray(bloque, dtype=np.float64)
+        self.n, self.media, self.suma_cuadrados = combinar_momentos(
+            self.n, self.media, self.suma_cuadrados, *momentos_bloque(bloque))
+        return self
+
+    def combinar(self, otro: "AcumuladorVarianza"):
+        self.n, self.media, self.suma_cuadrados = combinar_momentos(
+            self.n, self.media, self.suma_cuadrados, otro.n, otro.media, otro.suma_cuadrados)
+        return self
+
+    def resultado(self, alpha=0.05) -> dict:
+        if self.n < 2:
+            raise ValueError("La prueba de varianza necesita al menos 2 números")
+        return resultado_varianza(self.suma_cuadrados, self.n, alpha)
+
+
+class AcumuladorUniformidad:
+    def __init__(self, k: int = 10):
+        if k < 2:
+            raise ValueError("La prueba de uniformidad necesita al menos 2 intervalos")
+        self.k = k
+        self.intervalos = np.linspace(0, 1, k + 1)
+        self.n = 0
+        self.frecuencias = np.zeros(k, dtype=np.int64)
+
+    def agregar(self, bloque):
+        # Mismos intervalos que np.histogram en prueba_uniformidad (el último incluye el 1)
+        self.n += len(bloque)
+        self.frecuencias += np.histogram(bloque, bins=self.intervalos)[0]
+        return self
+
+    def combinar(self, otro: "AcumuladorUniformidad"):
+        if otro.k != self.k:
+            raise ValueError("Solo se combinan acumuladores con el mismo k")
+        self.n += otro.n
+        self.frecuencias += otro.frecuencias
+        return self
+
+    def resultado(self, alpha=0.05) -> dict:
+        if self.n == 0:
+            raise ValueError("No se agregaron números")
+        return resultado_uniformidad(self.frecuencias.copy(), self.n, alpha, self.k)
+
+
+ACUMULADORES = {
+    "medias": AcumuladorMedia,
+    "varianza": AcumuladorVarianza,
+    "uniformidad": AcumuladorUniformidad,
+}
+
+
+def crear_acumulador(prueba: str, k: int = 10):
+    if prueba not in ACUMULADORES:
+        raise ValueError(f"Prueba desconocida: {prueba}")
+    return AcumuladorUniformidad(k) if prueba == "uniformidad" else ACUMULADORES[prueba]()
+
+
+def probar_bloques(bloques, pruebas=("medias", "varianza", "uniformidad"), alpha=0.05, k=10) -> dict:
+    """Aplica las pruebas a una secuencia entregada en bloques, leyendo cada bloque una sola vez."""
+    acumuladores = {prueba: crear_acumulador(prueba, k) for prueba in pruebas}
+    for bloque in bloques:
+        for acumulador in acumuladores.values():
+            acumulador.agregar(bloque)
+    return {prueba: acumulador.resultado(alpha) for prueba, acumulador in acumuladores.items()}
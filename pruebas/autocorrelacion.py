@@ -0,0 +1,130 @@
+import math
+import numpy as np
+from scipy.fft import next_fast_len
+
+from .cuantiles import cuantil_chi2, cuantil_normal
+
+# Distancia máxima a 1 de la autocorrelación corregida para tomar un rezago como periodo
+TOLERANCIA_CICLO = 1e-3
+
+
+def prueba_autocorrelacion(numeros, alpha=0.05, i=1, m=1):
+    """
+    Prueba de autocorrelación
+    H0: ρ_im = 0 (los ri i, i+m, i+2m, ... son independientes)
+    H1: ρ_im ≠ 0
+    i es la posición inicial (desde 1) y m el salto entre los números comparados.
+    """
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+    if i < 1 or m < 1:
+        raise ValueError("i y m deben ser al menos 1")
+
+    # M: mayor entero con i + (M+1)m <= n
+    M = (n - i) // m - 1
+    if M < 0:
+        raise ValueError("No hay suficientes números para i y m dados")
+
+    # ρ_im = Σ R_{i+km} R_{i+(k+1)m} / (M+1) - 0.25, con los productos vectorizados
+    sub = numeros[i - 1::m][:M + 2]
+    rho = float(np.dot(sub[:-1], sub[1:])) / (M + 1) - 0.25
+    sigma = math.sqrt(13 * M + 7) / (12 * (M + 1))
+    z = rho / sigma
+    z_alpha_2 = cuantil_normal(1 - alpha/2)
+
+    return {
+        "estadistico": z,
+        "valor_critico": z_alpha_2,
+        "acepta_hipotesis": bool(abs(z) <= z_alpha_2),
+        "rho": rho,
+        "sigma": sigma,
+        "M": M,
+        "i": i,
+        "m": m,
+        "n": n,
+        "alpha": alpha
+    }
+
+
+def autocorrelaciones_fft(numeros, max_rezago=None):
+    """
+    ρ_0..ρ_L de la secuencia centrada, todos los rezagos a la vez con una FFT
+    (teorema de Wiener-Khinchin) en O(n log n). ρ_k = Σ x_t x_{t+k} / Σ x_t².
+    """
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+    if n < 2:
+        raise ValueError("Se necesitan al menos 2 números")
+    max_rezago = n - 1 if max_rezago is None else min(int(max_rezago), n - 1)
+    x = numeros - np.mean(numeros)
+    # Relleno hasta >= 2n para que la correlación circular no mezcle los extremos
+    largo = next_fast_len(2 * n)
+    espectro = np.fft.rfft(x, largo)
+    acf = np.fft.irfft(espectro.real ** 2 + espectro.imag ** 2, largo)[:max_rezago + 1]
+    if acf[0] <= 0:
+        raise ValueError("La secuencia es constante")
+    return acf / acf[0]
+
+
+def periodograma(numeros):
+    """(frecuencias j/n, potencia |X_j|²/n) para j = 1..n/2 de la secuencia centrada."""
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+    x = numeros - np.mean(numeros)
+    potencias = np.abs(np.fft.rfft(x)[1:n // 2 + 1]) ** 2 / n
+    return np.arange(1, len(potencias) + 1) / n, potencias
+
+
+def analisis_autocorrelacion(numeros, alpha=0.05, max_rezago=None, rezagos_ljung_box=None, incluir_series=True):
+    """
+    Autocorrelación de todos los rezagos hasta max_rezago (por defecto n/2) y periodograma.
+    H0: Los ri son independientes (Ljung-Box sobre los primeros rezagos_ljung_box rezagos)
+    Marca los rezagos con |ρ_k| fuera de la banda ±z_{α/2}/√n y, si la secuencia
+    repite un ciclo, el periodo (primer rezago con correlación completa).
+    """
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+    max_rezago = n // 2 if max_rezago is None else max_rezago
+    acf = autocorrelaciones_fft(numeros, max_rezago)
+    rezagos = np.arange(len(acf))
+
+    banda = cuantil_normal(1 - alpha/2) / math.sqrt(n)
+    significativos = rezagos[1:][np.abs(acf[1:]) > banda]
+
+    # Con un ciclo de largo p, ρ_p ≈ (n - p)/n (los n - p productos son x_t², salvo los de
+    # la cola previa al ciclo); sin ciclo, ρ_k·n/(n-k) es del orden de 1/√n
+    corregida = acf[1:] * n / (n - rezagos[1:])
+    ciclos = np.flatnonzero(np.abs(corregida - 1) < TOLERANCIA_CICLO)
+    periodo = int(ciclos[0]) + 1 if len(ciclos) else None
+
+    # Ljung-Box: Q = n(n+2) Σ ρ_k²/(n-k) ~ χ²(h)
+    h = min(len(acf) - 1, rezagos_ljung_box or max(1, min(20, n // 5)))
+    if h < 1:
+        raise ValueError("Se necesita al menos un rezago")
+    q = float(n * (n + 2) * np.sum(acf[1:h + 1] ** 2 / (n - rezagos[1:h + 1])))
+    q_critico = cuantil_chi2(1 - alpha, h)
+
+    # Pico del periodograma y prueba g de Fisher (aproximación del primer término)
+    frecuencias, potencias = periodograma(numeros)
+    pico = int(np.argmax(potencias))
+    m = len(potencias)
+    g = float(potencias[pico] / np.sum(potencias)) if np.sum(potencias) > 0 else 0.0
+    p_fisher = float(min(1.0, m * (1 - g) ** (m - 1)))
+
+    resultado = {
+        "estadistico": q,
+        "valor_critico": q_critico,
+        "acepta_hipotesis": bool(q < q_critico),
+        "rezagos_ljung_box": h,
+        "banda": banda,
+        "rezagos_significativos": significativos,
+        "proporcion_significativos": len(significativos) / max(len(acf) - 1, 1),
+        "periodo": periodo,
+        "periodo_dominante": float(1 / frecuencias[pico]),
+        "p_valor_fisher": p_fisher,
+        "n": n,
+        "alpha": alpha
+    }
+    if incluir_series:
+        resultado.update({"autocorrelaciones": acf, "frecuencias": frecuencias, "periodograma": potencias})
+    return resultado
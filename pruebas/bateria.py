@@ -0,0 +1,102 @@
+# ------------------ BATERÍA DE PRUEBAS ------------------
+# Ejecuta varias pruebas sobre la misma secuencia y junta un solo reporte. Las
+# pruebas se reparten en un pool de hilos: todas leen el mismo array (sin
+# copiarlo a otros procesos) y NumPy libera el GIL en ordenamientos, conteos y
+# reducciones, así que corren en paralelo.
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .autocorrelacion import analisis_autocorrelacion, prueba_autocorrelacion
+from .corridas import prueba_corridas_arriba_abajo, prueba_corridas_media
+from .huecos import prueba_huecos
+from .kolmogorov import prueba_kolmogorov_smirnov
+from .media import prueba_medias
+from .poker import prueba_poker
+from .serie import prueba_series, prueba_series_multidimensional
+from .uniformidad import prueba_uniformidad
+from .varianza import prueba_varianza
+
+# Nombre -> función(numeros, alpha, **opciones)
+BATERIA = {
+    "medias": prueba_medias,
+    "varianza": prueba_varianza,
+    "uniformidad": prueba_uniformidad,
+    "corridas_arriba_abajo": prueba_corridas_arriba_abajo,
+    "corridas_media": prueba_corridas_media,
+    "poker": prueba_poker,
+    "huecos": prueba_huecos,
+    "kolmogorov_smirnov": prueba_kolmogorov_smirnov,
+    "series": prueba_series,
+    "series_multidimensional": prueba_series_multidimensional,
+    "autocorrelacion": prueba_autocorrelacion,
+    "autocorrelacion_fft": analisis_autocorrelacion,
+}
+
+# Opciones que se usan si no se indican otras: el reporte no lleva las series completas
+OPCIONES_POR_DEFECTO = {
+    "autocorrelacion_fft": {"max_rezago": 1000, "incluir_series": False},
+}
+
+# Pruebas cuyo estadístico es Z (se acepta con |Z| <= valor crítico)
+PRUEBAS_Z = {"corridas_arriba_abajo", "corridas_media", "autocorrelacion"}
+
+
+def resumen(nombre: str, resultado: dict):
+    """(valor, límite inferior, límite superior, acepta) de un resultado, para mostrarlo en una tabla."""
+    if "error" in resultado:
+        return float("nan"), None, None, False
+    if nombre == "medias":
+        return resultado["media"], resultado["limite_inferior"], resultado["limite_superior"], resultado["acepta_hipotesis"]
+    if nombre == "varianza":
+        return resultado["varianza"], resultado["limite_inferior"], resultado["limite_superior"], resultado["acepta_hipotesis"]
+    if nombre == "uniformidad":
+        return resultado["chi_cuadrado"], 0.0, resultado["chi_critico"], resultado["acepta_hipotesis"]
+    critico = resultado["valor_critico"]
+    # Las pruebas con Z son bilaterales; las de χ² y D solo tienen límite superior
+    inferior = -critico if nombre in PRUEBAS_Z else 0.0
+    return resultado["estadistico"], inferior, critico, resultado["acepta_hipotesis"]
+
+
+def _ejecutar(nombre, numeros, alpha, opciones):
+    inicio = time.perf_counter()
+    try:
+        if len(numeros) == 0:
+            raise ValueError("No hay números para analizar")
+        resultado = BATERIA[nombre](numeros, alpha, **opciones)
+    except (ValueError, ArithmeticError) as e:
+        # Secuencias demasiado cortas (n = 1, 2...) pueden dividir por cero en el estadístico
+        resultado = {"error": str(e) or type(e).__name__, "acepta_hipotesis": False}
+    resultado["segundos"] = time.perf_counter() - inicio
+    return resultado
+
+
+def ejecutar_bateria(numeros, pruebas=None, alpha=0.05, opciones=None, hilos=None) -> dict:
+    """
+    Aplica las pruebas indicadas (por defecto todas las de BATERIA) y devuelve un
+    reporte con el resultado de cada una. opciones = {prueba: {parámetro: valor}}
+    pasa parámetros propios (k, digitos, t, m, ...). Una prueba que no se puede
+    aplicar queda con "error" y cuenta como rechazada.
+    """
+    pruebas = list(BATERIA) if pruebas is None else list(pruebas)
+    desconocidas = [p for p in pruebas if p not in BATERIA]
+    if desconocidas:
+        raise ValueError(f"Pruebas desconocidas: {', '.join(desconocidas)}")
+    numeros = np.asarray(numeros, dtype=np.float64)
+    opciones = opciones or {}
+    hilos = hilos or min(len(pruebas), os.cpu_count() or 1)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(hilos, 1)) as pool:
+        futuros = {p: pool.submit(_ejecutar, p, numeros, alpha, {**OPCIONES_POR_DEFECTO.get(p, {}), **opciones.get(p, {})}) for p in pruebas}
+        resultados = {p: futuro.result() for p, futuro in futuros.items()}
+
+    return {
+        "pruebas": resultados,
+        "acepta_todas": all(r["acepta_hipotesis"] for r in resultados.values()),
+        "n": len(numeros),
+        "alpha": alpha,
+        "segundos": time.perf_counter() - inicio
+    }
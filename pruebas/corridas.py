@@ -0,0 +1,76 @@
+import math
+import numpy as np
+
+from .cuantiles import cuantil_normal
+
+
+def prueba_corridas_arriba_abajo(numeros, alpha=0.05):
+    """
+    Prueba de corridas arriba y abajo
+    H0: Los números ri son independientes
+    H1: Los números ri no son independientes
+    Una corrida es un tramo de subidas (o bajadas) consecutivas.
+    """
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+    if n < 3:
+        raise ValueError("La prueba de corridas necesita al menos 3 números")
+
+    # Signo de cada paso (1 sube, 0 baja o igual) y corridas = cambios de signo + 1
+    subidas = numeros[1:] > numeros[:-1]
+    corridas = int(np.count_nonzero(subidas[1:] != subidas[:-1])) + 1
+
+    # Distribución de la cantidad de corridas bajo H0
+    media_corridas = (2 * n - 1) / 3
+    varianza_corridas = (16 * n - 29) / 90
+    z = (corridas - media_corridas) / math.sqrt(varianza_corridas)
+    return _resultado_z(z, alpha, {
+        "corridas": corridas,
+        "media_corridas": media_corridas,
+        "varianza_corridas": varianza_corridas,
+        "n": n
+    })
+
+
+def prueba_corridas_media(numeros, alpha=0.05):
+    """
+    Prueba de corridas arriba y abajo de la media (0.5)
+    H0: Los números ri son independientes
+    H1: Los números ri no son independientes
+    """
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+
+    # 1 si ri >= 0.5; las corridas son los tramos de unos o ceros consecutivos
+    arriba = numeros >= 0.5
+    n1 = int(np.count_nonzero(arriba))
+    n0 = n - n1
+    if n0 == 0 or n1 == 0:
+        raise ValueError("Todos los números están del mismo lado de la media")
+    corridas = int(np.count_nonzero(arriba[1:] != arriba[:-1])) + 1
+
+    media_corridas = 2 * n0 * n1 / n + 0.5
+    varianza_corridas = 2 * n0 * n1 * (2 * n0 * n1 - n) / (n ** 2 * (n - 1))
+    if varianza_corridas <= 0:
+        raise ValueError("Muy pocos números para la prueba de corridas")
+    z = (corridas - media_corridas) / math.sqrt(varianza_corridas)
+    return _resultado_z(z, alpha, {
+        "corridas": corridas,
+        "n0": n0,
+        "n1": n1,
+        "media_corridas": media_corridas,
+        "varianza_corridas": varianza_corridas,
+        "n": n
+    })
+
+
+def _resultado_z(z, alpha, datos):
+    """Completa el resultado de una prueba bilateral con estadístico Z."""
+    z_alpha_2 = cuantil_normal(1 - alpha/2)
+    return {
+        "estadistico": z,
+        "valor_critico": z_alpha_2,
+        "acepta_hipotesis": bool(abs(z) <= z_alpha_2),
+        **datos,
+        "alpha": alpha
+    }
@@ -0,0 +1,76 @@
+# ------------------ CUANTILES DE LAS PRUEBAS ------------------
+# Valores críticos normales y χ² memorizados: las pruebas piden casi siempre los
+# mismos (α comunes, mismos k, mismo n en pruebas por lotes), así que cada uno se
+# calcula con scipy una sola vez. Para α comunes hay una tabla calculada al cargar
+# el módulo (una llamada vectorizada por distribución) y para muchos grados de
+# libertad se usa la aproximación de Wilson-Hilferty, cuyo error relativo ya es
+# < 1e-9 con gl > 10^6.
+import math
+from functools import lru_cache
+
+import numpy as np
+import scipy.stats as stats
+
+ALPHAS_COMUNES = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+# Probabilidades que usan las pruebas: α/2 y 1 - α/2 (dos colas) y 1 - α (una cola)
+PROBABILIDADES_COMUNES = tuple(sorted({p for a in ALPHAS_COMUNES for p in (a / 2, 1 - a / 2, 1 - a)}))
+
+# Tabla χ² precalculada para gl = 1..GL_TABLA (cubre la prueba de uniformidad con k <= 101)
+GL_TABLA = 100
+GL_WILSON_HILFERTY = 10 ** 6
+
+
+def _tabla_normal():
+    valores = stats.norm.ppf(PROBABILIDADES_COMUNES)
+    return {p: float(z) for p, z in zip(PROBABILIDADES_COMUNES, valores)}
+
+
+def _tabla_chi2():
+    gl = np.arange(1, GL_TABLA + 1)
+    valores = stats.chi2.ppf(np.array(PROBABILIDADES_COMUNES)[:, None], gl[None, :])
+    return {(p, int(g)): float(v) for p, fila in zip(PROBABILIDADES_COMUNES, valores) for g, v in zip(gl, fila)}
+
+
+TABLA_NORMAL = _tabla_normal()
+TABLA_CHI2 = _tabla_chi2()
+
+
+@lru_cache(maxsize=1024)
+def cuantil_normal(p: float) -> float:
+    """z tal que P(Z <= z) = p para la normal estándar."""
+    if not 0 < p < 1:
+        raise ValueError("La probabilidad debe estar en (0, 1)")
+    z = TABLA_NORMAL.get(p)
+    return float(stats.norm.ppf(p)) if z is None else z
+
+
+def chi2_wilson_hilferty(p: float, gl: int) -> float:
+    """Aproximación de Wilson-Hilferty: (χ²/gl)^(1/3) es casi normal con media 1 - 2/(9gl)."""
+    h = 2.0 / (9.0 * gl)
+    return gl * (1.0 - h + cuantil_normal(p) * math.sqrt(h)) ** 3
+
+
+@lru_cache(maxsize=4096)
+def cuantil_chi2(p: float, gl: int) -> float:
+    """x tal que P(χ²(gl) <= x) = p."""
+    if not 0 < p < 1:
+        raise ValueError("La probabilidad debe estar en (0, 1)")
+    if gl < 1:
+        raise ValueError("Los grados de libertad deben ser al menos 1")
+    x = TABLA_CHI2.get((p, gl))
+    if x is not None:
+        return x
+    if gl > GL_WILSON_HILFERTY:
+        return chi2_wilson_hilferty(p, gl)
+    return float(stats.chi2.ppf(p, gl))
+
+
+@lru_cache(maxsize=1024)
+def cuantil_ks(p: float, n: int) -> float:
+    """d tal que P(D_n <= d) = p para el estadístico de Kolmogorov-Smirnov con n datos (distribución exacta)."""
+    if not 0 < p < 1:
+        raise ValueError("La probabilidad debe estar en (0, 1)")
+    if n < 1:
+        raise ValueError("Se necesita al menos un dato")
+    return float(stats.kstwo.ppf(p, n))
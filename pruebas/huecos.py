@@ -0,0 +1,53 @@
+import numpy as np
+
+from .cuantiles import cuantil_chi2
+
+
+def prueba_huecos(numeros, alpha=0.05, a=0.0, b=0.5, t=5):
+    """
+    Prueba de huecos (distancias)
+    H0: Los números ri son independientes
+    H1: Los números ri no son independientes
+    Un hueco de tamaño i son i números fuera de [a, b] entre dos que caen dentro;
+    se agrupan los tamaños 0..t-1 y ">= t".
+    """
+    if not 0 <= a < b <= 1:
+        raise ValueError("El intervalo debe cumplir 0 <= a < b <= 1")
+    if t < 1:
+        raise ValueError("t debe ser al menos 1")
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+
+    # Posiciones de los números que caen en el intervalo y tamaño de cada hueco
+    posiciones = np.flatnonzero((numeros >= a) & (numeros <= b))
+    huecos = np.diff(posiciones) - 1
+    total_huecos = len(huecos)
+    if total_huecos == 0:
+        raise ValueError("Menos de dos números caen en el intervalo: no hay huecos")
+    frecuencias_obs = np.bincount(np.minimum(huecos, t), minlength=t + 1)
+
+    # P(hueco = i) = p (1-p)^i y P(hueco >= t) = (1-p)^t, con p = b - a
+    p = b - a
+    probabilidades = np.append(p * (1 - p) ** np.arange(t), (1 - p) ** t)
+    frecuencias_esp = total_huecos * probabilidades
+    terminos = (frecuencias_obs - frecuencias_esp) ** 2 / frecuencias_esp
+    chi_cuadrado = float(terminos.sum())
+    chi_critico = cuantil_chi2(1 - alpha, t)
+
+    tabla_frecuencias = [{
+        "hueco": f"{i}" if i < t else f">= {t}",
+        "probabilidad": float(pi),
+        "frecuencia_observada": int(fo),
+        "frecuencia_esperada": float(fe),
+        "termino_chi": float(termino)
+    } for i, (pi, fo, fe, termino) in enumerate(zip(probabilidades, frecuencias_obs, frecuencias_esp, terminos))]
+
+    return {
+        "estadistico": chi_cuadrado,
+        "valor_critico": chi_critico,
+        "acepta_hipotesis": bool(chi_cuadrado < chi_critico),
+        "tabla_frecuencias": tabla_frecuencias,
+        "huecos": total_huecos,
+        "n": n,
+        "alpha": alpha
+    }
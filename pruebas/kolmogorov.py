@@ -0,0 +1,33 @@
+import numpy as np
+
+from .cuantiles import cuantil_ks
+
+
+def prueba_kolmogorov_smirnov(numeros, alpha=0.05):
+    """
+    Prueba de Kolmogorov-Smirnov
+    H0: Los números ri siguen una distribución U(0, 1)
+    H1: Los números ri no siguen una distribución U(0, 1)
+    D es la mayor distancia entre la distribución empírica y F(x) = x.
+    """
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+    if n == 0:
+        raise ValueError("No hay números para analizar")
+
+    ordenados = np.sort(numeros)
+    i = np.arange(1, n + 1)
+    d_mas = float(np.max(i / n - ordenados))
+    d_menos = float(np.max(ordenados - (i - 1) / n))
+    d = max(d_mas, d_menos)
+    d_critico = cuantil_ks(1 - alpha, n)
+
+    return {
+        "estadistico": d,
+        "valor_critico": d_critico,
+        "acepta_hipotesis": bool(d <= d_critico),
+        "d_mas": d_mas,
+        "d_menos": d_menos,
+        "n": n,
+        "alpha": alpha
+    }
@@ -0,0 +1,148 @@
+# ------------------ PRUEBAS POR LOTES ------------------
+# Versiones de prueba_medias, prueba_varianza y prueba_uniformidad para una
+# matriz (secuencias x n): cada fila es una secuencia y los estadísticos se
+# calculan con reducciones por eje de NumPy, así que 10^4 semillas se evalúan
+# en una llamada. Los resultados son arrays con un valor por fila y los mismos
+# límites (escalares) que las pruebas de una secuencia.
+import math
+import numpy as np
+
+from .cuantiles import cuantil_chi2, cuantil_normal
+
+# Elementos por bloque de filas: acota los temporales de la matriz centrada y de los índices
+TAM_BLOQUE = 1 << 20
+
+
+def _matriz(numeros):
+    matriz = np.asarray(numeros, dtype=np.float64)
+    if matriz.ndim != 2:
+        raise ValueError("Se espera una matriz de (secuencias x n) números")
+    if matriz.shape[1] < 2:
+        raise ValueError("Cada secuencia necesita al menos 2 números")
+    return matriz
+
+
+def _bloques_filas(matriz):
+    """Rebanadas de filas consecutivas de unos TAM_BLOQUE elementos."""
+    filas = max(1, TAM_BLOQUE // matriz.shape[1])
+    for inicio in range(0, len(matriz), filas):
+        yield slice(inicio, inicio + filas)
+
+
+# ---------------- Decisiones a partir de estadísticos por fila ----------------
+def resultado_medias_lote(media, n, alpha=0.05):
+    """Límites y decisión de la prueba de medias para un array de medias sobre n valores."""
+    z_alpha_2 = cuantil_normal(1 - alpha/2)
+    limite_inferior = 0.5 - z_alpha_2 * (1 / math.sqrt(12 * n))
+    limite_superior = 0.5 + z_alpha_2 * (1 / math.sqrt(12 * n))
+    return {
+        "media": media,
+        "limite_inferior": limite_inferior,
+        "limite_superior": limite_superior,
+        "acepta_hipotesis": (limite_inferior <= media) & (media <= limite_superior),
+        "n": n,
+        "z_alpha_2": z_alpha_2
+    }
+
+
+def resultado_varianza_lote(suma_cuadrados, n, alpha=0.05):
+    """Límites y decisión de la prueba de varianza para un array de Σ(x - media)²."""
+    varianza = suma_cuadrados / (n - 1)
+    chi2_alpha_2 = cuantil_chi2(1 - alpha/2, n-1)
+    chi2_1_minus_alpha_2 = cuantil_chi2(alpha/2, n-1)
+    limite_inferior = chi2_1_minus_alpha_2 / (12 * (n - 1))
+    limite_superior = chi2_alpha_2 / (12 * (n - 1))
+    return {
+        "varianza": varianza,
+        "limite_inferior": limite_inferior,
+        "limite_superior": limite_superior,
+        "acepta_hipotesis": (limite_inferior <= varianza) & (varianza <= limite_superior),
+        "n": n,
+        "suma_cuadrados": suma_cuadrados,
+        "chi2_alpha_2": chi2_alpha_2,
+        "chi2_1_minus_alpha_2": chi2_1_minus_alpha_2
+    }
+
+
+def resultado_uniformidad_lote(frecuencias_obs, n, alpha=0.05):
+    """χ² y decisión por fila a partir de la matriz (secuencias x k) de frecuencias observadas."""
+    k = frecuencias_obs.shape[1]
+    frecuencia_esp = n / k
+    chi_cuadrado = np.sum((frecuencias_obs - frecuencia_esp) ** 2 / frecuencia_esp, axis=1)
+    chi_critico = cuantil_chi2(1 - alpha, k - 1)
+    return {
+        "chi_cuadrado": chi_cuadrado,
+        "chi_critico": chi_critico,
+        "acepta_hipotesis": chi_cuadrado < chi_critico,
+        "frecuencias": frecuencias_obs,
+        "frecuencia_esperada": frecuencia_esp,
+        "n": n,
+        "k": k,
+        "alpha": alpha
+    }
+
+
+def indices_intervalo(numeros, k):
+    """
+    Intervalo de cada número con los mismos bordes que np.histogram en prueba_uniformidad
+    (el último es cerrado, así que 1.0 cae en k - 1). Los valores fuera de [0, 1] (y NaN),
+    que np.histogram no cuenta, reciben el índice k: quien cuenta usa k + 1 celdas y descarta la última.
+    """
+    intervalos = np.linspace(0, 1, k + 1)
+    # floor(x·k) acierta salvo por redondeo junto a un borde: se corrige comparando con los bordes reales
+    with np.errstate(invalid="ignore"):
+        indices = np.clip((numeros * k).astype(np.int64), 0, k - 1)
+    indices -= numeros < intervalos[indices]
+    indices += (numeros >= intervalos[indices + 1]) & (indices < k - 1)
+    indices[~((numeros >= 0) & (numeros <= 1))] = k
+    return indices
+
+
+def frecuencias_filas(matriz, k):
+    """
+    Frecuencias (secuencias x k) con un solo bincount por bloque (índice fila·(k + 1) + intervalo).
+    Cada fila tiene una celda extra para los valores fuera de [0, 1], que no se cuentan.
+    """
+    frecuencias = np.empty((len(matriz), k), dtype=np.int64)
+    for filas in _bloques_filas(matriz):
+        bloque = matriz[filas]
+        celdas = indices_intervalo(bloque, k) + np.arange(len(bloque))[:, None] * (k + 1)
+        conteos = np.bincount(celdas.ravel(), minlength=len(bloque) * (k + 1))
+        frecuencias[filas] = conteos.reshape(-1, k + 1)[:, :k]
+    return frecuencias
+
+
+# ---------------- Pruebas sobre la matriz ----------------
+def prueba_medias_lote(numeros, alpha=0.05):
+    """
+    Prueba de medias de cada fila
+    H0: μ = 0.5 (para cada secuencia)
+    """
+    matriz = _matriz(numeros)
+    n = matriz.shape[1]
+    return resultado_medias_lote(np.sum(matriz, axis=1) / n, n, alpha)
+
+
+def prueba_varianza_lote(numeros, alpha=0.05):
+    """
+    Prueba de varianza de cada fila
+    H0: σ² = 1/12 (para cada secuencia)
+    Dos pasadas por bloque de filas (media y luego Σ(x - media)²), sin la cancelación de Σx² - n·media².
+    """
+    matriz = _matriz(numeros)
+    n = matriz.shape[1]
+    suma_cuadrados = np.empty(len(matriz))
+    for filas in _bloques_filas(matriz):
+        bloque = matriz[filas]
+        media = np.sum(bloque, axis=1) / n
+        suma_cuadrados[filas] = np.sum(np.square(bloque - media[:, None]), axis=1)
+    return resultado_varianza_lote(suma_cuadrados, n, alpha)
+
+
+def prueba_uniformidad_lote(numeros, alpha=0.05, k=10):
+    """
+    Prueba de uniformidad (Chi-cuadrado) de cada fila
+    H0: Los números de cada secuencia están uniformemente distribuidos
+    """
+    matriz = _matriz(numeros)
+    return resultado_uniformidad_lote(frecuencias_filas(matriz, k), matriz.shape[1], alpha)
@@ -1,24 +1,47 @@
 import math
-import scipy.stats as stats
+import numpy as np
+
+from .cuantiles import cuantil_normal
+
+# Valores por bloque al sumar arrays grandes (un np.memmap se lee de a un bloque)
+TAM_BLOQUE = 1 << 16
+
+
+def suma_por_bloques(numeros, tam_bloque=TAM_BLOQUE) -> float:
+    """
+    Σx en float64, bloque a bloque: solo cada bloque se convierte a float64, así
+    que un np.memmap de otro dtype no se copia entero a memoria. Dentro del
+    bloque np.sum suma por pares; las sumas de los bloques se unen con fsum.
+    """
+    return math.fsum(float(np.sum(numeros[inicio:inicio + tam_bloque], dtype=np.float64))
+                     for inicio in range(0, len(numeros), tam_bloque))
+
 
 def prueba_medias(numeros, alpha=0.05):
     """
     Prueba de medias
     H0: μ = 0.5
     H1: μ ≠ 0.5
+    Acepta listas, arrays o arrays mapeados en memoria (np.memmap).
     """
+    if not isinstance(numeros, np.ndarray):
+        numeros = np.asarray(numeros, dtype=np.float64)
     n = len(numeros)
     
     # Calcular la media (F)
-    media = sum(numeros) / n
-    
+    media = suma_por_bloques(numeros) / n
+    return resultado_medias(media, n, alpha)
+
+
+def resultado_medias(media, n, alpha=0.05):
+    """Límites de aceptación y decisión para una media ya calculada sobre n valores."""
     # Calcular límites de aceptación
-    z_alpha_2 = stats.norm.ppf(1 - alpha/2)
+    z_alpha_2 = cuantil_normal(1 - alpha/2)
     limite_inferior = 0.5 - z_alpha_2 * (1 / math.sqrt(12 * n))
     limite_superior = 0.5 + z_alpha_2 * (1 / math.sqrt(12 * n))
     
     # Verificar hipótesis
-    acepta_hipotesis = limite_inferior <= media <= limite_superior
+    acepta_hipotesis = bool(limite_inferior <= media <= limite_superior)
     
     return {
         "media": media,
@@ -27,4 +50,4 @@ def prueba_medias(numeros, alpha=0.05):
         "acepta_hipotesis": acepta_hipotesis,
         "n": n,
         "z_alpha_2": z_alpha_2
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,189 @@
+# ------------------ PRUEBAS DE DOS NIVELES ------------------
+# Primer nivel: las pruebas elegidas se aplican a cada uno de M bloques (trozos
+# de una secuencia larga o corridas con M semillas) en un pool de procesos.
+# Segundo nivel: si el generador es bueno, los M p-valores de cada prueba son
+# U(0, 1), así que se les aplica Kolmogorov-Smirnov y χ². Un generador que pasa
+# "de más" o "de menos" en el primer nivel falla en el segundo.
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import scipy.stats as stats
+
+from .bateria import BATERIA, OPCIONES_POR_DEFECTO
+from .kolmogorov import prueba_kolmogorov_smirnov
+from .uniformidad import prueba_uniformidad
+
+# Intervalos de la χ² sobre los p-valores
+K_P_VALORES = 10
+
+
+def _normal_bilateral(z):
+    return math.erfc(abs(z) / math.sqrt(2))
+
+
+def _chi2_superior(chi, gl):
+    return float(stats.chi2.sf(chi, gl))
+
+
+def p_valor(nombre: str, resultado: dict) -> float:
+    """p-valor del estadístico de una prueba de BATERIA (para las de límites, a dos colas)."""
+    n = resultado["n"]
+    if nombre == "medias":
+        return _normal_bilateral((resultado["media"] - 0.5) * math.sqrt(12 * n))
+    if nombre == "varianza":
+        # Los límites χ² de la prueba suponen datos normales; con U(0, 1) (μ4 = 1/80) la
+        # varianza muestral es más estable: Var(s²) ≈ (1/80 - 1/144)/n = 1/(180 n)
+        return _normal_bilateral((resultado["varianza"] - 1 / 12) * math.sqrt(180 * n))
+    if nombre == "uniformidad":
+        return _chi2_superior(resultado["chi_cuadrado"], resultado["k"] - 1)
+    if nombre in ("corridas_arriba_abajo", "corridas_media", "autocorrelacion"):
+        return _normal_bilateral(resultado["estadistico"])
+    if nombre in ("poker", "huecos"):
+        return _chi2_superior(resultado["estadistico"], len(resultado["tabla_frecuencias"]) - 1)
+    if nombre in ("series", "series_multidimensional"):
+        return resultado["p_valor"]
+    if nombre == "kolmogorov_smirnov":
+        return float(stats.kstwo.sf(resultado["estadistico"], n))
+    if nombre == "autocorrelacion_fft":
+        return _chi2_superior(resultado["estadistico"], resultado["rezagos_ljung_box"])
+    raise ValueError(f"Prueba desconocida: {nombre}")
+
+
+def _probar_bloque(indice, fuente, pruebas, alpha, opciones):
+    """Tarea del pool: p-valor y tiempo de cada prueba sobre un bloque (array o corrida a generar)."""
+    inicio = time.perf_counter()
+    if isinstance(fuente, tuple):
+        from generators import crear_generador
+        nombre, parametros, n = fuente
+        try:
+            numeros = crear_generador(nombre, n, **parametros).generar_array()[1]
+        except ValueError as e:
+            # Corrida que no se puede generar (p. ej. semilla degenerada): el bloque cuenta como fallido
+            return {"bloque": indice, "n": 0, "error": str(e), "segundos_generacion": time.perf_counter() - inicio,
+                    "p_valores": dict.fromkeys(pruebas, float("nan")), "segundos": dict.fromkeys(pruebas, 0.0),
+                    "segundos_total": time.perf_counter() - inicio}
+    else:
+        numeros = fuente
+    bloque = {"bloque": indice, "n": len(numeros), "segundos_generacion": time.perf_counter() - inicio,
+              "p_valores": {}, "segundos": {}}
+    for prueba in pruebas:
+        t = time.perf_counter()
+        try:
+            resultado = BATERIA[prueba](numeros, alpha, **{**OPCIONES_POR_DEFECTO.get(prueba, {}),
+                                                           **opciones.get(prueba, {})})
+            bloque["p_valores"][prueba] = p_valor(prueba, resultado)
+        except ValueError:
+            bloque["p_valores"][prueba] = float("nan")
+        bloque["segundos"][prueba] = time.perf_counter() - t
+    bloque["segundos_total"] = time.perf_counter() - inicio
+    return bloque
+
+
+def _ejecutar(fuentes, pruebas, alpha, opciones, procesos):
+    tareas = [(i, fuente, pruebas, alpha, opciones) for i, fuente in enumerate(fuentes)]
+    if procesos == 1 or len(tareas) == 1:
+        return [_probar_bloque(*tarea) for tarea in tareas]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return list(pool.map(_probar_bloque, *zip(*tareas)))
+
+
+def _segundo_nivel(bloques, pruebas, alpha):
+    resultados = {}
+    for prueba in pruebas:
+        p_valores = np.array([b["p_valores"][prueba] for b in bloques])
+        validos = p_valores[~np.isnan(p_valores)]
+        if len(validos) < 2:
+            resultados[prueba] = {"p_valores": p_valores, "error": "Menos de 2 bloques con p-valor",
+                                  "acepta_hipotesis": False}
+            continue
+        ks = prueba_kolmogorov_smirnov(validos, alpha)
+        chi = prueba_uniformidad(validos, alpha, K_P_VALORES)
+        resultados[prueba] = {
+            "p_valores": p_valores,
+            "kolmogorov_smirnov": {"d": ks["estadistico"], "d_critico": ks["valor_critico"],
+                                   "acepta_hipotesis": ks["acepta_hipotesis"]},
+            "chi_cuadrado": {"chi_cuadrado": float(chi["chi_cuadrado"]), "chi_critico": chi["chi_critico"],
+                             "acepta_hipotesis": bool(chi["acepta_hipotesis"])},
+            "proporcion_aceptados": float(np.mean(validos >= alpha)),
+            "acepta_hipotesis": bool(ks["acepta_hipotesis"] and chi["acepta_hipotesis"])
+        }
+    return resultados
+
+
+def _reporte(bloques, pruebas, alpha, procesos, inicio):
+    segundos_bloques = np.array([b["segundos_total"] for b in bloques])
+    resultados = _segundo_nivel(bloques, pruebas, alpha)
+    return {
+        "pruebas": resultados,
+        "acepta_todas": all(r["acepta_hipotesis"] for r in resultados.values()),
+        "bloques": bloques,
+        "segundos_por_bloque": {"media": float(segundos_bloques.mean()), "maximo": float(segundos_bloques.max()),
+                                "total": float(segundos_bloques.sum())},
+        "procesos": procesos,
+        "alpha": alpha,
+        "segundos": time.perf_counter() - inicio
+    }
+
+
+def _validar(pruebas, cantidad):
+    desconocidas = [p for p in pruebas if p not in BATERIA]
+    if desconocidas:
+        raise ValueError(f"Pruebas desconocidas: {', '.join(desconocidas)}")
+    if cantidad < 2:
+        raise ValueError("La prueba de dos niveles necesita al menos 2 bloques")
+
+
+def _clave_semilla(generador: str, parametros: dict) -> str:
+    """Parámetro del generador que recibe cada semilla (debe haber uno solo, p. ej. "semilla")."""
+    from generators import GENERADORES
+    if generador not in GENERADORES:
+        raise ValueError(f"Generador desconocido: {generador}")
+    claves = [clave for clave, _, _ in GENERADORES[generador].PARAMETROS]
+    desconocidos = [clave for clave in parametros if clave not in claves]
+    if desconocidos:
+        raise ValueError(f"Parámetros desconocidos para {generador}: {', '.join(desconocidos)}. "
+                         f"Válidos: {', '.join(claves)}")
+    semillas = [clave for clave in claves if clave.startswith("semilla")]
+    if len(semillas) != 1:
+        raise ValueError(f"{generador} no tiene un único parámetro de semilla "
+                         f"({', '.join(semillas) or 'ninguno'}); no admite una corrida por semilla")
+    return semillas[0]
+
+
+def prueba_dos_niveles(numeros, bloques=100, pruebas=("uniformidad",), alpha=0.05, opciones=None, procesos=None) -> dict:
+    """
+    Divide numeros en 'bloques' trozos consecutivos, aplica las pruebas a cada uno
+    en paralelo y luego KS y χ² a los p-valores de cada prueba.
+    """
+    pruebas = list(pruebas)
+    _validar(pruebas, bloques)
+    numeros = np.asarray(numeros, dtype=np.float64)
+    if len(numeros) < bloques:
+        raise ValueError("Hay menos números que bloques")
+    procesos = procesos or os.cpu_count() or 1
+    inicio = time.perf_counter()
+    fuentes = np.array_split(numeros, bloques)
+    resultados = _ejecutar(fuentes, pruebas, alpha, opciones or {}, procesos)
+    return _reporte(resultados, pruebas, alpha, procesos, inicio)
+
+
+def prueba_dos_niveles_semillas(generador: str, semillas, n: int, pruebas=("uniformidad",), alpha=0.05,
+                                parametros=None, opciones=None, procesos=None) -> dict:
+    """
+    Un bloque por semilla: cada proceso genera su corrida de n valores con el
+    generador del registro (no se copian datos entre procesos) y la prueba.
+    """
+    pruebas = list(pruebas)
+    semillas = list(semillas)
+    _validar(pruebas, len(semillas))
+    clave = _clave_semilla(generador, parametros or {})
+    procesos = procesos or os.cpu_count() or 1
+    inicio = time.perf_counter()
+    fuentes = [(generador, {**(parametros or {}), clave: int(s)}, n) for s in semillas]
+    resultados = _ejecutar(fuentes, pruebas, alpha, opciones or {}, procesos)
+    for bloque, semilla in zip(resultados, semillas):
+        bloque["semilla"] = int(semilla)
+    return _reporte(resultados, pruebas, alpha, procesos, inicio)
@@ -0,0 +1,77 @@
+import numpy as np
+
+from .cuantiles import cuantil_chi2
+
+# Probabilidad de cada mano según la cantidad de dígitos que se toman de ri
+MANOS = {
+    5: [("Todos diferentes", 0.3024), ("Un par", 0.5040), ("Dos pares", 0.1080), ("Tercia", 0.0720),
+        ("Full", 0.0090), ("Póker", 0.0045), ("Quintilla", 0.0001)],
+    3: [("Todos diferentes", 0.72), ("Un par", 0.27), ("Tercia", 0.01)],
+}
+
+# Valores por bloque al clasificar las manos
+TAM_BLOQUE = 1 << 18
+
+# La mano queda determinada por cuántos pares de posiciones tienen el mismo dígito:
+# pares iguales -> índice de la mano en MANOS[digitos] (-1: no ocurre)
+CLASE_POR_PARES = {
+    5: np.array([0, 1, 2, 3, 4, -1, 5, -1, -1, -1, 6]),  # 0 TD, 1 1P, 2 2P, 3 T, 4 Full, 6 Póker, 10 Quintilla
+    3: np.array([0, 1, -1, 2]),                          # 0 TD, 1 1P, 3 T
+}
+
+
+def _clasificar(bloque, digitos):
+    """Índice de mano (posición en MANOS[digitos]) de cada ri del bloque."""
+    enteros = np.floor(bloque * 10 ** digitos).astype(np.int64)
+    enteros = np.minimum(enteros, 10 ** digitos - 1)  # ri = 1.0 exacto
+    cifras = [(enteros // 10 ** j % 10).astype(np.int8) for j in range(digitos)]
+    pares_iguales = np.zeros(len(bloque), dtype=np.int8)
+    for a in range(digitos):
+        for b in range(a + 1, digitos):
+            pares_iguales += cifras[a] == cifras[b]
+    return CLASE_POR_PARES[digitos][pares_iguales]
+
+
+def prueba_poker(numeros, alpha=0.05, digitos=5):
+    """
+    Prueba de póker
+    H0: Los dígitos de los ri son independientes
+    H1: Los dígitos de los ri no son independientes
+    Cada ri aporta una mano con sus primeros 'digitos' decimales (3 o 5).
+    """
+    if digitos not in MANOS:
+        raise ValueError("La prueba de póker admite 3 o 5 dígitos")
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+    if n == 0:
+        raise ValueError("No hay números para analizar")
+    manos = MANOS[digitos]
+
+    frecuencias_obs = np.zeros(len(manos), dtype=np.int64)
+    for inicio in range(0, n, TAM_BLOQUE):
+        clases = _clasificar(numeros[inicio:inicio + TAM_BLOQUE], digitos)
+        frecuencias_obs += np.bincount(clases, minlength=len(manos))
+
+    probabilidades = np.array([p for _, p in manos])
+    frecuencias_esp = n * probabilidades
+    terminos = (frecuencias_obs - frecuencias_esp) ** 2 / frecuencias_esp
+    chi_cuadrado = float(terminos.sum())
+    chi_critico = cuantil_chi2(1 - alpha, len(manos) - 1)
+
+    tabla_frecuencias = [{
+        "mano": nombre,
+        "probabilidad": p,
+        "frecuencia_observada": int(fo),
+        "frecuencia_esperada": float(fe),
+        "termino_chi": float(t)
+    } for (nombre, p), fo, fe, t in zip(manos, frecuencias_obs, frecuencias_esp, terminos)]
+
+    return {
+        "estadistico": chi_cuadrado,
+        "valor_critico": chi_critico,
+        "acepta_hipotesis": bool(chi_cuadrado < chi_critico),
+        "tabla_frecuencias": tabla_frecuencias,
+        "n": n,
+        "digitos": digitos,
+        "alpha": alpha
+    }
@@ -0,0 +1,158 @@
+import numpy as np
+from scipy.stats import chi2
+
+from .cuantiles import cuantil_chi2
+
+
+def prueba_series(numeros, alpha=0.05, k=5):
+    """
+    Prueba de series (serial en 2 dimensiones)
+    H0: Los pares (ri, ri+1) están uniformemente distribuidos en [0, 1)²
+    H1: Los pares (ri, ri+1) no están uniformemente distribuidos
+    Los pares consecutivos (cerrando la secuencia en círculo) se cuentan en una
+    cuadrícula de k x k celdas. Como se solapan, su ψ²_2 no sigue χ²(k² - 1); el
+    estadístico es la diferencia de Good ∇ψ²_2 = ψ²_2 - ψ²_1 ~ χ²(k² - k).
+    """
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+    if n < 2:
+        raise ValueError("La prueba de series necesita al menos 2 números")
+    if k < 2:
+        raise ValueError("La cuadrícula necesita al menos 2 intervalos por eje")
+
+    marginal, pares = conteos_tuplas(numeros, k, 2)
+    frecuencias_obs = pares.reshape(k, k)
+    frecuencia_esp = n / (k * k)
+    psi_2 = float(np.sum((pares - frecuencia_esp) ** 2) / frecuencia_esp)
+    psi_1 = float(np.sum((marginal - n / k) ** 2) / (n / k))
+
+    gl = k * k - k
+    chi_cuadrado = psi_2 - psi_1
+    chi_critico = cuantil_chi2(1 - alpha, gl)
+
+    return {
+        "estadistico": chi_cuadrado,
+        "valor_critico": chi_critico,
+        "acepta_hipotesis": bool(chi_cuadrado < chi_critico),
+        "psi_cuadrado": psi_2,
+        "gl": gl,
+        "p_valor": float(chi2.sf(chi_cuadrado, gl)),
+        "frecuencias": frecuencias_obs,
+        "frecuencia_esperada": frecuencia_esp,
+        "n": n,
+        "k": k,
+        "alpha": alpha
+    }
+
+
+# Números por bloque al contar d-tuplas (como mínimo k^d_max, para que cada bincount rinda)
+TAM_BLOQUE = 1 << 20
+# Tope de celdas k^d del conteo de mayor dimensión
+MAX_CELDAS = 1 << 22
+# Frecuencia esperada mínima por celda al elegir k automáticamente
+FRECUENCIA_MINIMA = 5
+
+
+def _k_por_defecto(n, d_max):
+    """Mayor k con n/k^d_max >= FRECUENCIA_MINIMA (y k^d_max <= MAX_CELDAS)."""
+    k = max(2, int((n / FRECUENCIA_MINIMA) ** (1 / d_max)))
+    while k > 2 and (k ** d_max > MAX_CELDAS or n / k ** d_max < FRECUENCIA_MINIMA):
+        k -= 1
+    return k
+
+
+def conteos_tuplas(numeros, k, d_max, tam_bloque=TAM_BLOQUE):
+    """
+    Frecuencias de las d-tuplas solapadas (x_i, ..., x_{i+d-1}) para d = 1..d_max,
+    con la secuencia cerrada en círculo (n tuplas en cada dimensión). Las tuplas son
+    ventanas de una vista con strides (sin copias) y el id de celda se arma con
+    Horner: id_d = id_{d-1}·k + celda(x_{i+d-1}).
+    """
+    n = len(numeros)
+    tam_bloque = max(tam_bloque, k ** d_max)
+    conteos = [np.zeros(k ** d, dtype=np.int64) for d in range(1, d_max + 1)]
+    cola = np.minimum((np.asarray(numeros[:d_max - 1], dtype=np.float64) * k).astype(np.int64), k - 1)
+    for inicio in range(0, n, tam_bloque):
+        fin = min(inicio + tam_bloque, n)
+        # El bloque lleva los d_max - 1 números siguientes; el último, los primeros de la secuencia
+        trozo = np.asarray(numeros[inicio:fin + d_max - 1], dtype=np.float64)
+        celdas = np.minimum((trozo * k).astype(np.int64), k - 1)
+        faltan = (fin - inicio) + d_max - 1 - len(celdas)
+        if faltan:
+            celdas = np.concatenate((celdas, cola[:faltan]))
+        ventanas = np.lib.stride_tricks.sliding_window_view(celdas, d_max)
+        ids = ventanas[:, 0].copy()
+        conteos[0] += np.bincount(ids, minlength=k)
+        for j in range(1, d_max):
+            ids *= k
+            ids += ventanas[:, j]
+            conteos[j] += np.bincount(ids, minlength=k ** (j + 1))
+    return conteos
+
+
+def prueba_series_multidimensional(numeros, alpha=0.05, k=None, dimensiones=(2, 3, 4, 5)):
+    """
+    Prueba serial en d dimensiones (d-tuplas solapadas en una cuadrícula de k^d celdas)
+    H0: Las d-tuplas consecutivas están uniformemente distribuidas en [0, 1)^d
+    Como las tuplas se solapan, ψ²_d no sigue χ²(k^d - 1). Se reporta la diferencia de
+    Good ∇ψ²_d = ψ²_d - ψ²_{d-1} ~ χ²(k^d - k^{d-1}) y se decide con la segunda,
+    ∇²ψ²_d = ψ²_d - 2ψ²_{d-1} + ψ²_{d-2} ~ χ²(k^{d-2}(k-1)²) (ψ²_1 ~ χ²(k-1) para d = 1),
+    que es asintóticamente independiente entre dimensiones: cada una se prueba a
+    1 - (1 - α)^(1/D) (Šidák) y el p-valor de la familia es exacto.
+    """
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+    dimensiones = sorted(set(int(d) for d in dimensiones))
+    if not dimensiones or dimensiones[0] < 1:
+        raise ValueError("Las dimensiones deben ser enteros positivos")
+    d_max = dimensiones[-1]
+    if n < d_max:
+        raise ValueError("Hay menos números que la dimensión máxima")
+    k = _k_por_defecto(n, d_max) if k is None else k
+    if k < 2:
+        raise ValueError("La cuadrícula necesita al menos 2 intervalos por eje")
+    if k ** d_max > MAX_CELDAS:
+        raise ValueError(f"k^d = {k ** d_max} celdas supera el máximo ({MAX_CELDAS})")
+
+    conteos = conteos_tuplas(numeros, k, d_max)
+    # ψ²_d de cada dimensión (ψ²_0 = ψ²_{-1} = 0)
+    psi = [0.0, 0.0]
+    for d, frecuencias in enumerate(conteos, start=1):
+        esperada = n / k ** d
+        psi.append(float(np.sum((frecuencias - esperada) ** 2) / esperada))
+
+    alpha_dimension = 1 - (1 - alpha) ** (1 / len(dimensiones))
+    tabla = []
+    for d in dimensiones:
+        psi_d, psi_1, psi_2 = psi[d + 1], psi[d], psi[d - 1]
+        gl = k - 1 if d == 1 else k ** (d - 2) * (k - 1) ** 2
+        chi_cuadrado = psi_d - 2 * psi_1 + psi_2
+        chi_critico = cuantil_chi2(1 - alpha_dimension, gl)
+        tabla.append({
+            "d": d,
+            "celdas": k ** d,
+            "psi_cuadrado": psi_d,
+            "chi_diferencia": psi_d - psi_1,
+            "gl_diferencia": k ** d - k ** (d - 1),
+            "chi_cuadrado": chi_cuadrado,
+            "gl": gl,
+            "chi_critico": chi_critico,
+            "p_valor": float(chi2.sf(chi_cuadrado, gl)),
+            "acepta_hipotesis": bool(chi_cuadrado < chi_critico)
+        })
+
+    # La dimensión con menor p-valor resume la prueba; su p-valor corregido es el de la familia
+    peor = min(tabla, key=lambda fila: fila["p_valor"])
+    return {
+        "estadistico": peor["chi_cuadrado"],
+        "valor_critico": peor["chi_critico"],
+        "acepta_hipotesis": all(fila["acepta_hipotesis"] for fila in tabla),
+        "dimension": peor["d"],
+        "p_valor": float(1 - (1 - peor["p_valor"]) ** len(tabla)),
+        "tabla": tabla,
+        "frecuencia_esperada": n / k ** d_max,
+        "n": n,
+        "k": k,
+        "alpha": alpha,
+        "alpha_dimension": alpha_dimension
+    }
@@ -1,7 +1,8 @@
 import math
-import scipy.stats as stats
 import numpy as np
 
+from .cuantiles import cuantil_chi2
+
 def prueba_uniformidad(numeros, alpha=0.05, k=10):
     """
     Prueba de uniformidad (Chi-cuadrado) según las fórmulas proporcionadas
@@ -15,6 +16,11 @@ def prueba_uniformidad(numeros, alpha=0.05, k=10):
     
     # Calcular frecuencias observadas
     frecuencias_obs, _ = np.histogram(numeros, bins=intervalos)
+    return resultado_uniformidad(frecuencias_obs, n, alpha, k)
+
+def resultado_uniformidad(frecuencias_obs, n, alpha=0.05, k=10):
+    """Tabla χ², valor crítico y decisión a partir de las k frecuencias observadas."""
+    intervalos = np.linspace(0, 1, k + 1)
     
     # Frecuencia esperada
     frecuencia_esp = n / k
@@ -43,7 +49,7 @@ def prueba_uniformidad(numeros, alpha=0.05, k=10):
         })
     
     # Calcular chi-cuadrado crítico
-    chi_critico = stats.chi2.ppf(1 - alpha, k - 1)
+    chi_critico = cuantil_chi2(1 - alpha, k - 1)
     
     # Verificar hipótesis
     acepta_hipotesis = chi_cuadrado < chi_critico
@@ -56,4 +62,56 @@ def prueba_uniformidad(numeros, alpha=0.05, k=10):
         "n": n,
         "k": k,
         "alpha": alpha
-    }
\ No newline at end of file
+    }
+
+
+# Resoluciones por defecto del barrido de k (de 10 a 10^4 intervalos)
+K_MULTIRESOLUCION = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+def frecuencias_ordenados(ordenados, k):
+    """
+    Frecuencias de los k intervalos de prueba_uniformidad a partir de los datos
+    ya ordenados: 2 búsquedas binarias por borde en lugar de recorrer los datos.
+    Mismos intervalos que np.histogram: [e_i, e_i+1), el último cerrado en 1 y
+    los valores fuera de [0, 1] no cuentan.
+    """
+    intervalos = np.linspace(0, 1, k + 1)
+    posiciones = np.searchsorted(ordenados, intervalos, side="left")
+    posiciones[-1] = np.searchsorted(ordenados, intervalos[-1], side="right")
+    return np.diff(posiciones)
+
+
+def prueba_uniformidad_multiple(numeros, ks=K_MULTIRESOLUCION, alpha=0.05, ordenados=False):
+    """
+    Prueba χ² de uniformidad para varios k con un solo ordenamiento de los datos
+    (ordenados=True si ya vienen ordenados). Devuelve una fila por k con el
+    estadístico, el valor crítico y la decisión, iguales a los de prueba_uniformidad.
+    """
+    ks = [int(k) for k in ks]
+    if not ks or min(ks) < 2:
+        raise ValueError("Cada k debe ser al menos 2")
+    numeros = np.asarray(numeros, dtype=np.float64)
+    n = len(numeros)
+    if n == 0:
+        raise ValueError("No hay números para analizar")
+    datos = numeros if ordenados else np.sort(numeros)
+    
+    tabla = []
+    for k in ks:
+        chi_critico = cuantil_chi2(1 - alpha, k - 1)
+        frecuencia_esp = n / k
+        chi_cuadrado = float(np.sum(np.square(frecuencias_ordenados(datos, k) - frecuencia_esp)) / frecuencia_esp)
+        tabla.append({
+            "k": k,
+            "chi_cuadrado": chi_cuadrado,
+            "chi_critico": chi_critico,
+            "acepta_hipotesis": bool(chi_cuadrado < chi_critico)
+        })
+    
+    return {
+        "tabla": tabla,
+        "acepta_todas": all(fila["acepta_hipotesis"] for fila in tabla),
+        "n": n,
+        "alpha": alpha
+    }
@@ -1,31 +1,74 @@
 import math
-import scipy.stats as stats
 import numpy as np
 
+from .cuantiles import cuantil_chi2
+
+# Valores por bloque: el bloque cabe en caché, así que sus dos recorridos no vuelven a leer memoria
+TAM_BLOQUE = 1 << 16
+
+
+def combinar_momentos(n_a, media_a, cuadrados_a, n_b, media_b, cuadrados_b):
+    """
+    Une (n, media, Σ(x - media)²) de dos particiones con la fórmula de Chan et al.
+    (estable, sin la cancelación de Σx² - n·media²).
+    """
+    total = n_a + n_b
+    if total == 0:
+        return 0, 0.0, 0.0
+    delta = media_b - media_a
+    media = media_a + delta * n_b / total
+    cuadrados = cuadrados_a + cuadrados_b + delta * delta * n_a * n_b / total
+    return total, media, cuadrados
+
+
+def momentos_bloque(bloque):
+    """(n, media, Σ(x - media)²) de un bloque, convertido a float64 si hace falta."""
+    m = len(bloque)
+    if m == 0:
+        return 0, 0.0, 0.0
+    bloque = np.asarray(bloque, dtype=np.float64)
+    media = float(np.sum(bloque)) / m
+    return m, media, float(np.sum(np.square(bloque - media)))
+
+
+def media_y_suma_cuadrados(numeros, tam_bloque=TAM_BLOQUE):
+    """(media, Σ(x - media)²) en una sola lectura de los datos, bloque a bloque."""
+    n, media, suma_cuadrados = 0, 0.0, 0.0
+    for inicio in range(0, len(numeros), tam_bloque):
+        n, media, suma_cuadrados = combinar_momentos(
+            n, media, suma_cuadrados, *momentos_bloque(numeros[inicio:inicio + tam_bloque]))
+    return media, suma_cuadrados
+
+
 def prueba_varianza(numeros, alpha=0.05):
     """
     Prueba de varianza 
     H0: σ² = 1/12
     H1: σ² ≠ 1/12
+    Acepta listas, arrays o arrays mapeados en memoria (np.memmap).
     """
+    if not isinstance(numeros, np.ndarray):
+        numeros = np.asarray(numeros, dtype=np.float64)
     n = len(numeros)
     
-    # Calcular la media
-    media = sum(numeros) / n
-    
-    # Calcular la varianza (V(r))
-    suma_cuadrados = sum((x - media) ** 2 for x in numeros)
+    # Calcular la media y la varianza (V(r)) en una pasada (bloque a bloque, sin copiar un np.memmap)
+    media, suma_cuadrados = media_y_suma_cuadrados(numeros)
+    return resultado_varianza(suma_cuadrados, n, alpha)
+
+
+def resultado_varianza(suma_cuadrados, n, alpha=0.05):
+    """Límites de aceptación y decisión para Σ(x - media)² ya calculada sobre n valores."""
     varianza = suma_cuadrados / (n - 1)
     
     # Calcular límites de aceptación
-    chi2_alpha_2 = stats.chi2.ppf(1 - alpha/2, n-1)
-    chi2_1_minus_alpha_2 = stats.chi2.ppf(alpha/2, n-1)
+    chi2_alpha_2 = cuantil_chi2(1 - alpha/2, n-1)
+    chi2_1_minus_alpha_2 = cuantil_chi2(alpha/2, n-1)
     
     limite_inferior = chi2_1_minus_alpha_2 / (12 * (n - 1))
     limite_superior = chi2_alpha_2 / (12 * (n - 1))
     
     # Verificar hipótesis
-    acepta_hipotesis = limite_inferior <= varianza <= limite_superior
+    acepta_hipotesis = bool(limite_inferior <= varianza <= limite_superior)
     
     return {
         "varianza": varianza,
@@ -36,4 +79,4 @@ def prueba_varianza(numeros, alpha=0.05):
         "suma_cuadrados": suma_cuadrados,
         "chi2_alpha_2": chi2_alpha_2,
         "chi2_1_minus_alpha_2": chi2_1_minus_alpha_2
-    }
\ No newline at end of file
+    }
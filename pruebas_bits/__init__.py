@@ -0,0 +1,7 @@
+from .bits import CadenaBits, bits_desde_enteros, bits_desde_ri
+from .frecuencia import prueba_frecuencia, prueba_frecuencia_bloques
+from .corridas import prueba_corridas, prueba_racha_mas_larga
+from .sumas_acumuladas import prueba_sumas_acumuladas
+from .espectral import prueba_espectral
+from .entropia import prueba_entropia_aproximada
+from .bateria import BATERIA_BITS, ejecutar_bateria_bits
@@ -0,0 +1,62 @@
+# ------------------ BATERÍA DE PRUEBAS DE BITS ------------------
+# Subconjunto de NIST SP 800-22 sobre una cadena de bits empaquetada. Igual que
+# pruebas.bateria, las pruebas se reparten en un pool de hilos sobre la misma cadena.
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .bits import CadenaBits, bits_desde_ri
+from .corridas import prueba_corridas, prueba_racha_mas_larga
+from .entropia import prueba_entropia_aproximada
+from .espectral import prueba_espectral
+from .frecuencia import prueba_frecuencia, prueba_frecuencia_bloques
+from .sumas_acumuladas import prueba_sumas_acumuladas
+
+# Nombre -> función(cadena, alpha, **opciones)
+BATERIA_BITS = {
+    "frecuencia": prueba_frecuencia,
+    "frecuencia_bloques": prueba_frecuencia_bloques,
+    "corridas": prueba_corridas,
+    "racha_mas_larga": prueba_racha_mas_larga,
+    "sumas_acumuladas": prueba_sumas_acumuladas,
+    "espectral": prueba_espectral,
+    "entropia_aproximada": prueba_entropia_aproximada,
+}
+
+
+def _ejecutar(nombre, cadena, alpha, opciones):
+    inicio = time.perf_counter()
+    try:
+        resultado = BATERIA_BITS[nombre](cadena, alpha, **opciones)
+    except ValueError as e:
+        resultado = {"error": str(e), "p_valor": None, "acepta_hipotesis": False}
+    resultado["segundos"] = time.perf_counter() - inicio
+    return resultado
+
+
+def ejecutar_bateria_bits(cadena, pruebas=None, alpha=0.01, opciones=None, hilos=None, bits_por_numero=32) -> dict:
+    """
+    Aplica las pruebas de bits indicadas (por defecto todas). cadena puede ser una
+    CadenaBits o una secuencia Ri, que se convierte con bits_desde_ri.
+    """
+    if not isinstance(cadena, CadenaBits):
+        cadena = bits_desde_ri(cadena, bits_por_numero)
+    pruebas = list(BATERIA_BITS) if pruebas is None else list(pruebas)
+    desconocidas = [p for p in pruebas if p not in BATERIA_BITS]
+    if desconocidas:
+        raise ValueError(f"Pruebas desconocidas: {', '.join(desconocidas)}")
+    opciones = opciones or {}
+    hilos = hilos or min(len(pruebas), os.cpu_count() or 1)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(hilos, 1)) as pool:
+        futuros = {p: pool.submit(_ejecutar, p, cadena, alpha, opciones.get(p, {})) for p in pruebas}
+        resultados = {p: futuro.result() for p, futuro in futuros.items()}
+
+    return {
+        "pruebas": resultados,
+        "acepta_todas": all(r["acepta_hipotesis"] for r in resultados.values()),
+        "bits": len(cadena),
+        "alpha": alpha,
+        "segundos": time.perf_counter() - inicio
+    }
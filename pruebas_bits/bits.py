@@ -0,0 +1,72 @@
+# ------------------ CADENAS DE BITS ------------------
+# Convierte secuencias Ri (o enteros Xi) en cadenas de bits empaquetadas (8 bits
+# por byte, el más significativo primero, como np.packbits). Las pruebas cuentan
+# unos con una tabla de popcount por byte y solo desempaquetan cuando necesitan
+# cada bit (corridas, FFT, patrones).
+import numpy as np
+
+# Cantidad de unos de cada valor de byte
+POPCOUNT = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+
+class CadenaBits:
+    def __init__(self, empaquetados, n: int = None):
+        """empaquetados: uint8 de np.packbits; n: bits válidos (por defecto 8 por byte)."""
+        self.empaquetados = np.ascontiguousarray(empaquetados, dtype=np.uint8)
+        maximo = 8 * len(self.empaquetados)
+        self.n = maximo if n is None else int(n)
+        if not 0 <= self.n <= maximo:
+            raise ValueError("n no puede superar 8 bits por byte")
+
+    def __len__(self):
+        return self.n
+
+    @classmethod
+    def desde_bits(cls, bits) -> "CadenaBits":
+        """Desde una secuencia de 0 y 1 (o un texto '0101...')."""
+        if isinstance(bits, str):
+            bits = np.frombuffer(bits.encode("ascii"), dtype=np.uint8) - ord("0")
+        bits = np.asarray(bits, dtype=np.uint8)
+        if bits.size and bits.max() > 1:
+            raise ValueError("Los bits deben ser 0 o 1")
+        return cls(np.packbits(bits), len(bits))
+
+    def bits(self, inicio: int = 0, fin: int = None) -> np.ndarray:
+        """Bits inicio..fin-1 desempaquetados (uint8 de 0 y 1)."""
+        fin = self.n if fin is None else min(fin, self.n)
+        primero = inicio // 8
+        bits = np.unpackbits(self.empaquetados[primero:-(-fin // 8)])
+        return bits[inicio - 8 * primero:fin - 8 * primero]
+
+    def unos(self) -> int:
+        completos = self.n // 8
+        total = int(POPCOUNT[self.empaquetados[:completos]].sum(dtype=np.int64))
+        if self.n % 8:
+            total += int(self.bits(8 * completos).sum())
+        return total
+
+
+def bits_desde_enteros(xi, bits_por_numero: int = 32) -> CadenaBits:
+    """Los bits_por_numero bits bajos de cada entero, en orden (el más significativo primero)."""
+    if not 1 <= bits_por_numero <= 64:
+        raise ValueError("bits_por_numero debe estar entre 1 y 64")
+    xi = np.asarray(xi).astype(np.uint64)
+    if bits_por_numero % 8 == 0:
+        # Bytes big-endian de cada entero y se descartan los bytes altos que sobran
+        bytes_ = xi.astype(">u8").view(np.uint8).reshape(-1, 8)[:, 8 - bits_por_numero // 8:]
+        return CadenaBits(bytes_.ravel())
+    desplazamientos = np.arange(bits_por_numero - 1, -1, -1, dtype=np.uint64)
+    matriz = ((xi[:, None] >> desplazamientos) & np.uint64(1)).astype(np.uint8)
+    return CadenaBits(np.packbits(matriz.ravel()), matriz.size)
+
+
+def bits_desde_ri(ri, bits_por_numero: int = 32) -> CadenaBits:
+    """Los primeros bits_por_numero bits de la fracción de cada Ri (floor(Ri * 2^b)), en orden."""
+    if not 1 <= bits_por_numero <= 52:
+        raise ValueError("bits_por_numero debe estar entre 1 y 52 (precisión de un float64)")
+    ri = np.asarray(ri, dtype=np.float64)
+    if ri.size and (ri.min() < 0 or ri.max() > 1):
+        raise ValueError("Los Ri deben estar en [0, 1]")
+    tope = (1 << bits_por_numero) - 1
+    enteros = np.minimum(np.floor(ri * 2.0 ** bits_por_numero), tope).astype(np.uint64)
+    return bits_desde_enteros(enteros, bits_por_numero)
@@ -0,0 +1,84 @@
+import math
+import numpy as np
+from scipy.special import gammaincc
+
+# Parámetros de la prueba de la racha más larga según n (SP 800-22, sección 2.4):
+# (n mínimo, M, clases v desde "<= primera" hasta ">= última", probabilidades π)
+RACHA_MAS_LARGA = [
+    (750000, 10000, (10, 16), (0.0882, 0.2092, 0.2483, 0.1933, 0.1208, 0.0675, 0.0727)),
+    (6272, 128, (4, 9), (0.1174, 0.2430, 0.2493, 0.1752, 0.1027, 0.1124)),
+    (128, 8, (1, 4), (0.2148, 0.3672, 0.2305, 0.1875)),
+]
+
+
+def prueba_corridas(cadena, alpha=0.01):
+    """
+    Prueba de corridas
+    H0: Las rachas de unos y ceros tienen la longitud esperada para bits independientes
+    Requiere que la prueba de frecuencia pase (|π - 1/2| < 2/√n).
+    """
+    n = len(cadena)
+    if n < 2:
+        raise ValueError("La prueba de corridas necesita al menos 2 bits")
+    pi = cadena.unos() / n
+    tau = 2 / math.sqrt(n)
+    if abs(pi - 0.5) >= tau:
+        # No se cumple el requisito: la prueba no se aplica y el p-valor es 0
+        return {"p_valor": 0.0, "acepta_hipotesis": False, "corridas": None, "pi": pi, "n": n, "alpha": alpha}
+
+    bits = cadena.bits()
+    corridas = int(np.count_nonzero(bits[1:] != bits[:-1])) + 1
+    p_valor = math.erfc(abs(corridas - 2 * n * pi * (1 - pi)) / (2 * math.sqrt(2 * n) * pi * (1 - pi)))
+    return {
+        "p_valor": p_valor,
+        "acepta_hipotesis": p_valor >= alpha,
+        "corridas": corridas,
+        "pi": pi,
+        "n": n,
+        "alpha": alpha
+    }
+
+
+def rachas_mas_largas(bloques):
+    """Racha más larga de unos de cada fila de una matriz de bits (N x M), sin recorrer bit a bit."""
+    N, M = bloques.shape
+    # Con un 0 agregado a cada lado, la racha más larga es el mayor hueco entre ceros de la fila
+    con_bordes = np.zeros((N, M + 2), dtype=np.uint8)
+    con_bordes[:, 1:-1] = bloques
+    ceros = np.flatnonzero(con_bordes.ravel() == 0)
+    huecos = np.diff(ceros) - 1
+    # Cada fila empieza en su cero inicial: ahí comienza su tramo de huecos
+    inicios = np.searchsorted(ceros[:-1], np.arange(N) * (M + 2))
+    return np.maximum.reduceat(huecos, inicios)
+
+
+def prueba_racha_mas_larga(cadena, alpha=0.01):
+    """
+    Prueba de la racha más larga de unos en un bloque
+    H0: La racha más larga de cada bloque de M bits tiene la distribución de bits independientes
+    """
+    n = len(cadena)
+    for n_minimo, M, (menor, mayor), probabilidades in RACHA_MAS_LARGA:
+        if n >= n_minimo:
+            break
+    else:
+        raise ValueError("La prueba de la racha más larga necesita al menos 128 bits")
+    N = n // M
+    rachas = rachas_mas_largas(cadena.bits(0, N * M).reshape(N, M))
+
+    # Clases: <= menor, menor+1, ..., >= mayor
+    v = np.bincount(np.clip(rachas, menor, mayor) - menor, minlength=mayor - menor + 1)
+    esperadas = N * np.array(probabilidades)
+    chi_cuadrado = float(np.sum((v - esperadas) ** 2 / esperadas))
+    K = len(probabilidades) - 1
+    p_valor = float(gammaincc(K / 2, chi_cuadrado / 2))
+    return {
+        "p_valor": p_valor,
+        "acepta_hipotesis": p_valor >= alpha,
+        "chi_cuadrado": chi_cuadrado,
+        "frecuencias": v,
+        "bloques": N,
+        "M": M,
+        "n": n,
+        "alpha": alpha
+    }
@@ -0,0 +1,50 @@
+import math
+import numpy as np
+from scipy.special import gammaincc
+
+
+def _codigos(bits, m):
+    """Código entero del patrón de m bits que empieza en cada posición (la cadena se cierra en círculo)."""
+    n = len(bits)
+    circular = np.concatenate((bits, bits[:m - 1])).astype(np.uint32)
+    codigos = np.zeros(n, dtype=np.uint32)
+    for j in range(m):
+        codigos <<= 1
+        codigos |= circular[j:j + n]
+    return codigos
+
+
+def _phi(codigos, m):
+    """Σ C_i ln C_i sobre las frecuencias relativas C_i de los 2^m patrones."""
+    c = np.bincount(codigos, minlength=1 << m) / len(codigos)
+    c = c[c > 0]
+    return float(np.sum(c * np.log(c)))
+
+
+def prueba_entropia_aproximada(cadena, alpha=0.01, m=None):
+    """
+    Prueba de entropía aproximada
+    H0: Los patrones solapados de m y m+1 bits aparecen con la frecuencia de bits independientes
+    Por defecto m = floor(log2 n) - 6 (se recomienda m < log2 n - 5), con un máximo de 10.
+    """
+    n = len(cadena)
+    if m is None:
+        m = max(1, min(10, int(math.log2(max(n, 2))) - 6))
+    if m < 1 or m + 1 > 20:
+        raise ValueError("m debe estar entre 1 y 19")
+    if n <= m + 1:
+        raise ValueError("La cadena es muy corta para el m elegido")
+    # Los patrones de m bits son los m+1 bits de cada posición sin el último: se arman una sola vez
+    codigos = _codigos(cadena.bits(), m + 1)
+    apen = _phi(codigos >> 1, m) - _phi(codigos, m + 1)
+    chi_cuadrado = 2 * n * (math.log(2) - apen)
+    p_valor = float(gammaincc(2 ** (m - 1), chi_cuadrado / 2))
+    return {
+        "p_valor": p_valor,
+        "acepta_hipotesis": p_valor >= alpha,
+        "entropia_aproximada": apen,
+        "chi_cuadrado": chi_cuadrado,
+        "m": m,
+        "n": n,
+        "alpha": alpha
+    }
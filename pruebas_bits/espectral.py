@@ -0,0 +1,30 @@
+import math
+import numpy as np
+
+
+def prueba_espectral(cadena, alpha=0.01):
+    """
+    Prueba espectral (transformada discreta de Fourier)
+    H0: No hay componentes periódicas: el 95 % de los picos de |DFT| está bajo el umbral T
+    """
+    n = len(cadena)
+    if n < 2:
+        raise ValueError("La prueba espectral necesita al menos 2 bits")
+    x = 2.0 * cadena.bits() - 1.0
+    modulos = np.abs(np.fft.rfft(x)[:n // 2])
+
+    umbral = math.sqrt(math.log(1 / 0.05) * n)
+    esperados = 0.95 * n / 2
+    observados = int(np.count_nonzero(modulos < umbral))
+    d = (observados - esperados) / math.sqrt(n * 0.95 * 0.05 / 4)
+    p_valor = math.erfc(abs(d) / math.sqrt(2))
+    return {
+        "p_valor": p_valor,
+        "acepta_hipotesis": p_valor >= alpha,
+        "d": d,
+        "picos_bajo_umbral": observados,
+        "picos_esperados": esperados,
+        "umbral": umbral,
+        "n": n,
+        "alpha": alpha
+    }
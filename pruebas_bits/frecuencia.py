@@ -0,0 +1,55 @@
+import math
+import numpy as np
+from scipy.special import gammaincc
+
+from .bits import POPCOUNT
+
+
+def prueba_frecuencia(cadena, alpha=0.01):
+    """
+    Prueba de frecuencia (monobit)
+    H0: Los bits son independientes y P(1) = 1/2
+    Compara la cantidad de unos con n/2.
+    """
+    n = len(cadena)
+    if n == 0:
+        raise ValueError("La cadena de bits está vacía")
+    suma = 2 * cadena.unos() - n
+    s_obs = abs(suma) / math.sqrt(n)
+    p_valor = math.erfc(s_obs / math.sqrt(2))
+    return {
+        "p_valor": p_valor,
+        "acepta_hipotesis": p_valor >= alpha,
+        "suma": suma,
+        "s_obs": s_obs,
+        "n": n,
+        "alpha": alpha
+    }
+
+
+def prueba_frecuencia_bloques(cadena, alpha=0.01, M=128):
+    """
+    Prueba de frecuencia por bloques
+    H0: La proporción de unos en cada bloque de M bits es 1/2
+    """
+    n = len(cadena)
+    N = n // M
+    if N == 0:
+        raise ValueError("La cadena tiene menos de M bits")
+    if M % 8 == 0:
+        # Popcount por byte y suma por bloque, sin desempaquetar
+        unos = POPCOUNT[cadena.empaquetados[:N * M // 8]].reshape(N, M // 8).sum(axis=1, dtype=np.int64)
+    else:
+        unos = cadena.bits(0, N * M).reshape(N, M).sum(axis=1, dtype=np.int64)
+    pi = unos / M
+    chi_cuadrado = float(4 * M * np.sum((pi - 0.5) ** 2))
+    p_valor = float(gammaincc(N / 2, chi_cuadrado / 2))
+    return {
+        "p_valor": p_valor,
+        "acepta_hipotesis": p_valor >= alpha,
+        "chi_cuadrado": chi_cuadrado,
+        "bloques": N,
+        "M": M,
+        "n": n,
+        "alpha": alpha
+    }
@@ -0,0 +1,43 @@
+import math
+import numpy as np
+from scipy.special import ndtr
+
+
+def _p_valor_sumas(z, n):
+    """p-valor de la excursión máxima z de la caminata de n pasos (SP 800-22, sección 2.13)."""
+    raiz = math.sqrt(n)
+    # Límites de k truncados hacia cero, como en la implementación de referencia
+    fin = int((n / z - 1) / 4)
+    k = np.arange(int((-n / z + 1) / 4), fin + 1)
+    suma1 = np.sum(ndtr((4 * k + 1) * z / raiz) - ndtr((4 * k - 1) * z / raiz))
+    k = np.arange(int((-n / z - 3) / 4), fin + 1)
+    suma2 = np.sum(ndtr((4 * k + 3) * z / raiz) - ndtr((4 * k + 1) * z / raiz))
+    return float(1 - suma1 + suma2)
+
+
+def prueba_sumas_acumuladas(cadena, alpha=0.01):
+    """
+    Prueba de sumas acumuladas (cusum), hacia adelante y hacia atrás
+    H0: La caminata ±1 definida por los bits no se aleja de 0 más de lo esperado
+    Se acepta si ambos sentidos pasan.
+    """
+    n = len(cadena)
+    if n == 0:
+        raise ValueError("La cadena de bits está vacía")
+    pasos = 2 * cadena.bits().astype(np.int64) - 1
+    sumas = np.cumsum(pasos)
+    z_adelante = int(np.max(np.abs(sumas)))
+    # Hacia atrás: S'_k = S_n - S_{n-k}, así que no hace falta invertir la cadena
+    z_atras = int(np.max(np.abs(sumas[-1] - np.concatenate(([0], sumas[:-1])))))
+    p_adelante = _p_valor_sumas(z_adelante, n)
+    p_atras = _p_valor_sumas(z_atras, n)
+    return {
+        "p_valor": min(p_adelante, p_atras),
+        "acepta_hipotesis": p_adelante >= alpha and p_atras >= alpha,
+        "p_valor_adelante": p_adelante,
+        "p_valor_atras": p_atras,
+        "z_adelante": z_adelante,
+        "z_atras": z_atras,
+        "n": n,
+        "alpha": alpha
+    }
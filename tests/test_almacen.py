@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from utils.almacen import AlmacenSecuencias
+
+
+def test_publicar_y_obtener_comparten_el_mismo_array():
+    almacen = AlmacenSecuencias()
+    ri = np.linspace(0, 1, 100)
+    publicada = almacen.publicar("PCG32", ri, semilla=42)
+    assert publicada is ri and almacen.obtener("PCG32") is ri
+    assert np.shares_memory(almacen.obtener("PCG32"), ri)
+    assert not ri.flags.writeable
+    assert almacen.metadatos("PCG32") == {"semilla": 42}
+    assert almacen.obtener("LCG") is None and almacen.metadatos("LCG") == {}
+
+
+def test_orden_reemplazo_y_eliminacion_notifican():
+    almacen = AlmacenSecuencias()
+    avisos = []
+    almacen.suscribir(lambda: avisos.append(almacen.nombres()))
+    almacen.publicar("A", [0.1, 0.2])
+    almacen.publicar("B", [0.3])
+    almacen.publicar("A", [0.5])
+    assert almacen.nombres() == ["B", "A"] and almacen.ultimo() == "A"
+    assert np.array_equal(almacen.obtener("A"), [0.5])
+    almacen.eliminar("B")
+    almacen.eliminar("B")
+    assert "B" not in almacen and len(almacen) == 1
+    assert avisos == [["A"], ["A", "B"], ["B", "A"], ["A"]]
+
+
+def test_publicar_rechaza_matrices():
+    with pytest.raises(ValueError):
+        AlmacenSecuencias().publicar("M", np.zeros((2, 2)))
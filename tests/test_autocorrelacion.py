@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from generators.multiplicador_constante import MultiplicadorConstante
+from pruebas.autocorrelacion import (
+    analisis_autocorrelacion, autocorrelaciones_fft, periodograma, prueba_autocorrelacion
+)
+from pruebas.cuantiles import cuantil_chi2
+
+
+@pytest.mark.parametrize("n", [2, 3, 17, 1000, 1031])
+def test_autocorrelaciones_fft_coinciden_con_np_correlate(n):
+    numeros = np.random.default_rng(n).random(n)
+    x = numeros - numeros.mean()
+    directa = np.correlate(x, x, mode="full")[n - 1:]
+    assert np.allclose(autocorrelaciones_fft(numeros), directa / directa[0], atol=1e-12)
+    assert len(autocorrelaciones_fft(numeros, max_rezago=1)) == 2
+
+
+def test_ljung_box_y_periodograma_con_la_formula_directa():
+    numeros = np.random.default_rng(22).random(600)
+    n, h = len(numeros), 12
+    x = numeros - numeros.mean()
+    rho = np.array([np.dot(x[:n - k], x[k:]) for k in range(h + 1)]) / np.dot(x, x)
+    q = n * (n + 2) * sum(rho[k] ** 2 / (n - k) for k in range(1, h + 1))
+    resultado = analisis_autocorrelacion(numeros, rezagos_ljung_box=h)
+    assert resultado["estadistico"] == pytest.approx(q)
+    assert resultado["valor_critico"] == cuantil_chi2(0.95, h)
+    assert resultado["acepta_hipotesis"] == (q < cuantil_chi2(0.95, h))
+
+    frecuencias, potencias = periodograma(numeros)
+    t = np.arange(n)
+    for j in (1, 7, n // 2):
+        assert frecuencias[j - 1] == pytest.approx(j / n)
+        assert potencias[j - 1] == pytest.approx(abs(np.sum(x * np.exp(-2j * np.pi * j * t / n))) ** 2 / n)
+
+
+def test_analisis_detecta_el_periodo_de_un_ciclo_corto():
+    ciclo = np.random.default_rng(3).random(37)
+    resultado = analisis_autocorrelacion(np.tile(ciclo, 40))
+    assert resultado["periodo"] == 37
+    assert not resultado["acepta_hipotesis"]
+    assert analisis_autocorrelacion(np.random.default_rng(4).random(2000))["periodo"] is None
+    # La cola previa al ciclo baja ρ_p en ~cola/n: con n grande queda dentro de TOLERANCIA_CICLO
+    _, ri = MultiplicadorConstante(9803, 6965, 20000).generar_array()
+    xi = np.round(ri * 10 ** 4).astype(int)
+    inicio = next(i for i in range(len(xi)) if xi[i] in xi[:i])
+    periodo = inicio - int(np.flatnonzero(xi[:inicio] == xi[inicio])[0])
+    assert analisis_autocorrelacion(ri)["periodo"] == periodo
+
+
+def test_prueba_autocorrelacion_con_la_sumatoria():
+    numeros = np.random.default_rng(5).random(200)
+    i, m = 3, 4
+    M = (len(numeros) - i) // m - 1
+    suma = sum(numeros[i - 1 + k * m] * numeros[i - 1 + (k + 1) * m] for k in range(M + 1))
+    assert prueba_autocorrelacion(numeros, i=i, m=m)["rho"] == pytest.approx(suma / (M + 1) - 0.25)
+    with pytest.raises(ValueError):
+        autocorrelaciones_fft(np.full(10, 0.5))
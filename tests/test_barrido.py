@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from generators.barrido import barrer_cuadrados_medios, barrer_multiplicador_constante, barrer_productos_medios
+from generators.cuadrados_medios import CuadradosMedios
+from generators.multiplicador_constante import MultiplicadorConstante
+from generators.productos_medios import ProductosMedios
+from pruebas import prueba_medias, prueba_uniformidad, prueba_varianza
+
+
+def _comparar_con_pruebas(fila, ri):
+    assert np.isclose(fila["media"], prueba_medias(ri)["media"])
+    assert np.isclose(fila["varianza"], prueba_varianza(ri)["varianza"])
+    assert np.isclose(fila["chi_cuadrado"], prueba_uniformidad(ri)["chi_cuadrado"])
+    assert fila["acepta_uniformidad"] == prueba_uniformidad(ri)["acepta_hipotesis"]
+
+
+@pytest.mark.parametrize("d, desde, hasta", [(4, 5700, 5760), (2, 10, 99), (6, 314100, 314160)])
+def test_barrido_cuadrados_medios_coincide_con_el_generador(d, desde, hasta):
+    res = barrer_cuadrados_medios(n=50, desde=desde, hasta=hasta, usar_cache=False, d=d)
+    assert sorted(res["semilla"].tolist()) == list(range(desde, hasta + 1))
+    assert (np.diff(res["distintos"]) <= 0).all()  # Ordenado por iteraciones sin repetir
+    for i in range(0, len(res["semilla"]), 7):
+        semilla = int(res["semilla"][i])
+        generador = CuadradosMedios(semilla, 50, d=d)
+        diagnostico = generador.diagnostico()
+        assert res["cola"][i] == diagnostico["cola"] and res["periodo"][i] == diagnostico["longitud_ciclo"]
+        _comparar_con_pruebas({clave: v[i] for clave, v in res.items()}, generador.generar_array()[1])
+
+
+def test_barrido_cuadrados_medios_rechaza_d_impar_o_grande():
+    with pytest.raises(ValueError):
+        barrer_cuadrados_medios(usar_cache=False, d=5)
+    with pytest.raises(ValueError):
+        barrer_cuadrados_medios(usar_cache=False, d=8)
+
+
+def test_barrido_productos_y_multiplicador_coinciden_con_los_generadores():
+    res = barrer_productos_medios(n=40, semillas1=(5000, 5004), semillas2=(5730, 5734), procesos=1,
+                                  usar_cache=False)
+    assert len(res["semilla1"]) == 25
+    for i in range(0, 25, 6):
+        ri = ProductosMedios(int(res["semilla1"][i]), int(res["semilla2"][i]), 40).generar_array()[1]
+        _comparar_con_pruebas({clave: v[i] for clave, v in res.items()}, ri)
+
+    res = barrer_multiplicador_constante(n=40, semillas=(9800, 9809), constantes=(6960, 6964), procesos=1,
+                                         usar_cache=False)
+    assert len(res["semilla"]) == 50
+    for i in range(0, 50, 9):
+        ri = MultiplicadorConstante(int(res["semilla"][i]), int(res["k"][i]), 40).generar_array()[1]
+        _comparar_con_pruebas({clave: v[i] for clave, v in res.items()}, ri)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from pruebas import (
+    BATERIA, ejecutar_bateria, prueba_corridas_arriba_abajo, prueba_corridas_media, prueba_huecos,
+    prueba_kolmogorov_smirnov, prueba_poker
+)
+from pruebas.bateria import resumen
+
+
+@pytest.mark.parametrize("n", [0, 1, 2])
+def test_bateria_con_secuencias_muy_cortas_no_se_interrumpe(n):
+    reporte = ejecutar_bateria(np.random.default_rng(n).random(n))
+    assert set(reporte["pruebas"]) == set(BATERIA)
+    assert not reporte["acepta_todas"]
+    for nombre, resultado in reporte["pruebas"].items():
+        resumen(nombre, resultado)  # Lo que muestra la pestaña de pruebas
+        if n == 0:
+            assert "error" in resultado and not resultado["acepta_hipotesis"], nombre
+    if n == 1:
+        assert "error" in reporte["pruebas"]["varianza"]  # n - 1 = 0 dividía por cero
+
+
+def test_bateria_acepta_una_secuencia_uniforme():
+    reporte = ejecutar_bateria(np.random.default_rng(22).random(20_000), hilos=2)
+    errores = {nombre: r["error"] for nombre, r in reporte["pruebas"].items() if "error" in r}
+    assert errores == {}
+    assert sum(r["acepta_hipotesis"] for r in reporte["pruebas"].values()) >= len(BATERIA) - 1
+
+
+def test_corridas_arriba_abajo_cuenta_los_tramos():
+    numeros = [0.1, 0.2, 0.3, 0.2, 0.1, 0.5, 0.6, 0.4]  # + + - - + + -  -> 4 corridas
+    resultado = prueba_corridas_arriba_abajo(numeros)
+    n = len(numeros)
+    assert resultado["corridas"] == 4
+    assert np.isclose(resultado["estadistico"], (4 - (2 * n - 1) / 3) / np.sqrt((16 * n - 29) / 90))
+    assert not prueba_corridas_arriba_abajo(np.sort(np.random.default_rng(1).random(500)))["acepta_hipotesis"]
+
+
+def test_corridas_media_cuenta_los_tramos():
+    numeros = [0.7, 0.8, 0.1, 0.2, 0.3, 0.9, 0.4, 0.6]  # A A B B B A B A -> 5 corridas
+    resultado = prueba_corridas_media(numeros)
+    assert (resultado["corridas"], resultado["n0"], resultado["n1"]) == (5, 4, 4)
+    with pytest.raises(ValueError):
+        prueba_corridas_media([0.2, 0.7])
+
+
+def test_poker_clasifica_las_manos():
+    numeros = [0.12345, 0.11234, 0.11223, 0.11123, 0.11122, 0.11112, 0.11111]
+    tabla = prueba_poker(numeros)["tabla_frecuencias"]
+    assert [fila["frecuencia_observada"] for fila in tabla] == [1, 1, 1, 1, 1, 1, 1]
+    tabla = prueba_poker([0.123, 0.112, 0.111, 0.999], digitos=3)["tabla_frecuencias"]
+    assert [fila["frecuencia_observada"] for fila in tabla] == [1, 1, 2]
+
+
+def test_huecos_coincide_con_un_recorrido_directo():
+    numeros = np.random.default_rng(3).random(3000)
+    t, ultima, huecos = 5, None, []
+    for i, x in enumerate(numeros):
+        if 0.0 <= x <= 0.5:
+            if ultima is not None:
+                huecos.append(i - ultima - 1)
+            ultima = i
+    esperadas = np.bincount(np.minimum(huecos, t), minlength=t + 1)
+    resultado = prueba_huecos(numeros, t=t)
+    assert [fila["frecuencia_observada"] for fila in resultado["tabla_frecuencias"]] == esperadas.tolist()
+    assert resultado["huecos"] == len(huecos)
+
+
+def test_kolmogorov_smirnov_coincide_con_scipy():
+    numeros = np.random.default_rng(4).random(777)
+    resultado = prueba_kolmogorov_smirnov(numeros)
+    assert np.isclose(resultado["estadistico"], stats.kstest(numeros, "uniform").statistic)
+    assert np.isclose(resultado["valor_critico"], stats.kstwo.ppf(0.95, 777))
+    assert not prueba_kolmogorov_smirnov(numeros ** 2)["acepta_hipotesis"]
@@ -0,0 +1,77 @@
+import time
+
+import numpy as np
+import pytest
+
+from generators import GENERADORES, crear_generador
+from generators.cache import CacheSecuencias, generar_columnas_en_cache
+
+
+def test_generacion_por_bloques_igual_a_una_sola_llamada():
+    for nombre in GENERADORES:
+        cache = CacheSecuencias(usar_disco=False)
+        parciales = []
+        tabla = generar_columnas_en_cache(crear_generador(nombre, 250), nombre, {}, cache,
+                                          al_bloque=lambda t: parciales.append(len(t)), tam_bloque=64)
+        completa = crear_generador(nombre, 250).generar_columnas()
+        assert parciales == [64, 128, 192, 250], nombre
+        assert np.array_equal(tabla.ri, completa.ri), nombre
+        assert tabla.filas() == completa.filas(), nombre
+        # La corrida completa queda en la caché y la siguiente sale de ahí
+        assert cache.buscar(nombre, {}, 250) is not None, nombre
+
+
+def test_cancelar_a_mitad_corta_la_generacion():
+    cache = CacheSecuencias(usar_disco=False)
+    generador = crear_generador("Congruencial Lineal (LCG)", 10_000)
+    bloques = []
+
+    def al_bloque(parcial):
+        bloques.append(len(parcial))
+        return len(bloques) < 2  # Se cancela después del segundo bloque
+
+    tabla = generar_columnas_en_cache(generador, "LCG", {}, cache, al_bloque=al_bloque, tam_bloque=100)
+    assert bloques == [100, 200]
+    assert len(tabla) == 200
+    completa = crear_generador("Congruencial Lineal (LCG)", 10_000).generar_columnas()
+    assert np.array_equal(tabla.ri, completa.ri[:200])
+    # El generador solo avanzó los bloques generados y la corrida parcial no se cachea
+    assert generador.x == int(completa.xi[199])
+    assert cache.buscar("LCG", {}, 1) is None
+
+
+def test_acierto_arma_la_tabla_sin_regenerar(monkeypatch):
+    for nombre in GENERADORES:
+        cache = CacheSecuencias(usar_disco=False)
+        completa = generar_columnas_en_cache(crear_generador(nombre, 300), nombre, {}, cache)
+        # Con la corrida en la caché no se llama a ninguna ruta de generación
+        clase = GENERADORES[nombre]
+        for metodo in ("generar_array", "_columnas", "_estados", "_componentes", "_salidas"):
+            if hasattr(clase, metodo):
+                monkeypatch.setattr(clase, metodo, lambda *a, **k: pytest.fail(f"{nombre} regeneró"))
+        servida = generar_columnas_en_cache(crear_generador(nombre, 200), nombre, {}, cache)
+        monkeypatch.undo()
+        assert cache.aciertos == 1, nombre
+        assert np.array_equal(servida.ri, completa.ri[:200]), nombre
+        assert servida.filas(0, 5) + servida.filas(195) == completa.filas(0, 5) + completa.filas(195, 200), nombre
+
+
+def test_disco_con_presupuesto_desaloja_lo_menos_usado(tmp_path):
+    # Sin memoria: cada corrida guardada pasa directo a disco (1000 valores = 16000 bytes)
+    cache = CacheSecuencias(presupuesto_bytes=0, directorio=str(tmp_path), presupuesto_disco=2 * 16000 + 1000)
+
+    def guardar(semilla):
+        generador = crear_generador("SplitMix64", 0, semilla=semilla)
+        cache.obtener("SplitMix64", {"semilla": semilla}, 1000, generador.generar_array)
+        time.sleep(0.01)
+
+    guardar(1)
+    guardar(2)
+    assert cache.buscar("SplitMix64", {"semilla": 1}, 1000) is not None  # La 1 pasa a ser la más reciente
+    time.sleep(0.01)
+    guardar(3)
+
+    assert cache.buscar("SplitMix64", {"semilla": 2}, 1) is None
+    assert cache.buscar("SplitMix64", {"semilla": 1}, 1000) is not None
+    assert cache.buscar("SplitMix64", {"semilla": 3}, 1000) is not None
+    assert sum(f.stat().st_size for f in tmp_path.glob("*.npy")) <= cache.presupuesto_disco
@@ -0,0 +1,40 @@
+import json
+
+import numpy as np
+import pytest
+
+import cli
+from generators import crear_generador
+
+
+def test_crear_generador_rechaza_parametros_desconocidos():
+    with pytest.raises(ValueError, match="semilla1, semilla2"):
+        crear_generador("Productos Medios", 10, semilla=3)
+
+
+def test_cli_generar_parametro_desconocido_sale_con_error(capsys):
+    with pytest.raises(SystemExit) as salida:
+        cli.main(["generar", "Productos Medios", "-n", "10", "-p", "semilla=3"])
+    assert salida.value.code == 2
+    assert "Parámetros desconocidos" in capsys.readouterr().err
+
+
+def test_cli_meta_generador_sin_semilla_unica_sale_con_error(capsys):
+    with pytest.raises(SystemExit) as salida:
+        cli.main(["meta", "--generador", "Productos Medios", "-n", "100", "--semillas", "1", "2", "--procesos", "1"])
+    assert salida.value.code == 2
+    assert "semilla1, semilla2" in capsys.readouterr().err
+
+
+def test_cli_generar_npy_y_probar_la_secuencia_guardada(tmp_path):
+    salida, reporte = tmp_path / "ri.npy", tmp_path / "reporte.json"
+    assert cli.main(["generar", "PCG32", "-n", "5000", "-p", "semilla=42", "--salida", str(salida),
+                     "--bloque", "700", "--pruebas", "medias", "varianza"]) == 0
+    _, ri = crear_generador("PCG32", 5000, semilla=42).generar_array()
+    assert np.array_equal(np.load(salida), ri)
+    assert cli.main(["probar", str(salida), "--pruebas", "medias", "--reporte", str(reporte)]) == 0
+    with open(reporte, encoding="utf-8") as f:
+        resultado = json.load(f)
+    assert resultado["n"] == 5000
+    assert resultado["metadatos"]["algoritmo"] == "PCG32"
+    assert resultado["pruebas"]["medias"]["media"] == pytest.approx(ri.mean())
@@ -0,0 +1,39 @@
+import pytest
+import scipy.stats as stats
+
+from pruebas.cuantiles import (
+    GL_TABLA, GL_WILSON_HILFERTY, PROBABILIDADES_COMUNES, chi2_wilson_hilferty, cuantil_chi2, cuantil_ks,
+    cuantil_normal
+)
+
+
+@pytest.mark.parametrize("p", PROBABILIDADES_COMUNES + (0.3, 0.77, 1e-6))
+def test_cuantil_normal_coincide_con_scipy(p):
+    assert cuantil_normal(p) == pytest.approx(stats.norm.ppf(p), rel=1e-12)
+
+
+@pytest.mark.parametrize("gl", [1, 2, 9, GL_TABLA, GL_TABLA + 1, 1234, GL_WILSON_HILFERTY])
+@pytest.mark.parametrize("p", [0.0005, 0.025, 0.95, 0.3])
+def test_cuantil_chi2_coincide_con_scipy(p, gl):
+    assert cuantil_chi2(p, gl) == pytest.approx(stats.chi2.ppf(p, gl), rel=1e-12)
+
+
+@pytest.mark.parametrize("gl", [GL_WILSON_HILFERTY + 1, 10 ** 7, 10 ** 9])
+@pytest.mark.parametrize("p", [0.0005, 0.025, 0.95, 0.9995])
+def test_wilson_hilferty_para_muchos_grados_de_libertad(p, gl):
+    assert cuantil_chi2(p, gl) == chi2_wilson_hilferty(p, gl)
+    assert cuantil_chi2(p, gl) == pytest.approx(stats.chi2.ppf(p, gl), rel=1e-9)
+
+
+def test_cuantil_ks_coincide_con_scipy():
+    for n in (1, 10, 500):
+        assert cuantil_ks(0.95, n) == pytest.approx(stats.kstwo.ppf(0.95, n))
+
+
+@pytest.mark.parametrize("llamada", [
+    lambda: cuantil_normal(0), lambda: cuantil_normal(1), lambda: cuantil_chi2(1.5, 3),
+    lambda: cuantil_chi2(0.95, 0), lambda: cuantil_ks(0.95, 0),
+])
+def test_cuantiles_rechazan_argumentos_invalidos(llamada):
+    with pytest.raises(ValueError):
+        llamada()
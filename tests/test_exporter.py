@@ -0,0 +1,60 @@
+import json
+
+import numpy as np
+import pytest
+
+from generators.cuadrados_medios import CuadradosMedios
+from utils.exporter import (
+    cargar_secuencia, exportar_binario_bloques, exportar_csv_bloques, exportar_secuencia,
+    exportar_secuencia_bloques, ruta_metadatos
+)
+
+
+def test_exportar_por_bloques_igual_a_la_corrida_completa(tmp_path):
+    _, ri = CuadradosMedios(5735, 1000).generar_array()
+    assert exportar_binario_bloques(tmp_path / "ri.bin", CuadradosMedios(5735, 1000).iterar_bloques(128, 1000)) == 1000
+    assert np.array_equal(np.fromfile(tmp_path / "ri.bin", dtype="<f8"), ri)
+    assert exportar_csv_bloques(tmp_path / "ri.csv", CuadradosMedios(5735, 1000).iterar_bloques(128, 1000)) == 1000
+    tabla = np.loadtxt(tmp_path / "ri.csv", delimiter=",", skiprows=1)
+    assert np.array_equal(tabla[:, 0], np.arange(1, 1001))
+    assert np.allclose(tabla[:, 1], ri, atol=5e-9)
+
+
+def test_secuencia_npy_ida_y_vuelta_con_metadatos(tmp_path):
+    generador = CuadradosMedios(5735, 1000)
+    estado = generador.obtener_estado()
+    _, ri = generador.generar_array()
+    assert exportar_secuencia(tmp_path / "ri", ri, algoritmo="Cuadrados Medios",
+                              parametros={"semilla": 5735}, estado=estado) == 1000
+    leidos, metadatos = cargar_secuencia(tmp_path / "ri")
+    assert isinstance(leidos, np.memmap) and not leidos.flags.writeable
+    assert np.array_equal(leidos, ri)
+    assert metadatos["algoritmo"] == "Cuadrados Medios"
+    assert metadatos["parametros"] == {"semilla": 5735}
+    assert metadatos["n"] == 1000 and metadatos["dtype"] == "<f8"
+    # El estado inicial guardado reproduce la secuencia
+    retomado = CuadradosMedios(5735, 1000)
+    retomado.restaurar_estado(metadatos["estado"])
+    assert np.array_equal(retomado.generar_array()[1], ri)
+
+
+def test_secuencia_por_bloques_igual_a_la_completa(tmp_path):
+    _, ri = CuadradosMedios(5735, 1000).generar_array()
+    exportar_secuencia_bloques(tmp_path / "ri.npy", CuadradosMedios(5735, 1000).iterar_bloques(100, 1000), 1000,
+                               algoritmo="Cuadrados Medios")
+    leidos, metadatos = cargar_secuencia(tmp_path / "ri.npy", mapear=False)
+    assert np.array_equal(leidos, ri)
+    with open(ruta_metadatos(tmp_path / "ri.npy"), encoding="utf-8") as f:
+        assert json.load(f) == metadatos
+    with pytest.raises(ValueError):
+        exportar_secuencia_bloques(tmp_path / "corta.npy", [ri[:10]], 20)
+    with pytest.raises(ValueError):
+        exportar_secuencia_bloques(tmp_path / "larga.npy", [ri[:30]], 20)
+
+
+def test_cargar_secuencia_sin_metadatos_o_de_dos_dimensiones(tmp_path):
+    np.save(tmp_path / "sola.npy", np.linspace(0, 1, 5))
+    assert cargar_secuencia(tmp_path / "sola.npy")[1] == {}
+    np.save(tmp_path / "matriz.npy", np.zeros((2, 3)))
+    with pytest.raises(ValueError):
+        cargar_secuencia(tmp_path / "matriz.npy")
@@ -0,0 +1,179 @@
+import numpy as np
+import pytest
+
+from generators import GENERADORES, crear_generador
+from generators.congruencial_lineal import LCG
+from generators.cuadrados_medios import CuadradosMedios, generar_carriles
+from generators.comparacion import comparar_generadores
+from generators.mrg32k3a import M1, M2, MRG32k3a
+from generators.multiplicador_constante import MultiplicadorConstante
+from generators.pcg32 import PCG32
+from generators.productos_medios import ProductosMedios
+from generators.cuasi_aleatorios import Sobol, _SecuenciaCuasiAleatoria
+
+
+def test_cuadrados_medios_generar_array_avanza_estado():
+    generador = CuadradosMedios(5735, 10)
+    _, primera = generador.generar_array()
+    _, segunda = generador.generar_array()
+    _, continua = CuadradosMedios(5735, 20).generar_array()
+    assert np.array_equal(np.concatenate((primera, segunda)), continua)
+
+
+def test_generar_array_coincide_con_iterar_bloques():
+    for nombre in GENERADORES:
+        _, ri = crear_generador(nombre, 300).generar_array()
+        bloques = np.concatenate(list(crear_generador(nombre, 300).iterar_bloques(64, 300)))
+        assert np.array_equal(ri, bloques), nombre
+
+
+def test_cuadrados_medios_generar_columnas_parte_del_estado():
+    generador = CuadradosMedios(5735, 3)
+    generador.generar_array()
+    x = generador.x
+    tabla = generador.generar_columnas()
+    assert tabla.fila(0)["Xi-1"] == str(x).zfill(4)
+
+
+@pytest.mark.parametrize("crear", [
+    lambda: CuadradosMedios(5735, 500),
+    lambda: ProductosMedios(5015, 5734, 500),
+    lambda: MultiplicadorConstante(9803, 6965, 500),
+])
+def test_retomar_desde_el_estado_guardado_igual_a_una_corrida(crear):
+    _, completa = crear().generar_array(500)
+    generador = crear()
+    primera = np.concatenate(list(generador.iterar_bloques(64, 200)))
+    estado = generador.obtener_estado()
+    retomado = crear()
+    retomado.restaurar_estado(estado)
+    segunda = np.concatenate(list(retomado.iterar_bloques(64, 300)))
+    assert np.array_equal(np.concatenate((primera, segunda)), completa)
+
+
+def test_iterar_bloques_sin_total_no_termina_y_rechaza_bloque_cero():
+    bloques = CuadradosMedios(5735, 10).iterar_bloques(7)
+    assert [len(next(bloques)) for _ in range(3)] == [7, 7, 7]
+    with pytest.raises(ValueError):
+        next(CuadradosMedios(5735, 10).iterar_bloques(0, 10))
+
+
+def test_lcg_restaurar_estado_de_otros_parametros():
+    original = LCG(7, 50, a=69069, c=1, m=2 ** 32)
+    original.generar_array(10)
+    estado = original.obtener_estado()
+    esperado = original.generar_array(20)[1]
+
+    otro = LCG(99, 20)
+    otro.restaurar_estado(estado)
+    assert (otro.a, otro.c, otro.m) == (69069, 1, 2 ** 32)
+    assert np.array_equal(otro.generar_array()[1], esperado)
+
+
+def test_lcg_restaurar_estado_invalido():
+    generador = LCG(7, 10)
+    with pytest.raises(ValueError):
+        generador.restaurar_estado({"x": 5, "a": 3, "c": 1, "m": 2})
+    with pytest.raises(ValueError):
+        generador.restaurar_estado({"x": 2 ** 31, "a": 3, "c": 1, "m": 2 ** 31})
+    assert generador.obtener_estado() == {"x": 7, "a": 1103515245, "c": 12345, "m": 2 ** 31}
+
+
+def test_sobol_sin_aleatorizar_conserva_el_origen_y_el_equilibrio():
+    ri = Sobol(64, aleatorizar=0).generar_array()[1]
+    assert ri[0] == 0.0
+    # Cada bloque de 2^m puntos desde el inicio tiene exactamente un punto por intervalo de largo 2^-m
+    for m in range(1, 7):
+        assert np.array_equal(np.bincount((ri[:2 ** m] * 2 ** m).astype(int), minlength=2 ** m), np.ones(2 ** m))
+
+
+def test_secuencia_cuasi_aleatoria_base_es_abstracta():
+    with pytest.raises(TypeError):
+        _SecuenciaCuasiAleatoria(10)
+
+
+def test_lcg_n_cero_devuelve_arrays_vacios():
+    generador = LCG(12345, 0)
+    xi, ri = generador.generar_array()
+    assert xi.dtype == np.uint64 and ri.dtype == np.float64
+    assert len(xi) == len(ri) == 0
+    assert generador.x == 12345
+    assert len(generador.generar_columnas()) == 0
+
+
+@pytest.mark.parametrize("nombre", list(GENERADORES))
+def test_n_cero_en_todos_los_generadores(nombre):
+    generador = crear_generador(nombre, 0)
+    xi, ri = generador.generar_array()
+    assert len(xi) == len(ri) == 0
+    assert len(generador.generar_columnas()) == 0
+
+
+def test_pcg32_coincide_con_la_referencia():
+    # Salidas de pcg32-demo (pcg32_srandom_r(&rng, 42, 54))
+    xi, _ = PCG32(42, 6, secuencia=54).generar_array()
+    assert xi.tolist() == [0xa15c02b7, 0x7b47f409, 0xba1d3330, 0x83d2f293, 0xbfa4784b, 0xcbed606e]
+
+
+def test_cuadrados_medios_d_grande_coincide_con_texto():
+    # Referencia: dígitos centrales por cadena, como el generador original
+    x, esperado = 31415926, []
+    for _ in range(50):
+        x = int(str(x * x).zfill(16)[4:12])
+        esperado.append(x)
+    xi, ri = CuadradosMedios(31415926, 50, d=8).generar_array()
+    assert xi.tolist() == esperado
+    assert np.allclose(ri, np.array(esperado) / 1e8)
+
+
+def test_generar_carriles_coincide_con_una_semilla():
+    xi, _ = generar_carriles([5735, 1234, 9999], 30, d=4)
+    for fila, semilla in zip(xi, (5735, 1234, 9999)):
+        assert np.array_equal(fila, CuadradosMedios(semilla, 30).generar_array()[0])
+
+
+@pytest.mark.parametrize("generador", [
+    CuadradosMedios(3141592653589793238462, 20, d=22),
+    ProductosMedios(31415926535897932384626, 27182818284590452353602, 20),
+    MultiplicadorConstante(31415926535897932384626, 6965, 20),
+])
+def test_semillas_de_mas_de_19_digitos_usan_enteros_de_python(generador):
+    xi, ri = generador.generar_array()
+    assert xi.dtype == object
+    assert ((ri >= 0) & (ri < 1)).all()
+    assert np.allclose(ri, [v / 10 ** generador.d for v in xi])
+
+
+def _mrg32k3a_escalar(s1, s2, n):
+    # Recurrencia de L'Ecuyer (1999) paso a paso, como en RngStream.c
+    s1, s2, ri = list(s1), list(s2), []
+    for _ in range(n):
+        p1 = (1403580 * s1[1] - 810728 * s1[0]) % M1
+        p2 = (527612 * s2[2] - 1370589 * s2[0]) % M2
+        s1, s2 = [s1[1], s1[2], p1], [s2[1], s2[2], p2]
+        ri.append(((p1 - p2) % M1 or M1) / (M1 + 1))
+    return ri
+
+
+def test_mrg32k3a_coincide_con_rngstreams():
+    _, ri = MRG32k3a([12345] * 6, 1000).generar_array()
+    assert np.allclose(ri, _mrg32k3a_escalar([12345] * 3, [12345] * 3, 1000), rtol=0, atol=1e-15)
+    # Primeros U01 del primer flujo de RngStreams con la semilla por defecto
+    assert np.allclose(ri[:5], [0.127011, 0.318528, 0.309186, 0.825847, 0.221630], atol=1e-6)
+    # Semilla del segundo flujo (salto de 2^127), tal como la reporta RngStreams
+    segundo = MRG32k3a([12345] * 6, 0, flujo=1)
+    assert segundo.s1 + segundo.s2 == (3692455944, 1366884236, 2968912127, 335948734, 4161675175, 475798818)
+
+
+def test_mrg32k3a_subflujos_continuan_la_secuencia():
+    generador = MRG32k3a(7, 0)
+    generador.saltar_subflujos(1)
+    esperado = generador.generar_array(10)[1]
+    assert np.array_equal(MRG32k3a(7, 10, subflujo=1).generar_array()[1], esperado)
+    assert not np.array_equal(MRG32k3a(7, 10, subflujo=2).generar_array()[1], esperado)
+
+
+def test_comparar_generadores_una_fila_por_generador():
+    filas = comparar_generadores(2000, nombres=["PCG32", "MRG32k3a"])
+    assert [fila["generador"] for fila in filas] == ["PCG32", "MRG32k3a"]
+    assert all(fila["acepta_medias"] in (True, False) and fila["n"] == 2000 for fila in filas)
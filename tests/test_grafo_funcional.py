@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from generators.cuadrados_medios import CuadradosMedios
+from generators.grafo_funcional import (
+    analisis_cuadrados_medios, analizar_grafo, resumen_ciclos, tabla_sucesores, valores_distintos
+)
+
+
+def _recorrer(sucesor, x):
+    """Cola, longitud y menor estado del ciclo terminal de x, caminando paso a paso."""
+    visto = {}
+    paso = 0
+    while x not in visto:
+        visto[x] = paso
+        x = int(sucesor[x])
+        paso += 1
+    inicio = visto[x]
+    ciclo = [estado for estado, p in visto.items() if p >= inicio]
+    return inicio, len(ciclo), min(ciclo)
+
+
+@pytest.mark.parametrize("d", [1, 2, 3, 4])
+def test_tabla_sucesores_coincide_con_el_metodo_por_texto(d):
+    sucesor = tabla_sucesores(d)
+    for x in range(10 ** d):
+        cuadrado = str(x * x).zfill(2 * d)
+        assert sucesor[x] == int(cuadrado[d // 2:d // 2 + d]), x
+
+
+@pytest.mark.parametrize("sucesor", [
+    tabla_sucesores(4),
+    np.random.default_rng(3).integers(0, 5000, 5000),
+    np.array([1, 2, 0, 0, 3, 5]),
+])
+def test_analizar_grafo_coincide_con_el_recorrido(sucesor):
+    analisis = analizar_grafo(sucesor)
+    for x in range(len(sucesor)):
+        cola, longitud, representante = _recorrer(sucesor, x)
+        assert analisis["cola"][x] == cola, x
+        assert analisis["longitud_ciclo"][x] == longitud, x
+        assert analisis["ciclo"][x] == representante, x
+        assert analisis["en_ciclo"][x] == (cola == 0), x
+
+
+def test_diagnostico_coincide_con_la_cantidad_de_xi_distintos():
+    for semilla in (5735, 1234, 9999, 3792, 1000):
+        generador = CuadradosMedios(semilla, 200)
+        xi, _ = generador.generar_array()
+        diagnostico = generador.diagnostico()
+        _, primera = np.unique(xi, return_index=True)
+        assert diagnostico["distintos"] == len(primera)
+        assert valores_distintos(diagnostico["cola"], diagnostico["longitud_ciclo"]) == diagnostico["distintos"]
+
+
+def test_resumen_ciclos_cubre_todas_las_semillas():
+    resumen = resumen_ciclos(4)
+    assert sum(c["cuenca"] for c in resumen) == 10 ** 4
+    assert {tuple(c["ciclo"]) for c in resumen} >= {(0,), (2100, 4100, 8100, 6100)}
+    assert not analisis_cuadrados_medios(4)["cola"].flags.writeable
+    with pytest.raises(ValueError):
+        tabla_sucesores(7)
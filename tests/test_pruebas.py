@@ -0,0 +1,166 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from pruebas import (
+    prueba_medias, prueba_series, prueba_series_multidimensional, prueba_uniformidad, prueba_uniformidad_multiple,
+    prueba_varianza
+)
+from pruebas.acumuladores import crear_acumulador, probar_bloques
+from pruebas.lotes import frecuencias_filas, prueba_medias_lote, prueba_uniformidad_lote, prueba_varianza_lote
+from pruebas.meta import prueba_dos_niveles_semillas
+
+
+def test_prueba_series_diferencia_de_good():
+    numeros = np.random.default_rng(1).random(5000)
+    resultado = prueba_series(numeros, k=6)
+    fila_2d = prueba_series_multidimensional(numeros, k=6, dimensiones=(1, 2))["tabla"][1]
+    assert resultado["gl"] == 6 * 6 - 6
+    assert np.isclose(resultado["estadistico"], fila_2d["chi_diferencia"])
+    assert resultado["frecuencias"].sum() == len(numeros)
+
+
+def test_prueba_series_rechaza_alpha_bajo_h0():
+    rng = np.random.default_rng(2024)
+    rechazos = [not prueba_series(rng.random(1000), 0.05, k=5)["acepta_hipotesis"] for _ in range(4000)]
+    # Con los pares solapados contra χ²(k² - 1) la tasa era ~0.0675
+    assert 0.04 < np.mean(rechazos) < 0.06
+
+
+def test_dos_niveles_semillas_registra_bloque_que_no_se_genera():
+    # 12 tiene menos de d = 4 dígitos: esa corrida falla sin abortar las demás
+    reporte = prueba_dos_niveles_semillas("Cuadrados Medios", [5735, 12, 6214, 9876], 200, procesos=1)
+    fallido = reporte["bloques"][1]
+    assert fallido["semilla"] == 12 and "error" in fallido
+    assert np.isnan(fallido["p_valores"]["uniformidad"])
+    assert all("error" not in b for i, b in enumerate(reporte["bloques"]) if i != 1)
+    assert np.isnan(reporte["pruebas"]["uniformidad"]["p_valores"][1])
+
+
+def test_dos_niveles_semillas_usa_la_clave_de_semilla_del_generador():
+    reporte = prueba_dos_niveles_semillas("Sobol", [1, 2, 3], 128, procesos=1)
+    assert [b["n"] for b in reporte["bloques"]] == [128, 128, 128]
+    with pytest.raises(ValueError, match="único parámetro de semilla"):
+        prueba_dos_niveles_semillas("Productos Medios", [1, 2], 100)
+
+
+def test_uniformidad_lote_valores_fuera_de_rango_como_np_histogram():
+    matriz = np.array([[0.05, 1.0, 0.5, -0.2, 0.95],
+                       [0.0, 0.3, 1.5, 0.999, np.nan]])
+    frecuencias = frecuencias_filas(matriz, 4)
+    esperadas = [np.histogram(fila, bins=np.linspace(0, 1, 5))[0] for fila in matriz]
+    assert np.array_equal(frecuencias, esperadas)
+    # 1.0 cae en el último intervalo y -0.2 no invade la fila vecina
+    assert frecuencias[0].tolist() == [1, 0, 1, 2]
+    assert frecuencias[1].tolist() == [1, 1, 0, 1]
+    assert np.allclose(prueba_uniformidad_lote(matriz, k=4)["chi_cuadrado"],
+                       [prueba_uniformidad(fila, k=4)["chi_cuadrado"] for fila in matriz])
+
+
+def test_pruebas_por_lotes_coinciden_fila_a_fila():
+    matriz = np.random.default_rng(24).random((40, 300))
+    matriz[3] = matriz[3] * 0.5  # Una fila que debe rechazarse
+    for lote, prueba, clave in ((prueba_medias_lote, prueba_medias, "media"),
+                                (prueba_varianza_lote, prueba_varianza, "varianza"),
+                                (prueba_uniformidad_lote, prueba_uniformidad, "chi_cuadrado")):
+        resultado = lote(matriz)
+        por_fila = [prueba(fila) for fila in matriz]
+        assert np.allclose(resultado[clave], [r[clave] for r in por_fila])
+        assert resultado["acepta_hipotesis"].tolist() == [r["acepta_hipotesis"] for r in por_fila]
+    assert not prueba_medias_lote(matriz)["acepta_hipotesis"][3]
+
+
+def test_medias_y_varianza_coinciden_con_la_formula_directa():
+    numeros = np.random.default_rng(16).random(10_001)
+    medias, varianza = prueba_medias(numeros), prueba_varianza(numeros)
+    assert np.isclose(medias["media"], np.mean(numeros), rtol=0, atol=1e-15)
+    assert np.isclose(varianza["varianza"], np.var(numeros, ddof=1), rtol=1e-12)
+    assert medias["acepta_hipotesis"] and varianza["acepta_hipotesis"]
+    assert prueba_medias(list(numeros))["media"] == medias["media"]
+    assert not prueba_varianza(numeros * 0.5)["acepta_hipotesis"]
+
+
+def test_medias_y_varianza_leen_un_memmap_por_bloques(tmp_path):
+    ruta = tmp_path / "ri.f32"
+    valores = np.random.default_rng(17).random(2_000_000).astype(np.float32)
+    valores.tofile(ruta)
+    mapeado = np.memmap(ruta, dtype=np.float32, mode="r")
+
+    tracemalloc.start()
+    medias, varianza = prueba_medias(mapeado), prueba_varianza(mapeado)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Una copia float64 completa serían 16 MB; por bloques solo se convierte uno a la vez
+    assert pico < 4 * 1024 * 1024
+    en_memoria = valores.astype(np.float64)
+    assert np.isclose(medias["media"], en_memoria.mean(), rtol=0, atol=1e-12)
+    assert np.isclose(varianza["varianza"], en_memoria.var(ddof=1), rtol=1e-10)
+
+
+def _igual_resultado(a, b):
+    """Compara resultados de pruebas (dicts, listas y números) con tolerancia de redondeo."""
+    if isinstance(a, dict):
+        assert a.keys() == b.keys()
+        for clave in a:
+            _igual_resultado(a[clave], b[clave])
+    elif isinstance(a, (list, tuple)):
+        assert len(a) == len(b)
+        for x, y in zip(a, b):
+            _igual_resultado(x, y)
+    elif isinstance(a, (float, np.floating)):
+        assert a == pytest.approx(b, rel=1e-12, abs=1e-15)
+    else:
+        assert a == b
+
+
+def test_acumuladores_combinados_igual_a_una_pasada():
+    numeros = np.random.default_rng(17).random(10007)
+    completas = {"medias": prueba_medias(numeros), "varianza": prueba_varianza(numeros),
+                 "uniformidad": prueba_uniformidad(numeros, k=12)}
+    particiones = np.split(numeros, [1, 900, 4000, 4001, 9000])
+    for prueba, completa in completas.items():
+        parciales = []
+        for particion in particiones:
+            acumulador = crear_acumulador(prueba, 12)
+            for bloque in np.array_split(particion, 3):
+                acumulador.agregar(bloque)
+            parciales.append(acumulador)
+        total = parciales[0]
+        for otro in parciales[1:]:
+            total.combinar(otro)
+        _igual_resultado(total.resultado(), completa)
+    bloques = (numeros[i:i + 1000] for i in range(0, len(numeros), 1000))
+    for prueba, resultado in probar_bloques(bloques, k=12).items():
+        _igual_resultado(resultado, completas[prueba])
+
+
+def test_acumuladores_vacios_o_incompatibles():
+    with pytest.raises(ValueError):
+        crear_acumulador("medias").resultado()
+    with pytest.raises(ValueError):
+        crear_acumulador("varianza").agregar([0.5]).resultado()
+    with pytest.raises(ValueError):
+        crear_acumulador("uniformidad", 10).combinar(crear_acumulador("uniformidad", 20))
+    with pytest.raises(ValueError):
+        crear_acumulador("poker")
+
+
+def test_uniformidad_multiple_coincide_con_np_histogram():
+    numeros = np.concatenate((np.random.default_rng(18).random(5000), [0.0, 0.5, 1.0, -0.1, 1.2]))
+    ks = (2, 7, 10, 64, 1000)
+    resultado = prueba_uniformidad_multiple(numeros, ks)
+    assert [fila["k"] for fila in resultado["tabla"]] == list(ks)
+    for fila in resultado["tabla"]:
+        frecuencias, _ = np.histogram(numeros, bins=np.linspace(0, 1, fila["k"] + 1))
+        esperada = len(numeros) / fila["k"]
+        assert fila["chi_cuadrado"] == pytest.approx(np.sum((frecuencias - esperada) ** 2) / esperada)
+        individual = prueba_uniformidad(numeros, k=fila["k"])
+        assert fila["chi_cuadrado"] == pytest.approx(individual["chi_cuadrado"])
+        assert fila["acepta_hipotesis"] == individual["acepta_hipotesis"]
+    ordenados = prueba_uniformidad_multiple(np.sort(numeros), ks, ordenados=True)
+    assert ordenados["tabla"] == resultado["tabla"]
+    with pytest.raises(ValueError):
+        prueba_uniformidad_multiple(numeros, (1, 10))
+    with pytest.raises(ValueError):
+        prueba_uniformidad_multiple([], ks)
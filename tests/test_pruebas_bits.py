@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+import pytest
+
+from pruebas_bits import (
+    CadenaBits, bits_desde_enteros, bits_desde_ri, ejecutar_bateria_bits, prueba_corridas, prueba_entropia_aproximada,
+    prueba_espectral, prueba_frecuencia, prueba_frecuencia_bloques, prueba_racha_mas_larga, prueba_sumas_acumuladas
+)
+from pruebas_bits.corridas import rachas_mas_largas
+
+# Ejemplos de NIST SP 800-22 rev. 1a (secciones 2.1.8 a 2.13.8)
+EPSILON_100 = (
+    "11001001000011111101101010100010001000010110100011"
+    "00001000110100110001001100011001100010100010111000"
+)
+EPSILON_128 = (
+    "11001100000101010110110001001100111000000000001001001101010100010001001111010110100000001101011111001100111001"
+    "101101100010110010"
+)
+
+
+@pytest.mark.parametrize("prueba, bits, opciones, clave, esperado", [
+    (prueba_frecuencia, "1011010101", {}, "p_valor", 0.527089),
+    (prueba_frecuencia, EPSILON_100, {}, "p_valor", 0.109599),
+    (prueba_frecuencia_bloques, "0110011010", {"M": 3}, "p_valor", 0.801252),
+    (prueba_frecuencia_bloques, EPSILON_100, {"M": 10}, "p_valor", 0.706438),
+    (prueba_corridas, "1001101011", {}, "p_valor", 0.147232),
+    (prueba_corridas, EPSILON_100, {}, "p_valor", 0.500798),
+    (prueba_racha_mas_larga, EPSILON_128, {}, "chi_cuadrado", 4.882605),
+    (prueba_sumas_acumuladas, "1011010111", {}, "p_valor_adelante", 0.4116588),
+    (prueba_sumas_acumuladas, EPSILON_100, {}, "p_valor_adelante", 0.219194),
+    (prueba_sumas_acumuladas, EPSILON_100, {}, "p_valor_atras", 0.114866),
+    (prueba_entropia_aproximada, "0100110101", {"m": 3}, "entropia_aproximada", 0.190954),
+    (prueba_entropia_aproximada, "0100110101", {"m": 3}, "p_valor", 0.261961),
+    (prueba_entropia_aproximada, EPSILON_100, {"m": 2}, "p_valor", 0.235301),
+])
+def test_ejemplos_de_nist_sp_800_22(prueba, bits, opciones, clave, esperado):
+    resultado = prueba(CadenaBits.desde_bits(bits), **opciones)
+    assert resultado[clave] == pytest.approx(esperado, abs=1e-6)
+
+
+def test_racha_mas_larga_ejemplo_de_nist():
+    resultado = prueba_racha_mas_larga(CadenaBits.desde_bits(EPSILON_128))
+    assert list(resultado["frecuencias"]) == [4, 9, 3, 0]
+    # El documento da 0.180609, calculado con otra igamc; scipy da 0.180598
+    assert resultado["p_valor"] == pytest.approx(0.180609, abs=2e-5)
+
+
+def test_espectral_coincide_con_la_dft_directa():
+    bits = np.random.default_rng(21).integers(0, 2, 1000)
+    x = 2.0 * bits - 1.0
+    n = len(x)
+    j = np.arange(n)
+    modulos = np.abs(np.exp(-2j * np.pi * np.outer(j[:n // 2], j) / n) @ x)
+    umbral = math.sqrt(math.log(20) * n)
+    d = (np.count_nonzero(modulos < umbral) - 0.95 * n / 2) / math.sqrt(n * 0.95 * 0.05 / 4)
+    resultado = prueba_espectral(CadenaBits.desde_bits(bits))
+    assert resultado["d"] == pytest.approx(d)
+    assert resultado["p_valor"] == pytest.approx(math.erfc(abs(d) / math.sqrt(2)))
+
+
+def test_cadena_bits_cuenta_y_corta_como_el_texto():
+    texto = "".join(np.random.default_rng(2).choice(["0", "1"], 83))
+    cadena = CadenaBits.desde_bits(texto)
+    assert len(cadena) == 83 and cadena.unos() == texto.count("1")
+    assert "".join(map(str, cadena.bits(5, 70))) == texto[5:70]
+    with pytest.raises(ValueError):
+        CadenaBits.desde_bits([0, 2])
+
+
+@pytest.mark.parametrize("bits_por_numero", [1, 7, 8, 13, 32, 52])
+def test_bits_desde_ri_y_enteros_coinciden_con_el_formato_binario(bits_por_numero):
+    ri = np.random.default_rng(bits_por_numero).random(20)
+    enteros = [int(r * 2 ** bits_por_numero) for r in ri]
+    texto = "".join(format(e, f"0{bits_por_numero}b") for e in enteros)
+    assert "".join(map(str, bits_desde_ri(ri, bits_por_numero).bits())) == texto
+    assert "".join(map(str, bits_desde_enteros(enteros, bits_por_numero).bits())) == texto
+
+
+def test_rachas_mas_largas_coinciden_con_el_recorrido():
+    bloques = np.random.default_rng(4).integers(0, 2, (200, 16)).astype(np.uint8)
+    bloques[0] = 0
+    bloques[1] = 1
+    esperadas = [max(len(r) for r in "".join(map(str, fila)).split("0")) for fila in bloques]
+    assert list(rachas_mas_largas(bloques)) == esperadas
+
+
+def test_bateria_bits_acepta_una_secuencia_uniforme_y_registra_errores():
+    ri = np.random.default_rng(5).random(20000)
+    resultado = ejecutar_bateria_bits(ri, hilos=2)
+    assert resultado["bits"] == 32 * len(ri)
+    assert sum(r["acepta_hipotesis"] for r in resultado["pruebas"].values()) >= len(resultado["pruebas"]) - 1
+    corta = ejecutar_bateria_bits(CadenaBits.desde_bits("0101"), ["racha_mas_larga", "frecuencia"])
+    assert "error" in corta["pruebas"]["racha_mas_larga"]
+    with pytest.raises(ValueError):
+        ejecutar_bateria_bits(ri, ["inexistente"])
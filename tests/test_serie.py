@@ -0,0 +1,73 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from pruebas.serie import _k_por_defecto, conteos_tuplas, prueba_series, prueba_series_multidimensional
+
+
+def _conteos_fuerza_bruta(numeros, k, d):
+    """Cuenta las n d-tuplas circulares una por una."""
+    n = len(numeros)
+    celdas = [min(int(x * k), k - 1) for x in numeros]
+    conteos = np.zeros(k ** d, dtype=np.int64)
+    for i in range(n):
+        indice = 0
+        for j in range(d):
+            indice = indice * k + celdas[(i + j) % n]
+        conteos[indice] += 1
+    return conteos
+
+
+@pytest.mark.parametrize("n, k, d_max, tam_bloque", [
+    (500, 3, 4, 64), (97, 5, 3, 1 << 20), (10, 2, 5, 4), (1000, 4, 2, 17),
+])
+def test_conteos_tuplas_coinciden_con_la_fuerza_bruta(n, k, d_max, tam_bloque):
+    numeros = np.random.default_rng(n).random(n)
+    numeros[:3] = (0.0, 1.0, 0.999999)
+    conteos = conteos_tuplas(numeros, k, d_max, tam_bloque)
+    for d in range(1, d_max + 1):
+        assert np.array_equal(conteos[d - 1], _conteos_fuerza_bruta(numeros, k, d)), d
+        assert conteos[d - 1].sum() == n
+
+
+def test_conteos_tuplas_lee_un_memmap_por_bloques(tmp_path):
+    numeros = np.random.default_rng(25).random(3000)
+    np.save(tmp_path / "ri.npy", numeros)
+    mapeado = np.load(tmp_path / "ri.npy", mmap_mode="r")
+    for a, b in zip(conteos_tuplas(mapeado, 3, 3, 100), conteos_tuplas(numeros, 3, 3)):
+        assert np.array_equal(a, b)
+
+
+def test_series_multidimensional_con_la_diferencia_de_good():
+    numeros = np.random.default_rng(7).random(4000)
+    k = 4
+    psi = [0.0, 0.0]
+    for d in range(1, 4):
+        frecuencias = _conteos_fuerza_bruta(numeros, k, d)
+        esperada = len(numeros) / k ** d
+        psi.append(float(np.sum((frecuencias - esperada) ** 2) / esperada))
+    resultado = prueba_series_multidimensional(numeros, k=k, dimensiones=(1, 2, 3))
+    for fila in resultado["tabla"]:
+        d = fila["d"]
+        assert fila["psi_cuadrado"] == pytest.approx(psi[d + 1])
+        assert fila["chi_cuadrado"] == pytest.approx(psi[d + 1] - 2 * psi[d] + psi[d - 1])
+    # En 2D la primera diferencia es el estadístico de prueba_series
+    fila_2 = resultado["tabla"][1]
+    assert fila_2["chi_diferencia"] == pytest.approx(prueba_series(numeros, k=k)["estadistico"])
+    assert resultado["acepta_hipotesis"]
+
+
+def test_series_multidimensional_rechaza_pares_correlacionados():
+    # x_{i+1} = x_i + 1/3 (mod 1): uniforme en 1D, pero los pares caen sobre rectas
+    x = np.random.default_rng(8).random(1)
+    numeros = np.mod(x + np.arange(30000) / 3 + np.random.default_rng(9).random(30000) * 1e-3, 1.0)
+    assert not prueba_series_multidimensional(numeros, dimensiones=(2, 3))["acepta_hipotesis"]
+
+
+def test_k_por_defecto_respeta_la_frecuencia_minima():
+    for n, d_max in itertools.product((100, 10 ** 4, 10 ** 6), (2, 3, 5)):
+        k = _k_por_defecto(n, d_max)
+        assert k == 2 or n / k ** d_max >= 5
+    with pytest.raises(ValueError):
+        prueba_series_multidimensional(np.random.default_rng(1).random(3), dimensiones=(2, 5))
@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from generators import crear_generador
+from generators.cache import CacheSecuencias, generar_columnas_en_cache
+from ui.trabajador_generacion import TrabajadorGeneracion
+
+
+def test_trabajador_cancelado_entre_bloques_se_detiene():
+    total = 10_000
+    generador = crear_generador("Congruencial Lineal (LCG)", total)
+    trabajador = TrabajadorGeneracion(
+        lambda al_bloque: generar_columnas_en_cache(generador, "LCG", {}, CacheSecuencias(usar_disco=False),
+                                                    al_bloque=al_bloque, tam_bloque=100),
+        total)
+    progreso, terminado = [], []
+    trabajador.progreso.connect(lambda hechas, _total: progreso.append(hechas))
+    trabajador.progreso.connect(lambda hechas, _total: hechas >= 300 and trabajador.cancelar())
+    trabajador.terminado.connect(lambda resultados, cancelado: terminado.append((len(resultados), cancelado)))
+
+    trabajador.ejecutar()  # Sin hilo: las señales se entregan directamente
+
+    assert progreso == [100, 200, 300]
+    assert terminado == [(300, True)]
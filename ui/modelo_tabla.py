@@ -0,0 +1,75 @@
+# ------------------ MODELO DE TABLA VIRTUAL ------------------
+# QAbstractTableModel sobre un resultado columnar (TablaColumnar u otro objeto
+# con len() y fila(i) -> dict): no crea un QTableWidgetItem por celda, sino que
+# formatea cada fila recién cuando la vista la pide al hacerse visible. Así una
+# tabla de millones de filas abre al instante y con memoria constante.
+from collections import OrderedDict
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+def celdas_por_defecto(fila: dict, columnas) -> list:
+    return [f"{fila[c]:.6f}" if c == "Ri" else str(fila[c]) for c in columnas]
+
+
+class ModeloTablaColumnar(QAbstractTableModel):
+    # Filas ya formateadas que se conservan (la vista pide cada celda por separado)
+    FILAS_EN_CACHE = 1024
+
+    def __init__(self, columnas, parent=None):
+        super().__init__(parent)
+        self.columnas = list(columnas)
+        self._datos = None
+        self._filas = 0
+        self._formatear_celdas = celdas_por_defecto
+        self._cache = OrderedDict()
+
+    def mostrar(self, datos, formatear_celdas=None):
+        """Reemplaza el contenido; formatear_celdas(fila, columnas) -> lista de textos."""
+        self.beginResetModel()
+        self._datos = datos
+        self._filas = 0 if datos is None else len(datos)
+        self._formatear_celdas = formatear_celdas or celdas_por_defecto
+        self._cache.clear()
+        self.endResetModel()
+
+    def crecer(self, datos, formatear_celdas=None):
+        """Muestra un resultado que crece (generación por bloques): solo avisa las filas nuevas."""
+        if datos is not self._datos:
+            self.mostrar(datos, formatear_celdas)
+            return
+        filas = len(datos)
+        if filas > self._filas:
+            self.beginInsertRows(QModelIndex(), self._filas, filas - 1)
+            self._filas = filas
+            self.endInsertRows()
+
+    def limpiar(self):
+        self.mostrar(None)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._filas
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columnas)
+
+    def _celdas(self, i: int) -> list:
+        celdas = self._cache.get(i)
+        if celdas is None:
+            celdas = self._formatear_celdas(self._datos.fila(i), self.columnas)
+            self._cache[i] = celdas
+            if len(self._cache) > self.FILAS_EN_CACHE:
+                self._cache.popitem(last=False)
+        return celdas
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid() or self._datos is None:
+            return None
+        return self._celdas(index.row())[index.column()]
+
+    def headerData(self, seccion, orientacion, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientacion == Qt.Orientation.Horizontal:
+            return self.columnas[seccion] if seccion < len(self.columnas) else None
+        return str(seccion + 1)
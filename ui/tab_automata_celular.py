@@ -25,6 +25,8 @@ from collections import deque
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+from utils.almacen import ALMACEN
+
 
 class TabAutomataCelular(QWidget):
     def __init__(self, parent=None):
@@ -152,6 +154,17 @@ class TabAutomataCelular(QWidget):
         presets_layout.addWidget(self.btn_load_preset)
         top_row.addWidget(presets_box)
 
+        # Sembrar desde una secuencia Ri publicada por los generadores
+        ri_box = QGroupBox("Semilla (Ri)")
+        ri_layout = QHBoxLayout(ri_box)
+        self.combo_secuencias = QComboBox()
+        self.btn_sembrar_ri = QPushButton("Sembrar")
+        ri_layout.addWidget(self.combo_secuencias)
+        ri_layout.addWidget(self.btn_sembrar_ri)
+        top_row.addWidget(ri_box)
+        self._actualizar_secuencias()
+        ALMACEN.suscribir(self._actualizar_secuencias)
+
         layout.addLayout(top_row)
 
         # control row: common controls (play/pause/step for current mode)
@@ -215,6 +228,7 @@ class TabAutomataCelular(QWidget):
         self.btn_clear.clicked.connect(self.clear)
         self.table.cellClicked.connect(self._on_cell_clicked)
         self.btn_load_preset.clicked.connect(self._on_load_preset)
+        self.btn_sembrar_ri.clicked.connect(self._on_sembrar_ri)
         self.btn_apply_rule.clicked.connect(self._on_apply_rule)
         self.btn_save.clicked.connect(self._on_save_csv)
         self.btn_load.clicked.connect(self._on_load_csv)
@@ -710,6 +724,20 @@ class TabAutomataCelular(QWidget):
     def _on_random(self):
         self.randomize(fill_prob=0.3)
 
+    def _actualizar_secuencias(self):
+        actual = self.combo_secuencias.currentText()
+        self.combo_secuencias.clear()
+        self.combo_secuencias.addItems(ALMACEN.nombres())
+        self.combo_secuencias.setCurrentIndex(max(self.combo_secuencias.findText(actual), 0))
+
+    def _on_sembrar_ri(self):
+        ri = ALMACEN.obtener(self.combo_secuencias.currentText())
+        if ri is None or len(ri) == 0:
+            QMessageBox.warning(self, "Advertencia", "No hay secuencias generadas. Genere números primero.")
+            return
+        # Misma densidad (30 %) que "Generar aleatorio"
+        self.cargar_desde_ri(ri, umbral=0.7)
+
     def _on_apply_size(self):
         n = self.spin_n.value()
         self._create_grid(n)
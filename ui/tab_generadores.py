@@ -5,12 +5,10 @@
 
 import sys
 import csv
-import math
-import random
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QComboBox, QHeaderView, QStackedWidget,
-    QDialog, QFileDialog, QMessageBox, QGroupBox, QFrame, QFormLayout
+    QTableView, QComboBox, QHeaderView, QStackedWidget,
+    QDialog, QFileDialog, QMessageBox, QGroupBox, QFrame, QFormLayout, QProgressBar
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
@@ -18,16 +16,41 @@ from PyQt6.QtGui import QFont
 # Matplotlib (usar backend qtagg)
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import pandas as pd
 import numpy as np
 
 # Importar tus generadores existentes (deben existir esos módulos)
 from generators.cuadrados_medios import CuadradosMedios
 from generators.productos_medios import ProductosMedios
 from generators.multiplicador_constante import MultiplicadorConstante
+from generators.congruencial_lineal import LCG
+from generators import GENERADORES, crear_generador
+from generators.grafo_funcional import D_MAX_TABLA
+from generators.nucleo import TablaColumnar
+from generators.cache import generar_columnas_en_cache
+from generators.barrido import (
+    SEMILLA_MAX, SEMILLA_MIN, barrer_cuadrados_medios, barrer_multiplicador_constante, barrer_productos_medios,
+    filas_barrido
+)
+from utils.almacen import ALMACEN
+from utils.exporter import exportar_csv_bloques, exportar_secuencia
+from ui.modelo_tabla import ModeloTablaColumnar
+from ui.trabajador_generacion import TrabajadorGeneracion, TrabajadorTarea, lanzar_en_hilo
+
+FILTROS_EXPORTACION = "Secuencia NumPy (*.npy);;CSV Files (*.csv)"
+
+# Generadores que usan la página genérica (el resto tiene página propia)
+GENERADORES_GENERICOS = ["Xorshift128+", "PCG32", "SplitMix64", "MRG32k3a", "Halton", "Sobol"]
 
 
 # ----------------- Widgets reutilizables -----------------
+def crear_tabla(columnas):
+    """QTableView con un ModeloTablaColumnar vacío (las celdas se formatean al hacerse visibles)."""
+    tabla = QTableView()
+    tabla.setModel(ModeloTablaColumnar(columnas, tabla))
+    tabla.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+    return tabla
+
+
 class ModernButton(QPushButton):
     def __init__(self, text, parent=None, color="#4a90e2", hover_color="#357abd", pressed_color="#2a5d90"):
         super().__init__(text, parent)
@@ -78,7 +101,8 @@ class HistogramResultWindow(QDialog):
     def __init__(self, ri_list, parent=None, titulo="Generador"):
         super().__init__(parent)
         self.setWindowTitle(f"Histograma - {titulo}")
-        self.ri_list = list(ri_list)
+        self.titulo = titulo
+        self.ri = np.asarray(ri_list, dtype=np.float64)
         self._build_ui()
         self._populate_table()
         self._draw_histogram()
@@ -87,10 +111,7 @@ class HistogramResultWindow(QDialog):
     def _build_ui(self):
         layout = QVBoxLayout(self)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(["Iteración", "Ri"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table = crear_tabla(["Iteración", "Ri"])
         layout.addWidget(self.table)
 
         self.fig = Figure(figsize=(6, 3))
@@ -98,41 +119,36 @@ class HistogramResultWindow(QDialog):
         layout.addWidget(self.canvas)
 
         btns = QHBoxLayout()
-        self.btn_export = ModernButton("Exportar CSV", color="#fdcb6e")
+        self.btn_export = ModernButton("Exportar", color="#fdcb6e")
         self.btn_close = ModernButton("Cerrar", color="#aaaaaa")
         btns.addStretch()
         btns.addWidget(self.btn_export)
         btns.addWidget(self.btn_close)
         layout.addLayout(btns)
 
-        self.btn_export.clicked.connect(self._export_csv)
+        self.btn_export.clicked.connect(self._exportar)
         self.btn_close.clicked.connect(self.close)
 
     def _populate_table(self):
-        n = len(self.ri_list)
-        self.table.setRowCount(n)
-        for i in range(n):
-            it = QTableWidgetItem(str(i + 1))
-            ri_item = QTableWidgetItem(f"{self.ri_list[i]:.6f}")
-            self.table.setItem(i, 0, it)
-            self.table.setItem(i, 1, ri_item)
+        ri = self.ri
+        self.table.model().mostrar(TablaColumnar(["Iteración", "Ri"], ri, ri, lambda i: {"Iteración": i + 1, "Ri": float(ri[i])}))
 
     def _draw_histogram(self):
         self.fig.clear()
         ax = self.fig.add_subplot(111)
         
-        if not self.ri_list:
+        if len(self.ri) == 0:
             ax.text(0.5, 0.5, "No hay datos para graficar", ha='center', va='center')
             self.canvas.draw()
             return
 
         # Histograma simple de los Ri
-        ax.hist(self.ri_list, bins=min(20, len(self.ri_list)), density=True, 
+        ax.hist(self.ri, bins=min(20, len(self.ri)), density=True, 
                 edgecolor='white', alpha=0.8, color='#4a90e2')
         
         # Calcular estadísticas
-        mean_val = np.mean(self.ri_list)
-        std_val = np.std(self.ri_list)
+        mean_val = np.mean(self.ri)
+        std_val = np.std(self.ri)
         
         # Línea de media
         ax.axvline(mean_val, color='red', linestyle='--', linewidth=1.5, 
@@ -145,19 +161,148 @@ class HistogramResultWindow(QDialog):
         ax.grid(alpha=0.3)
         self.canvas.draw()
 
-    def _export_csv(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Guardar CSV", "numeros_generados.csv", "CSV Files (*.csv)")
+    def _exportar(self):
+        path, filtro = QFileDialog.getSaveFileName(self, "Guardar Ri", "numeros_generados.npy", FILTROS_EXPORTACION)
         if not path:
             return
         try:
-            with open(path, mode="w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Iteracion", "Ri"])
-                for i, r in enumerate(self.ri_list, start=1):
-                    writer.writerow([i, f"{r:.8f}"])
-            QMessageBox.information(self, "Éxito", f"CSV guardado en: {path}")
+            if path.endswith(".csv") or filtro.startswith("CSV"):
+                exportar_csv_bloques(path, [self.ri])
+            else:
+                exportar_secuencia(path, self.ri, algoritmo=self.titulo)
+            QMessageBox.information(self, "Éxito", f"Secuencia guardada en: {path}")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"No se pudo guardar CSV: {e}")
+            QMessageBox.critical(self, "Error", f"No se pudo guardar la secuencia: {e}")
+
+
+# ----------------- Ventana de barrido de semillas -----------------
+class _FilasBarrido:
+    """Adaptador de las columnas de un barrido a len()/fila(i) para ModeloTablaColumnar."""
+
+    def __init__(self, resultados):
+        self.resultados = resultados
+
+    def __len__(self):
+        return len(self.resultados["periodo"])
+
+    def fila(self, i):
+        return filas_barrido(self.resultados, i, i + 1)[0]
+
+
+def _celdas_barrido(fila, columnas):
+    return [f"{v:.6f}" if isinstance(v, float) else ("✓" if v is True else "✗" if v is False else str(v))
+            for v in (fila[c] for c in columnas)]
+
+
+class BarridoDialog(QDialog):
+    # metodo -> (función de barrido, columnas de parámetros, nombres de los rangos)
+    METODOS = {
+        "Cuadrados Medios": (barrer_cuadrados_medios, ["semilla"], []),
+        "Productos Medios": (barrer_productos_medios, ["semilla1", "semilla2"], ["semillas1", "semillas2"]),
+        "Multiplicador Constante": (barrer_multiplicador_constante, ["semilla", "k"], ["semillas", "constantes"]),
+    }
+    FILAS_VISIBLES = 1000
+    # Rango inicial del segundo eje (constantes k o semillas 2): el barrido completo
+    # de 9000 x 9000 combinaciones tarda minutos, así que se empieza por 100 valores
+    RANGO_SECUNDARIO = (SEMILLA_MIN, SEMILLA_MIN + 99)
+    # Por encima de estas combinaciones se pide confirmación antes de barrer
+    COMBINACIONES_CONFIRMAR = 2_000_000
+
+    def __init__(self, metodo, al_elegir=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Barrido de semillas - {metodo}")
+        self.metodo = metodo
+        self.al_elegir = al_elegir
+        self.resultados = None
+        self._hilo = None
+        self._trabajador = None
+        self._build_ui()
+        self.resize(900, 600)
+
+    def _build_ui(self):
+        layout = QVBoxLayout(self)
+        _, self.columnas_param, rangos = self.METODOS[self.metodo]
+
+        form = QFormLayout()
+        self.input_n = ModernLineEdit("Ri evaluados por semilla")
+        self.input_n.setText("100")
+        form.addRow("Cantidad n:", self.input_n)
+        self.inputs_rango = {}
+        for nombre in (rangos or ["desde_hasta"]):
+            minimo, maximo = self.RANGO_SECUNDARIO if nombre in ("semillas2", "constantes") else (SEMILLA_MIN, SEMILLA_MAX)
+            desde = ModernLineEdit(str(SEMILLA_MIN)); desde.setText(str(minimo))
+            hasta = ModernLineEdit(str(SEMILLA_MAX)); hasta.setText(str(maximo))
+            fila = QHBoxLayout(); fila.addWidget(desde); fila.addWidget(QLabel("a")); fila.addWidget(hasta)
+            etiqueta = "Semillas:" if nombre in ("desde_hasta", "semillas", "semillas1") else (
+                "Semillas 2:" if nombre == "semillas2" else "Constantes k:")
+            form.addRow(etiqueta, fila)
+            self.inputs_rango[nombre] = (desde, hasta)
+        layout.addLayout(form)
+
+        self.btn_barrer = ModernButton("Ejecutar barrido", color="#00b894")
+        self.btn_barrer.clicked.connect(self._ejecutar)
+        layout.addWidget(self.btn_barrer)
+
+        self.lbl_resumen = QLabel("Doble clic en una fila para usar esa semilla.")
+        layout.addWidget(self.lbl_resumen)
+
+        self.columnas = self.columnas_param + ["periodo", "cola", "distintos", "media", "varianza",
+                                               "chi_cuadrado", "acepta_medias", "acepta_varianza",
+                                               "acepta_uniformidad"]
+        self.table = crear_tabla(self.columnas)
+        self.table.doubleClicked.connect(lambda indice: self._elegir(indice.row(), indice.column()))
+        layout.addWidget(self.table)
+
+    def _ejecutar(self):
+        textos = [self.input_n.text().strip()] + [w.text().strip() for par in self.inputs_rango.values() for w in par]
+        if not all(t.isdigit() for t in textos) or int(textos[0]) < 2:
+            QMessageBox.warning(self, "Error", "Ingrese enteros válidos (n >= 2)")
+            return
+        if self._hilo is not None and not self._hilo.isFinished():
+            return
+        funcion = self.METODOS[self.metodo][0]
+        kwargs = {"n": int(textos[0]), "mejores": self.FILAS_VISIBLES}
+        combinaciones = 1
+        for nombre, (desde, hasta) in self.inputs_rango.items():
+            rango = (int(desde.text()), int(hasta.text()))
+            combinaciones *= max(rango[1] - rango[0] + 1, 0)
+            if nombre == "desde_hasta":
+                kwargs["desde"], kwargs["hasta"] = rango
+            else:
+                kwargs[nombre] = rango
+        if combinaciones > self.COMBINACIONES_CONFIRMAR:
+            respuesta = QMessageBox.question(
+                self, "Barrido grande",
+                f"Se evaluarán {combinaciones:,} combinaciones y puede tardar varios minutos. ¿Continuar?")
+            if respuesta != QMessageBox.StandardButton.Yes:
+                return
+
+        # El barrido (con su pool de procesos) corre en un QThread para no congelar la ventana
+        self._trabajador = TrabajadorTarea(lambda: funcion(**kwargs))
+        self._trabajador.terminado.connect(self._fin_barrido)
+        self._trabajador.error.connect(self._error_barrido)
+        self.btn_barrer.setEnabled(False)
+        self.lbl_resumen.setText(f"Barriendo {combinaciones:,} combinaciones...")
+        self._hilo = lanzar_en_hilo(self._trabajador)
+
+    def _error_barrido(self, mensaje):
+        self.btn_barrer.setEnabled(True)
+        self.lbl_resumen.setText("Doble clic en una fila para usar esa semilla.")
+        QMessageBox.warning(self, "Error", mensaje)
+
+    def _fin_barrido(self, resultados):
+        self.btn_barrer.setEnabled(True)
+        self.resultados = resultados
+        filas = _FilasBarrido(self.resultados)
+        self.table.model().mostrar(filas, _celdas_barrido)
+        self.lbl_resumen.setText(f"Mejores {len(filas)} configuraciones por periodo. Doble clic para usar una.")
+
+    def _elegir(self, row, _col):
+        if self.resultados is None or self.al_elegir is None:
+            return
+        fila = filas_barrido(self.resultados, row, row + 1)[0]
+        self.al_elegir(*[fila[c] for c in self.columnas_param])
+        self.close()
 
 
 # ----------------- Tab principal -----------------
@@ -167,8 +312,14 @@ class TabGeneradores(QWidget):
         self.setup_styles()
         self.init_ui()
 
+    def nombre_actual(self):
+        """Nombre con el que publica en el almacén la página seleccionada en el combo."""
+        return self.combo_generador.currentText()
+
     def obtener_ri_actual(self):
-        return self.ri_list_cm
+        """Ri del generador seleccionado (el array del almacén; vacío si no generó)."""
+        ri = ALMACEN.obtener(self.nombre_actual())
+        return np.empty(0) if ri is None else ri
 
     def setup_styles(self):
         self.setStyleSheet("""
@@ -195,7 +346,8 @@ class TabGeneradores(QWidget):
         selector_row = QHBoxLayout()
         selector_row.addWidget(QLabel("Seleccione el generador:"))
         self.combo_generador = QComboBox()
-        self.combo_generador.addItems(["Cuadrados Medios", "Productos Medios", "Multiplicador Constante"])
+        self.combo_generador.addItems(["Cuadrados Medios", "Productos Medios", "Multiplicador Constante", "Congruencial Lineal (LCG)"])
+        self.combo_generador.addItems(GENERADORES_GENERICOS)
         selector_row.addWidget(self.combo_generador)
         selector_row.addStretch()
         main_layout.addLayout(selector_row)
@@ -203,17 +355,36 @@ class TabGeneradores(QWidget):
         self.stacked = QStackedWidget()
         main_layout.addWidget(self.stacked)
 
+        # Progreso de la generación en segundo plano (oculto mientras no hay trabajo)
+        self.fila_progreso = QWidget()
+        progreso_layout = QHBoxLayout(self.fila_progreso)
+        progreso_layout.setContentsMargins(0, 0, 0, 0)
+        self.barra_progreso = QProgressBar()
+        self.btn_cancelar = ModernButton("Cancelar", color="#e17055")
+        self.btn_cancelar.clicked.connect(self.cancelar_generacion)
+        progreso_layout.addWidget(self.barra_progreso)
+        progreso_layout.addWidget(self.btn_cancelar)
+        self.fila_progreso.hide()
+        main_layout.addWidget(self.fila_progreso)
+        self._trabajo = None  # Generación en curso
+        self._hilos = []  # (hilo, trabajador) vivos hasta que el hilo termina
+
         self.pagina_cm = self.crear_pagina_cm()
         self.pagina_pm = self.crear_pagina_pm()
         self.pagina_mc = self.crear_pagina_mc()
+        self.pagina_lcg = self.crear_pagina_lcg()
         self.stacked.addWidget(self.pagina_cm)
         self.stacked.addWidget(self.pagina_pm)
         self.stacked.addWidget(self.pagina_mc)
+        self.stacked.addWidget(self.pagina_lcg)
+        # Resto del registro (64 bits, MRG32k3a, cuasialeatorios): página genérica desde sus PARAMETROS
+        self.paginas_genericas = {}
+        for nombre in GENERADORES_GENERICOS:
+            self.stacked.addWidget(self.crear_pagina_generica(nombre))
 
-        # listas Ri
-        self.ri_list_cm = []
-        self.ri_list_pm = []
-        self.ri_list_mc = []
+        # Los Ri de cada página se publican en ALMACEN bajo su nombre.
+        # Última secuencia de cada página (columnas + metadatos) para exportar desde los arrays
+        self.secuencias = {}
 
         # ventanas abiertas para mantener referencia
         self._open_windows = []
@@ -251,34 +422,40 @@ class TabGeneradores(QWidget):
         pagina = QWidget(); layout = QVBoxLayout(pagina); layout.setSpacing(10)
         self.semilla_input_cm = ModernLineEdit("Semilla X0 (entero)")
         self.cantidad_input_cm = ModernLineEdit("Cantidad n (entero)")
-        group = self.crear_group_inputs([("Semilla X0:", self.semilla_input_cm), ("Cantidad n:", self.cantidad_input_cm)])
+        self.digitos_input_cm = ModernLineEdit("Dígitos d (par, 4 por defecto)")
+        group = self.crear_group_inputs([
+            ("Semilla X0:", self.semilla_input_cm),
+            ("Cantidad n:", self.cantidad_input_cm),
+            ("Dígitos d:", self.digitos_input_cm)
+        ])
         layout.addWidget(group)
 
         self.btn_generar_cm = ModernButton("Generar Números", color="#00b894")
         self.btn_limpiar_cm = ModernButton("Limpiar", color="#fd79a8")
         self.btn_hist_cm = ModernButton("Ver Histograma", color="#6c5ce7")
-        self.btn_exportar_cm = ModernButton("Exportar CSV", color="#fdcb6e")
-        layout.addWidget(self.crear_group_buttons([self.btn_generar_cm, self.btn_limpiar_cm, self.btn_hist_cm, self.btn_exportar_cm]))
+        self.btn_exportar_cm = ModernButton("Exportar", color="#fdcb6e")
+        self.btn_barrido_cm = ModernButton("Barrido de semillas", color="#0984e3")
+        layout.addWidget(self.crear_group_buttons([self.btn_generar_cm, self.btn_limpiar_cm, self.btn_hist_cm, self.btn_exportar_cm, self.btn_barrido_cm]))
 
-        self.tabla_cm = QTableWidget()
-        self.tabla_cm.setColumnCount(5)
-        self.tabla_cm.setHorizontalHeaderLabels(["Iteración", "Xi-1", "Xi^2", "Xi", "Ri"])
-        self.tabla_cm.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.tabla_cm = crear_tabla(CuadradosMedios.COLUMNAS)
         layout.addWidget(self.tabla_cm)
 
         # conexiones
         self.btn_generar_cm.clicked.connect(self.generar_cm)
         self.btn_limpiar_cm.clicked.connect(self.limpiar_cm)
-        self.btn_hist_cm.clicked.connect(lambda: self.ver_histograma_ventana(self.ri_list_cm, "Cuadrados Medios"))
-        self.btn_exportar_cm.clicked.connect(lambda: self.exportar_csv(self.tabla_cm, "CuadradosMedios"))
+        self.btn_hist_cm.clicked.connect(lambda: self.ver_histograma_ventana(ALMACEN.obtener("Cuadrados Medios"), "Cuadrados Medios"))
+        self.btn_exportar_cm.clicked.connect(lambda: self.exportar("Cuadrados Medios", "CuadradosMedios"))
+        self.btn_barrido_cm.clicked.connect(lambda: self.abrir_barrido("Cuadrados Medios", lambda s: self.semilla_input_cm.setText(str(s))))
 
         return pagina
 
     def limpiar_cm(self):
-        self.tabla_cm.setRowCount(0)
+        self.tabla_cm.model().limpiar()
         self.semilla_input_cm.clear()
         self.cantidad_input_cm.clear()
-        self.ri_list_cm = []
+        self.digitos_input_cm.clear()
+        self.secuencias.pop("Cuadrados Medios", None)
+        ALMACEN.eliminar("Cuadrados Medios")
 
     def generar_cm(self):
         sem = self.semilla_input_cm.text().strip()
@@ -293,18 +470,44 @@ class TabGeneradores(QWidget):
         if semilla <= 0 or n <= 0:
             QMessageBox.warning(self, "Error", "Valores deben ser positivos")
             return
+        d_text = self.digitos_input_cm.text().strip() or "4"
+        if not d_text.isdigit():
+            QMessageBox.warning(self, "Error", "La cantidad de dígitos d debe ser un entero")
+            return
 
-        generador = CuadradosMedios(semilla, n)
-        resultados = generador.generar_tabla()
-        self.ri_list_cm = [r["Ri"] for r in resultados]
+        try:
+            generador = CuadradosMedios(semilla, n, d=int(d_text))
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return
 
-        self.tabla_cm.setRowCount(len(resultados))
-        for i, r in enumerate(resultados):
-            self.tabla_cm.setItem(i, 0, QTableWidgetItem(str(r["Iteración"])))
-            self.tabla_cm.setItem(i, 1, QTableWidgetItem(r["Xi-1"]))
-            self.tabla_cm.setItem(i, 2, QTableWidgetItem(r["Xi^2"]))
-            self.tabla_cm.setItem(i, 3, QTableWidgetItem(r["Xi"]))
-            self.tabla_cm.setItem(i, 4, QTableWidgetItem(f"{r['Ri']:.6f}"))
+        # Avisar antes de generar si la semilla degenera en un ciclo corto
+        diag = generador.diagnostico() if generador.d <= D_MAX_TABLA else None
+        if diag and n > diag["distintos"]:
+            ciclo = ", ".join(str(c).zfill(generador.d) for c in diag["ciclo"])
+            resp = QMessageBox.question(
+                self, "Semilla degenerada",
+                f"La semilla {semilla} entra en el ciclo [{ciclo}] después de {diag['cola']} iteraciones.\n"
+                f"Solo {diag['distintos']} de los {n} números son distintos; el resto repite el ciclo.\n\n"
+                f"¿Generar solo los {diag['distintos']} números útiles?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
+                QMessageBox.StandardButton.Yes
+            )
+            if resp == QMessageBox.StandardButton.Cancel:
+                return
+            if resp == QMessageBox.StandardButton.Yes:
+                n = diag["distintos"]
+                generador.n = n
+
+        estado = generador.obtener_estado()
+        parametros = {"semilla": semilla, "d": generador.d}
+
+        def al_terminar(resultados):
+            self.guardar_secuencia("Cuadrados Medios", resultados, parametros, estado)
+
+        self.iniciar_generacion(
+            lambda al_bloque: generar_columnas_en_cache(generador, "Cuadrados Medios", parametros, al_bloque=al_bloque),
+            generador.n, self.tabla_cm, al_terminar)
 
     # ---------------- Página: Productos Medios ----------------
     def crear_pagina_pm(self):
@@ -322,28 +525,28 @@ class TabGeneradores(QWidget):
         self.btn_generar_pm = ModernButton("Generar Números", color="#353b3a")
         self.btn_limpiar_pm = ModernButton("Limpiar", color="#1f3c68")
         self.btn_hist_pm = ModernButton("Ver Histograma", color="#6c5ce7")
-        self.btn_exportar_pm = ModernButton("Exportar CSV", color="#063dd4")
-        layout.addWidget(self.crear_group_buttons([self.btn_generar_pm, self.btn_limpiar_pm, self.btn_hist_pm, self.btn_exportar_pm]))
+        self.btn_exportar_pm = ModernButton("Exportar", color="#063dd4")
+        self.btn_barrido_pm = ModernButton("Barrido de semillas", color="#0984e3")
+        layout.addWidget(self.crear_group_buttons([self.btn_generar_pm, self.btn_limpiar_pm, self.btn_hist_pm, self.btn_exportar_pm, self.btn_barrido_pm]))
 
-        self.tabla_pm = QTableWidget()
-        self.tabla_pm.setColumnCount(6)
-        self.tabla_pm.setHorizontalHeaderLabels(["Iteración", "X", "Y", "Producto", "Dígitos del centro", "Ri"])
-        self.tabla_pm.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.tabla_pm = crear_tabla(ProductosMedios.COLUMNAS)
         layout.addWidget(self.tabla_pm)
 
         self.btn_generar_pm.clicked.connect(self.generar_pm)
         self.btn_limpiar_pm.clicked.connect(self.limpiar_pm)
-        self.btn_hist_pm.clicked.connect(lambda: self.ver_histograma_ventana(self.ri_list_pm, "Productos Medios"))
-        self.btn_exportar_pm.clicked.connect(lambda: self.exportar_csv(self.tabla_pm, "ProductosMedios"))
+        self.btn_hist_pm.clicked.connect(lambda: self.ver_histograma_ventana(ALMACEN.obtener("Productos Medios"), "Productos Medios"))
+        self.btn_exportar_pm.clicked.connect(lambda: self.exportar("Productos Medios", "ProductosMedios"))
+        self.btn_barrido_pm.clicked.connect(lambda: self.abrir_barrido("Productos Medios", lambda s1, s2: (self.semilla1_input_pm.setText(str(s1)), self.semilla2_input_pm.setText(str(s2)))))
 
         return pagina
 
     def limpiar_pm(self):
-        self.tabla_pm.setRowCount(0)
+        self.tabla_pm.model().limpiar()
         self.semilla1_input_pm.clear()
         self.semilla2_input_pm.clear()
         self.cantidad_input_pm.clear()
-        self.ri_list_pm = []
+        self.secuencias.pop("Productos Medios", None)
+        ALMACEN.eliminar("Productos Medios")
 
     def generar_pm(self):
         s1 = self.semilla1_input_pm.text().strip()
@@ -356,17 +559,15 @@ class TabGeneradores(QWidget):
             QMessageBox.warning(self, "Error", "Semillas y cantidad deben ser enteros")
             return
         generator = ProductosMedios(int(s1), int(s2), int(n_text))
-        resultados = generator.generar_tabla()
-        self.ri_list_pm = [r["Ri"] for r in resultados]
-
-        self.tabla_pm.setRowCount(len(resultados))
-        for i, r in enumerate(resultados):
-            self.tabla_pm.setItem(i, 0, QTableWidgetItem(str(r["Iteración"])))
-            self.tabla_pm.setItem(i, 1, QTableWidgetItem(r["X"]))
-            self.tabla_pm.setItem(i, 2, QTableWidgetItem(r["Y"]))
-            self.tabla_pm.setItem(i, 3, QTableWidgetItem(r["Producto"]))
-            self.tabla_pm.setItem(i, 4, QTableWidgetItem(r["Dígitos del centro"]))
-            self.tabla_pm.setItem(i, 5, QTableWidgetItem(f"{r['Ri']:.6f}"))
+        estado = generator.obtener_estado()
+        parametros = {"semilla1": int(s1), "semilla2": int(s2)}
+
+        def al_terminar(resultados):
+            self.guardar_secuencia("Productos Medios", resultados, parametros, estado)
+
+        self.iniciar_generacion(
+            lambda al_bloque: generar_columnas_en_cache(generator, "Productos Medios", parametros, al_bloque=al_bloque),
+            generator.n, self.tabla_pm, al_terminar)
 
     # ---------------- Página: Multiplicador Constante ----------------
     def crear_pagina_mc(self):
@@ -384,28 +585,28 @@ class TabGeneradores(QWidget):
         self.btn_generar_mc = ModernButton("Generar Números", color="#07033f")
         self.btn_limpiar_mc = ModernButton("Limpiar", color="#b1afb9")
         self.btn_hist_mc = ModernButton("Ver Histograma", color="#090430")
-        self.btn_exportar_mc = ModernButton("Exportar CSV", color="#696661")
-        layout.addWidget(self.crear_group_buttons([self.btn_generar_mc, self.btn_limpiar_mc, self.btn_hist_mc, self.btn_exportar_mc]))
+        self.btn_exportar_mc = ModernButton("Exportar", color="#696661")
+        self.btn_barrido_mc = ModernButton("Barrido de semillas", color="#0984e3")
+        layout.addWidget(self.crear_group_buttons([self.btn_generar_mc, self.btn_limpiar_mc, self.btn_hist_mc, self.btn_exportar_mc, self.btn_barrido_mc]))
 
-        self.tabla_mc = QTableWidget()
-        self.tabla_mc.setColumnCount(5)
-        self.tabla_mc.setHorizontalHeaderLabels(["Iteración", "Xi", "k*Xi", "Dígitos del centro", "Ri"])
-        self.tabla_mc.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.tabla_mc = crear_tabla(MultiplicadorConstante.COLUMNAS)
         layout.addWidget(self.tabla_mc)
 
         self.btn_generar_mc.clicked.connect(self.generar_mc)
         self.btn_limpiar_mc.clicked.connect(self.limpiar_mc)
-        self.btn_hist_mc.clicked.connect(lambda: self.ver_histograma_ventana(self.ri_list_mc, "Multiplicador Constante"))
-        self.btn_exportar_mc.clicked.connect(lambda: self.exportar_csv(self.tabla_mc, "MultiplicadorConstante"))
+        self.btn_hist_mc.clicked.connect(lambda: self.ver_histograma_ventana(ALMACEN.obtener("Multiplicador Constante"), "Multiplicador Constante"))
+        self.btn_exportar_mc.clicked.connect(lambda: self.exportar("Multiplicador Constante", "MultiplicadorConstante"))
+        self.btn_barrido_mc.clicked.connect(lambda: self.abrir_barrido("Multiplicador Constante", lambda s, k: (self.semilla_input_mc.setText(str(s)), self.constante_input_mc.setText(str(k)))))
 
         return pagina
 
     def limpiar_mc(self):
-        self.tabla_mc.setRowCount(0)
+        self.tabla_mc.model().limpiar()
         self.semilla_input_mc.clear()
         self.constante_input_mc.clear()
         self.cantidad_input_mc.clear()
-        self.ri_list_mc = []
+        self.secuencias.pop("Multiplicador Constante", None)
+        ALMACEN.eliminar("Multiplicador Constante")
 
     def generar_mc(self):
         sem = self.semilla_input_mc.text().strip()
@@ -418,23 +619,205 @@ class TabGeneradores(QWidget):
             QMessageBox.warning(self, "Error", "Semilla, constante y cantidad deben ser enteros")
             return
         generator = MultiplicadorConstante(int(sem), int(const), int(n_text))
-        resultados = generator.generar_tabla()
-        self.ri_list_mc = [r["Ri"] for r in resultados]
-
-        self.tabla_mc.setRowCount(len(resultados))
-        for i, r in enumerate(resultados):
-            k = int(const)
-            xi = int(r["Xi"])
-            mult_str = f"{xi} * {k} = {r['k*Xi']}"
-            self.tabla_mc.setItem(i, 0, QTableWidgetItem(str(r["Iteración"])))
-            self.tabla_mc.setItem(i, 1, QTableWidgetItem(str(r["Xi"])))
-            self.tabla_mc.setItem(i, 2, QTableWidgetItem(mult_str))
-            self.tabla_mc.setItem(i, 3, QTableWidgetItem(r["Dígitos del centro"]))
-            self.tabla_mc.setItem(i, 4, QTableWidgetItem(f"{r['Ri']:.6f}"))
+        estado = generator.obtener_estado()
+        parametros = {"semilla": int(sem), "k": int(const)}
+        k = int(const)
+
+        def celdas(r, _columnas):
+            mult_str = f"{int(r['Xi'])} * {k} = {r['k*Xi']}"
+            return [str(r["Iteración"]), str(r["Xi"]), mult_str, r["Dígitos del centro"], f"{r['Ri']:.6f}"]
+
+        def al_terminar(resultados):
+            self.guardar_secuencia("Multiplicador Constante", resultados, parametros, estado)
+
+        self.iniciar_generacion(
+            lambda al_bloque: generar_columnas_en_cache(generator, "Multiplicador Constante", parametros, al_bloque=al_bloque),
+            generator.n, self.tabla_mc, al_terminar, celdas)
+
+    # ---------------- Página: Congruencial Lineal (LCG) ----------------
+    def crear_pagina_lcg(self):
+        pagina = QWidget(); layout = QVBoxLayout(pagina); layout.setSpacing(10)
+        self.semilla_input_lcg = ModernLineEdit("Semilla X0 (entero)")
+        self.a_input_lcg = ModernLineEdit("Multiplicador a (1103515245 por defecto)")
+        self.c_input_lcg = ModernLineEdit("Incremento c (12345 por defecto)")
+        self.m_input_lcg = ModernLineEdit("Módulo m (2147483648 por defecto)")
+        self.cantidad_input_lcg = ModernLineEdit("Cantidad n (entero)")
+        group = self.crear_group_inputs([
+            ("Semilla X0:", self.semilla_input_lcg),
+            ("Multiplicador a:", self.a_input_lcg),
+            ("Incremento c:", self.c_input_lcg),
+            ("Módulo m:", self.m_input_lcg),
+            ("Cantidad n:", self.cantidad_input_lcg)
+        ])
+        layout.addWidget(group)
+
+        self.btn_generar_lcg = ModernButton("Generar Números", color="#00b894")
+        self.btn_limpiar_lcg = ModernButton("Limpiar", color="#fd79a8")
+        self.btn_hist_lcg = ModernButton("Ver Histograma", color="#6c5ce7")
+        self.btn_exportar_lcg = ModernButton("Exportar", color="#fdcb6e")
+        layout.addWidget(self.crear_group_buttons([self.btn_generar_lcg, self.btn_limpiar_lcg, self.btn_hist_lcg, self.btn_exportar_lcg]))
+
+        self.tabla_lcg = crear_tabla(LCG.COLUMNAS)
+        layout.addWidget(self.tabla_lcg)
+
+        self.btn_generar_lcg.clicked.connect(self.generar_lcg)
+        self.btn_limpiar_lcg.clicked.connect(self.limpiar_lcg)
+        self.btn_hist_lcg.clicked.connect(lambda: self.ver_histograma_ventana(ALMACEN.obtener("Congruencial Lineal (LCG)"), "Congruencial Lineal"))
+        self.btn_exportar_lcg.clicked.connect(lambda: self.exportar("Congruencial Lineal (LCG)", "CongruencialLineal"))
+
+        return pagina
+
+    def limpiar_lcg(self):
+        self.tabla_lcg.model().limpiar()
+        for campo in (self.semilla_input_lcg, self.a_input_lcg, self.c_input_lcg, self.m_input_lcg, self.cantidad_input_lcg):
+            campo.clear()
+        self.secuencias.pop("Congruencial Lineal (LCG)", None)
+        ALMACEN.eliminar("Congruencial Lineal (LCG)")
+
+    def generar_lcg(self):
+        sem = self.semilla_input_lcg.text().strip()
+        n_text = self.cantidad_input_lcg.text().strip()
+        if not sem or not n_text:
+            QMessageBox.warning(self, "Error", "Semilla y cantidad son obligatorias")
+            return
+        opcionales = [self.a_input_lcg.text().strip(), self.c_input_lcg.text().strip(), self.m_input_lcg.text().strip()]
+        if not all(t.isdigit() for t in [sem, n_text] + [t for t in opcionales if t]):
+            QMessageBox.warning(self, "Error", "Todos los parámetros deben ser enteros")
+            return
+        parametros = {nombre: int(t) for nombre, t in zip(("a", "c", "m"), opcionales) if t}
+        try:
+            generator = LCG(int(sem), int(n_text), **parametros)
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return
+        estado = generator.obtener_estado()
+        parametros = {"semilla": int(sem), **parametros}
+
+        def al_terminar(resultados):
+            self.guardar_secuencia("Congruencial Lineal (LCG)", resultados, parametros, estado)
+
+        self.iniciar_generacion(
+            lambda al_bloque: generar_columnas_en_cache(generator, "Congruencial Lineal (LCG)", parametros, al_bloque=al_bloque),
+            generator.n, self.tabla_lcg, al_terminar)
+
+    # ---------------- Página genérica (generadores del registro sin página propia) ----------------
+    def crear_pagina_generica(self, nombre):
+        clase = GENERADORES[nombre]
+        pagina = QWidget(); layout = QVBoxLayout(pagina); layout.setSpacing(10)
+        campos = {}
+        filas = []
+        for clave, etiqueta, defecto in clase.PARAMETROS:
+            campo = ModernLineEdit(f"{etiqueta} ({defecto} por defecto)")
+            campos[clave] = campo
+            filas.append((f"{etiqueta}:", campo))
+        cantidad = ModernLineEdit("Cantidad n (entero)")
+        filas.append(("Cantidad n:", cantidad))
+        layout.addWidget(self.crear_group_inputs(filas))
+
+        btn_generar = ModernButton("Generar Números", color="#00b894")
+        btn_limpiar = ModernButton("Limpiar", color="#fd79a8")
+        btn_hist = ModernButton("Ver Histograma", color="#6c5ce7")
+        btn_exportar = ModernButton("Exportar", color="#fdcb6e")
+        layout.addWidget(self.crear_group_buttons([btn_generar, btn_limpiar, btn_hist, btn_exportar]))
+
+        tabla = crear_tabla(clase.COLUMNAS)
+        layout.addWidget(tabla)
+
+        self.paginas_genericas[nombre] = {"campos": campos, "cantidad": cantidad, "tabla": tabla}
+        btn_generar.clicked.connect(lambda: self.generar_generico(nombre))
+        btn_limpiar.clicked.connect(lambda: self.limpiar_generico(nombre))
+        btn_hist.clicked.connect(lambda: self.ver_histograma_ventana(ALMACEN.obtener(nombre), nombre))
+        btn_exportar.clicked.connect(lambda: self.exportar(nombre, nombre.replace("+", "Plus")))
+        return pagina
+
+    def limpiar_generico(self, nombre):
+        pagina = self.paginas_genericas[nombre]
+        pagina["tabla"].model().limpiar()
+        for campo in list(pagina["campos"].values()) + [pagina["cantidad"]]:
+            campo.clear()
+        self.secuencias.pop(nombre, None)
+        ALMACEN.eliminar(nombre)
+
+    def generar_generico(self, nombre):
+        pagina = self.paginas_genericas[nombre]
+        n_text = pagina["cantidad"].text().strip()
+        textos = {clave: campo.text().strip() for clave, campo in pagina["campos"].items()}
+        if not n_text or not all(t.isdigit() for t in [n_text] + [t for t in textos.values() if t]):
+            QMessageBox.warning(self, "Error", "La cantidad es obligatoria y todos los parámetros deben ser enteros")
+            return
+        parametros = {c: int(t) for c, t in textos.items() if t}
+        try:
+            generador = crear_generador(nombre, int(n_text), **parametros)
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return
+        estado = generador.obtener_estado()
+
+        def al_terminar(resultados):
+            self.guardar_secuencia(nombre, resultados, parametros, estado)
+
+        self.iniciar_generacion(
+            lambda al_bloque: generar_columnas_en_cache(generador, nombre, parametros, al_bloque=al_bloque),
+            generador.n, pagina["tabla"], al_terminar)
+
+    # ---------------- Generación en segundo plano ----------------
+    def iniciar_generacion(self, generar, total, tabla, al_terminar, formatear_celdas=None):
+        """
+        Corre generar(al_bloque) (-> TablaColumnar) en un hilo; la tabla virtual
+        crece con cada bloque. al_terminar(resultados) recibe la corrida (parcial si se canceló).
+        """
+        if self._trabajo is not None:
+            QMessageBox.information(self, "Generación en curso", "Espere a que termine o cancele la generación actual.")
+            return
+        self._hilos = [(h, t) for h, t in self._hilos if not h.isFinished()]
+        tabla.model().limpiar()
+        trabajador = TrabajadorGeneracion(generar, total)
+        trabajador.progreso.connect(self._progreso_generacion)
+        trabajador.bloque_listo.connect(self._bloque_generado)
+        trabajador.terminado.connect(self._fin_generacion)
+        trabajador.error.connect(self._error_generacion)
+        self._trabajo = {"trabajador": trabajador, "tabla": tabla, "al_terminar": al_terminar,
+                         "formatear_celdas": formatear_celdas}
+        self.barra_progreso.setRange(0, max(total, 1))
+        self.barra_progreso.setValue(0)
+        self.btn_cancelar.setEnabled(True)
+        self.fila_progreso.show()
+        self._hilos.append((lanzar_en_hilo(trabajador), trabajador))
+
+    def cancelar_generacion(self):
+        if self._trabajo is not None:
+            self._trabajo["trabajador"].cancelar()
+            self.btn_cancelar.setEnabled(False)
+
+    def _progreso_generacion(self, hechas, total):
+        self.barra_progreso.setValue(min(hechas, total))
+
+    def _bloque_generado(self, parcial):
+        if self._trabajo is not None:
+            self._trabajo["tabla"].model().crecer(parcial, self._trabajo["formatear_celdas"])
+
+    def _fin_generacion(self, resultados, cancelado):
+        trabajo, self._trabajo = self._trabajo, None
+        self.fila_progreso.hide()
+        trabajo["tabla"].model().mostrar(resultados, trabajo["formatear_celdas"])
+        trabajo["al_terminar"](resultados)
+        if cancelado:
+            QMessageBox.information(self, "Generación cancelada", f"Se conservaron las primeras {len(resultados)} filas.")
+
+    def _error_generacion(self, mensaje):
+        self._trabajo = None
+        self.fila_progreso.hide()
+        QMessageBox.warning(self, "Error", mensaje)
+
+    # ---------------- Barrido de semillas ----------------
+    def abrir_barrido(self, metodo, al_elegir):
+        win = BarridoDialog(metodo, al_elegir=al_elegir, parent=self)
+        self._open_windows.append(win)
+        win.show()
 
     # ---------------- Histograma Ri (ventana mejorada) ----------------
     def ver_histograma_ventana(self, ri_list, titulo):
-        if not ri_list:
+        if ri_list is None or len(ri_list) == 0:
             QMessageBox.warning(self, "Advertencia", "No hay datos para mostrar. Genere números primero.")
             return
         
@@ -442,22 +825,33 @@ class TabGeneradores(QWidget):
         self._open_windows.append(win)
         win.show()
 
-    # ---------------- Exportar CSV (tabla de generador) ----------------
-    def exportar_csv(self, tabla, generador_nombre):
-        if tabla.rowCount() == 0:
+    # ---------------- Publicar y exportar (secuencia .npy o CSV, desde los arrays) ----------------
+    def guardar_secuencia(self, nombre, resultados, parametros, estado):
+        self.secuencias[nombre] = {"columnas": resultados, "parametros": parametros, "estado": estado}
+        if len(resultados) == 0:  # Corrida cancelada: no queda nada que compartir
+            ALMACEN.eliminar(nombre)
+            return
+        ALMACEN.publicar(nombre, resultados.ri, algoritmo=nombre, parametros=parametros, estado=estado)
+
+    def exportar(self, nombre, archivo):
+        secuencia = self.secuencias.get(nombre)
+        if not secuencia or len(secuencia["columnas"]) == 0:
             QMessageBox.warning(self, "Advertencia", "No hay datos para exportar. Genere números primero.")
             return
-        path, _ = QFileDialog.getSaveFileName(self, "Guardar CSV", f"{generador_nombre}.csv", "CSV Files (*.csv)")
+        path, filtro = QFileDialog.getSaveFileName(self, "Exportar secuencia", f"{archivo}.npy", FILTROS_EXPORTACION)
         if not path:
             return
+        columnas = secuencia["columnas"]
         try:
-            with open(path, mode="w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f, delimiter=';')
-                headers = [tabla.horizontalHeaderItem(i).text() for i in range(tabla.columnCount())]
-                writer.writerow(headers)
-                for row in range(tabla.rowCount()):
-                    row_data = [tabla.item(row, col).text() if tabla.item(row, col) else "" for col in range(tabla.columnCount())]
-                    writer.writerow(row_data)
+            if path.endswith(".csv") or filtro.startswith("CSV"):
+                with open(path, mode="w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f, delimiter=';')
+                    writer.writerow(columnas.columnas)
+                    for fila in columnas.filas():
+                        writer.writerow([f"{fila[c]:.6f}" if c == "Ri" else fila[c] for c in columnas.columnas])
+            else:
+                exportar_secuencia(path, columnas.ri, algoritmo=nombre,
+                                   parametros=secuencia["parametros"], estado=secuencia["estado"])
             QMessageBox.information(self, "Éxito", f"Datos exportados correctamente a {path}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"No se pudo exportar el archivo: {str(e)}")
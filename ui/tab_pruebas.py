@@ -15,6 +15,11 @@ import numpy as np
 from pruebas.media import prueba_medias
 from pruebas.varianza import prueba_varianza
 from pruebas.uniformidad import prueba_uniformidad
+from pruebas.bateria import ejecutar_bateria, resumen
+from utils.almacen import ALMACEN
+
+# Opción del combo de secuencias que usa los números escritos a mano
+INGRESO_MANUAL = "Ingreso manual"
 
 # ---------------------- BOTÓN MODERNO ---------------------- #
 class ModernButton(QPushButton):
@@ -50,7 +55,7 @@ class UniformidadDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Prueba de Uniformidad χ² Avanzada")
         self.setMinimumSize(750, 500)
-        self.numeros = []
+        self.numeros = np.empty(0)
         self.init_ui()
 
     def init_ui(self):
@@ -98,7 +103,7 @@ class UniformidadDialog(QDialog):
         self.numeros = numeros
 
     def ejecutar_uniformidad(self):
-        if not self.numeros:
+        if len(self.numeros) == 0:
             QMessageBox.warning(self, "Advertencia", "No hay números para analizar.")
             return
 
@@ -224,15 +229,28 @@ class TabPruebas(QWidget):
         # --- Entrada de datos --- #
         input_group = QGroupBox("Datos de Números Pseudoaleatorios")
         input_layout = QVBoxLayout(input_group)
+
+        # Secuencias publicadas por los generadores (se leen del almacén sin copiarlas)
+        secuencia_layout = QHBoxLayout()
+        self.combo_secuencia = QComboBox()
+        self.combo_secuencia.currentTextChanged.connect(self.actualizar_info_secuencia)
+        self.info_secuencia = QLabel("")
+        secuencia_layout.addWidget(QLabel("Secuencia:"))
+        secuencia_layout.addWidget(self.combo_secuencia, 1)
+        secuencia_layout.addWidget(self.info_secuencia)
+        input_layout.addLayout(secuencia_layout)
+
         self.nums_text_edit = QTextEdit()
         self.nums_text_edit.setPlaceholderText("Ingrese números separados por coma")
         self.nums_text_edit.setFixedHeight(100)
         input_layout.addWidget(self.nums_text_edit)
 
-        self.btn_usar_generador = ModernButton("Generar números", color="#00b894", hover_color="#00a382", pressed_color="#008f74")
+        self.btn_usar_generador = ModernButton("Usar generador actual", color="#00b894", hover_color="#00a382", pressed_color="#008f74")
         self.btn_usar_generador.clicked.connect(self.llenar_desde_generador)
         input_layout.addWidget(self.btn_usar_generador)
         layout.addWidget(input_group)
+        self.actualizar_secuencias()
+        ALMACEN.suscribir(self.actualizar_secuencias)
 
         # --- Botones de pruebas --- #
         btn_layout = QHBoxLayout()
@@ -240,6 +258,7 @@ class TabPruebas(QWidget):
         self.btn_prueba_varianza = ModernButton("Prueba de Varianza", color="#5C4254")
         self.btn_uniformidad_directo = ModernButton("Uniformidad χ²", color="#85817e")
         self.btn_uniformidad_avanzada = ModernButton("Uniformidad χ² Avanzada", color="#3E405F")
+        self.btn_bateria = ModernButton("Batería completa", color="#2d3436")
         self.btn_histograma = ModernButton("Mostrar Gráfico", color="#00cec9")
         self.btn_limpiar = ModernButton("Limpiar Todo", color="#462727")
 
@@ -247,11 +266,12 @@ class TabPruebas(QWidget):
         self.btn_prueba_varianza.clicked.connect(self.ejecutar_varianza)
         self.btn_uniformidad_directo.clicked.connect(self.ejecutar_uniformidad_directo)
         self.btn_uniformidad_avanzada.clicked.connect(self.mostrar_ventana_uniformidad)
+        self.btn_bateria.clicked.connect(self.ejecutar_bateria_completa)
         self.btn_histograma.clicked.connect(self.mostrar_histograma_tab)
         self.btn_limpiar.clicked.connect(self.limpiar_todo)
 
         for btn in [self.btn_prueba_medias, self.btn_prueba_varianza, self.btn_uniformidad_directo,
-                    self.btn_uniformidad_avanzada, self.btn_histograma, self.btn_limpiar]:
+                    self.btn_uniformidad_avanzada, self.btn_bateria, self.btn_histograma, self.btn_limpiar]:
             btn_layout.addWidget(btn)
         layout.addLayout(btn_layout)
 
@@ -279,25 +299,45 @@ class TabPruebas(QWidget):
         layout.addLayout(combo_layout)
 
     # --- FUNCIONES AUXILIARES --- #
+    def actualizar_secuencias(self):
+        """Rehace el combo con las secuencias del almacén, conservando la selección."""
+        actual = self.combo_secuencia.currentText()
+        self.combo_secuencia.blockSignals(True)
+        self.combo_secuencia.clear()
+        self.combo_secuencia.addItems([INGRESO_MANUAL] + ALMACEN.nombres())
+        indice = self.combo_secuencia.findText(actual)
+        self.combo_secuencia.setCurrentIndex(max(indice, 0))
+        self.combo_secuencia.blockSignals(False)
+        self.actualizar_info_secuencia(self.combo_secuencia.currentText())
+
+    def actualizar_info_secuencia(self, nombre):
+        ri = ALMACEN.obtener(nombre)
+        self.info_secuencia.setText("" if ri is None else f"n = {len(ri)}")
+        self.nums_text_edit.setEnabled(ri is None)
+
     def obtener_numeros(self):
+        """Ri a analizar: la secuencia elegida (por referencia) o los números escritos a mano."""
+        ri = ALMACEN.obtener(self.combo_secuencia.currentText())
+        if ri is not None:
+            return ri
         texto_manual = self.nums_text_edit.toPlainText().strip()
         if texto_manual:
             try:
-                return [float(x) for x in texto_manual.replace(',', ' ').split()]
+                return np.array([float(x) for x in texto_manual.replace(',', ' ').split()])
             except ValueError:
                 QMessageBox.warning(self, "Error", "Ingrese solo números válidos.")
-                return []
+                return np.empty(0)
         return self.generadores_tab.obtener_ri_actual()
 
     def llenar_desde_generador(self):
-        nums = self.generadores_tab.obtener_ri_actual()
-        if not nums:
+        nombre = self.generadores_tab.nombre_actual()
+        if nombre not in ALMACEN:
             QMessageBox.warning(self, "Advertencia", "No hay números generados.")
             return
-        self.nums_text_edit.setText(', '.join(f"{n:.6f}" for n in nums))
-        QMessageBox.information(self, "Éxito", f"Se han cargado {len(nums)} números del generador.")
+        self.combo_secuencia.setCurrentText(nombre)
 
     def limpiar_todo(self):
+        self.combo_secuencia.setCurrentIndex(0)
         self.nums_text_edit.clear()
         self.tabla_resultados.setRowCount(0)
         self.resultados_medias = None
@@ -322,7 +362,7 @@ class TabPruebas(QWidget):
     # --- FUNCIONES DE PRUEBAS --- #
     def ejecutar_medias(self):
         nums = self.obtener_numeros()
-        if not nums: return
+        if len(nums) == 0: return
         self.resultados_medias = prueba_medias(nums)
         self.actualizar_tabla("Medias", self.resultados_medias["media"],
                                self.resultados_medias["limite_inferior"],
@@ -332,7 +372,7 @@ class TabPruebas(QWidget):
 
     def ejecutar_varianza(self):
         nums = self.obtener_numeros()
-        if not nums: return
+        if len(nums) == 0: return
         self.resultados_varianza = prueba_varianza(nums)
         self.actualizar_tabla("Varianza", self.resultados_varianza["varianza"],
                                self.resultados_varianza["limite_inferior"],
@@ -342,16 +382,34 @@ class TabPruebas(QWidget):
 
     def ejecutar_uniformidad_directo(self):
         nums = self.obtener_numeros()
-        if not nums: return
+        if len(nums) == 0: return
         self.resultados_uniformidad = prueba_uniformidad(nums)
         self.actualizar_tabla("Uniformidad χ²", self.resultados_uniformidad["chi_cuadrado"],
                                0, self.resultados_uniformidad["chi_critico"],
                                self.resultados_uniformidad["acepta_hipotesis"])
         self.enviar_resultados()
 
+    def ejecutar_bateria_completa(self):
+        nums = self.obtener_numeros()
+        if len(nums) == 0:
+            QMessageBox.warning(self, "Advertencia", "No hay números para analizar.")
+            return
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            reporte = ejecutar_bateria(nums)
+        finally:
+            QApplication.restoreOverrideCursor()
+        for nombre, resultado in reporte["pruebas"].items():
+            valor, limite_inf, limite_sup, acepta = resumen(nombre, resultado)
+            self.actualizar_tabla(nombre.replace("_", " ").capitalize(), valor, limite_inf, limite_sup, acepta)
+        QMessageBox.information(self, "Batería completa",
+                                f"{sum(r['acepta_hipotesis'] for r in reporte['pruebas'].values())} de "
+                                f"{len(reporte['pruebas'])} pruebas aceptan H₀ (n = {reporte['n']}, "
+                                f"{reporte['segundos']:.2f} s).")
+
     def mostrar_ventana_uniformidad(self):
         nums = self.obtener_numeros()
-        if not nums:
+        if len(nums) == 0:
             QMessageBox.warning(self, "Advertencia", "No hay números para analizar.")
             return
         dialog = UniformidadDialog(self)
@@ -390,7 +448,7 @@ class TabPruebas(QWidget):
     # --- FUNCIONES DE GRÁFICO --- #
     def mostrar_histograma_tab(self):
         nums = self.obtener_numeros()
-        if not nums:
+        if len(nums) == 0:
             QMessageBox.warning(self, "Advertencia", "No hay números para mostrar.")
             return
 
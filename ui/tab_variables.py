@@ -10,6 +10,10 @@ import numpy as np
 # Importar distribuciones
 from distribuciones.distribuciones_continuas import *
 from distribuciones.distribuciones_discretas import *
+from utils.almacen import ALMACEN
+
+# Opción del combo de muestras que solo dibuja las curvas teóricas
+SIN_MUESTRA = "Ninguna"
 
 class MatplotlibCanvas(FigureCanvas):
     def __init__(self, parent=None, width=5, height=4, dpi=100):
@@ -53,6 +57,13 @@ class TabVariables(QWidget):
         self.dist_combo = QComboBox()
         self.dist_combo.currentTextChanged.connect(self.on_distribution_changed)
         dist_layout.addRow("Distribución:", self.dist_combo)
+
+        # Ri publicados por los generadores: se transforman por la inversa de la CDF
+        self.muestra_combo = QComboBox()
+        self.actualizar_muestras()
+        self.muestra_combo.currentTextChanged.connect(self.update_plots)
+        ALMACEN.suscribir(self.actualizar_muestras)
+        dist_layout.addRow("Muestra (Ri):", self.muestra_combo)
         
         # Grupo de parámetros
         self.params_group = QGroupBox("PARÁMETROS")
@@ -175,6 +186,27 @@ class TabVariables(QWidget):
         """
         self.setStyleSheet(style)
     
+    def actualizar_muestras(self):
+        actual = self.muestra_combo.currentText()
+        self.muestra_combo.blockSignals(True)
+        self.muestra_combo.clear()
+        self.muestra_combo.addItems([SIN_MUESTRA] + ALMACEN.nombres())
+        self.muestra_combo.setCurrentIndex(max(self.muestra_combo.findText(actual), 0))
+        self.muestra_combo.blockSignals(False)
+
+    def obtener_muestra(self, x, cdf, discreta):
+        """
+        Variables X = F^-1(Ri) de la secuencia elegida, con la CDF evaluada en la
+        malla x del gráfico (interpolada si es continua). None si no hay muestra.
+        """
+        ri = ALMACEN.obtener(self.muestra_combo.currentText())
+        if ri is None or len(ri) == 0:
+            return None
+        if discreta:
+            indices = np.minimum(np.searchsorted(cdf, ri, side="left"), len(x) - 1)
+            return x[indices]
+        return np.interp(ri, cdf, x)
+
     def mostrar_resultados(self, resultados):
         """Método para mostrar resultados desde otras pestañas"""
         pass
@@ -444,8 +476,9 @@ class TabVariables(QWidget):
             cdf = distribucion_weibull_cdf(x, alpha, beta, gamma)
             info = self.get_weibull_info(alpha, beta, gamma)
         
-        self.update_pdf_plot(x, pdf, distribution, "Continua")
-        self.update_cdf_plot(x, cdf, distribution, "Continua")
+        muestra = self.obtener_muestra(x, cdf, discreta=False)
+        self.update_pdf_plot(x, pdf, distribution, "Continua", muestra)
+        self.update_cdf_plot(x, cdf, distribution, "Continua", muestra)
         self.info_text.setText(info)
     
     def update_discrete_plots(self, distribution):
@@ -481,8 +514,9 @@ class TabVariables(QWidget):
             cdf = distribucion_poisson_cdf(x, lam)
             info = self.get_poisson_info(lam)
         
-        self.update_pmf_plot(x, pmf, distribution)
-        self.update_cdf_plot(x, cdf, distribution, "Discreta")
+        muestra = self.obtener_muestra(x, cdf, discreta=True)
+        self.update_pmf_plot(x, pmf, distribution, muestra)
+        self.update_cdf_plot(x, cdf, distribution, "Discreta", muestra)
         self.info_text.setText(info)
     
     def get_current_params(self):
@@ -493,13 +527,17 @@ class TabVariables(QWidget):
                 params[key] = control.value()
         return params
     
-    def update_pdf_plot(self, x, y, distribution, dist_type):
+    def update_pdf_plot(self, x, y, distribution, dist_type, muestra=None):
         """Actualiza el gráfico de PDF"""
         self.pdf_canvas.fig.clear()
         ax = self.pdf_canvas.fig.add_subplot(111)
         
         ax.plot(x, y, 'b-', linewidth=2, alpha=0.8)
         ax.fill_between(x, y, alpha=0.3, color='blue')
+        if muestra is not None:
+            ax.hist(muestra, bins=50, range=(x[0], x[-1]), density=True, alpha=0.5,
+                    color='orange', label=f'Muestra (n = {len(muestra)})')
+            ax.legend(fontsize=9)
         ax.set_xlabel('x', fontsize=10)
         ax.set_ylabel('f(x)', fontsize=10)
         ax.set_title(f'Distribución {distribution} - PDF', fontsize=11, fontweight='bold')
@@ -508,12 +546,16 @@ class TabVariables(QWidget):
         
         self.pdf_canvas.draw()
     
-    def update_pmf_plot(self, x, y, distribution):
+    def update_pmf_plot(self, x, y, distribution, muestra=None):
         """Actualiza el gráfico de PMF"""
         self.pdf_canvas.fig.clear()
         ax = self.pdf_canvas.fig.add_subplot(111)
         
         ax.bar(x, y, alpha=0.7, edgecolor='blue', width=0.8, color='skyblue')
+        if muestra is not None:
+            frecuencias = np.bincount(muestra - x[0], minlength=len(x)) / len(muestra)
+            ax.bar(x, frecuencias, alpha=0.7, width=0.4, color='orange', label=f'Muestra (n = {len(muestra)})')
+            ax.legend(fontsize=9)
         ax.set_xlabel('x', fontsize=10)
         ax.set_ylabel('P(X = x)', fontsize=10)
         ax.set_title(f'Distribución {distribution} - PMF', fontsize=11, fontweight='bold')
@@ -522,7 +564,7 @@ class TabVariables(QWidget):
         
         self.pdf_canvas.draw()
     
-    def update_cdf_plot(self, x, y, distribution, dist_type):
+    def update_cdf_plot(self, x, y, distribution, dist_type, muestra=None):
         """Actualiza el gráfico de CDF"""
         self.cdf_canvas.fig.clear()
         ax = self.cdf_canvas.fig.add_subplot(111)
@@ -531,6 +573,11 @@ class TabVariables(QWidget):
             ax.plot(x, y, 'r-', linewidth=2, alpha=0.8)
         else:
             ax.step(x, y, where='post', color='red', linewidth=2, alpha=0.8)
+        if muestra is not None:
+            # CDF empírica de la muestra sobre la misma malla
+            empirica = np.searchsorted(np.sort(muestra), x, side='right') / len(muestra)
+            ax.step(x, empirica, where='post', color='orange', linewidth=1.5, label='Empírica')
+            ax.legend(fontsize=9)
         
         ax.set_xlabel('x', fontsize=10)
         ax.set_ylabel('F(x)', fontsize=10)
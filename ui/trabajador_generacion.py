@@ -0,0 +1,73 @@
+# ------------------ GENERACIÓN EN SEGUNDO PLANO ------------------
+# Corre la generación en un QThread para que la ventana no se congele con n
+# grandes. La corrida se genera por bloques: tras cada uno se informa el
+# progreso, se entregan las filas ya listas (la tabla virtual crece sin
+# formatear nada) y se revisa si se pidió cancelar. Al cancelar se conserva lo
+# generado hasta el último bloque completo.
+import threading
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+
+class TrabajadorGeneracion(QObject):
+    progreso = pyqtSignal(int, int)         # filas generadas, total
+    bloque_listo = pyqtSignal(object)       # resultado parcial (crece entre bloques)
+    terminado = pyqtSignal(object, bool)    # TablaColumnar (parcial si se canceló), cancelado
+    error = pyqtSignal(str)
+
+    def __init__(self, generar, total: int):
+        """generar(al_bloque) -> TablaColumnar; al_bloque(parcial) devuelve False para cortar."""
+        super().__init__()
+        self._generar = generar
+        self._total = total
+        self._cancelado = threading.Event()
+
+    def cancelar(self):
+        self._cancelado.set()
+
+    def _al_bloque(self, parcial) -> bool:
+        self.bloque_listo.emit(parcial)
+        self.progreso.emit(len(parcial), self._total)
+        return not self._cancelado.is_set()
+
+    @pyqtSlot()
+    def ejecutar(self):
+        try:
+            resultados = self._generar(self._al_bloque)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.terminado.emit(resultados, self._cancelado.is_set() and len(resultados) < self._total)
+
+
+class TrabajadorTarea(QObject):
+    """Corre una función cualquiera en el hilo (p. ej. un barrido de semillas) y entrega su resultado."""
+    terminado = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, funcion):
+        super().__init__()
+        self._funcion = funcion
+
+    @pyqtSlot()
+    def ejecutar(self):
+        try:
+            resultado = self._funcion()
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        self.terminado.emit(resultado)
+
+
+def lanzar_en_hilo(trabajador) -> QThread:
+    """
+    Mueve el trabajador a un QThread nuevo y lo arranca. Quien llama debe
+    conservar el hilo y el trabajador hasta que hilo.isFinished().
+    """
+    hilo = QThread()
+    trabajador.moveToThread(hilo)
+    hilo.started.connect(trabajador.ejecutar)
+    trabajador.terminado.connect(hilo.quit)
+    trabajador.error.connect(hilo.quit)
+    hilo.start()
+    return hilo
@@ -0,0 +1,71 @@
+# ------------------ ALMACÉN DE SECUENCIAS DE LA SESIÓN ------------------
+# Secuencias Ri con nombre que los generadores publican y que las pruebas y el
+# autómata leen por referencia: se guarda el mismo array NumPy (de solo lectura),
+# sin copiarlo ni pasarlo por texto. No depende de Qt; quien necesite enterarse
+# de los cambios (p. ej. un combo) se suscribe con una función.
+from collections import OrderedDict
+
+import numpy as np
+
+
+class AlmacenSecuencias:
+    def __init__(self):
+        self._secuencias = OrderedDict()  # nombre -> (ri, metadatos), en orden de publicación
+        self._suscriptores = []
+
+    def publicar(self, nombre: str, ri, **metadatos):
+        """
+        Guarda ri bajo nombre (reemplaza la anterior). Si ya es un array float64
+        no se copia; se marca de solo lectura porque lo comparten varias pestañas.
+        """
+        ri = np.asarray(ri, dtype=np.float64)
+        if ri.ndim != 1:
+            raise ValueError("La secuencia debe ser unidimensional")
+        ri.flags.writeable = False
+        self._secuencias.pop(nombre, None)
+        self._secuencias[nombre] = (ri, metadatos)
+        self._notificar()
+        return ri
+
+    def obtener(self, nombre: str):
+        """Ri publicada bajo nombre (el mismo array), o None si no existe."""
+        guardada = self._secuencias.get(nombre)
+        return None if guardada is None else guardada[0]
+
+    def metadatos(self, nombre: str) -> dict:
+        guardada = self._secuencias.get(nombre)
+        return {} if guardada is None else dict(guardada[1])
+
+    def nombres(self) -> list:
+        return list(self._secuencias)
+
+    def ultimo(self):
+        """Nombre de la última secuencia publicada, o None si el almacén está vacío."""
+        return next(reversed(self._secuencias), None)
+
+    def eliminar(self, nombre: str):
+        if self._secuencias.pop(nombre, None) is not None:
+            self._notificar()
+
+    def __contains__(self, nombre) -> bool:
+        return nombre in self._secuencias
+
+    def __len__(self) -> int:
+        return len(self._secuencias)
+
+    # ---------------- Suscripción ----------------
+    def suscribir(self, funcion):
+        """funcion() se llama cada vez que se publica o elimina una secuencia."""
+        self._suscriptores.append(funcion)
+
+    def desuscribir(self, funcion):
+        if funcion in self._suscriptores:
+            self._suscriptores.remove(funcion)
+
+    def _notificar(self):
+        for funcion in list(self._suscriptores):
+            funcion()
+
+
+# Almacén compartido por las pestañas de la aplicación
+ALMACEN = AlmacenSecuencias()
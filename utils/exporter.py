@@ -0,0 +1,110 @@
+# ------------------ EXPORTACIÓN DE SECUENCIAS Ri ------------------
+# Escritura por bloques: recibe cualquier iterable de arrays Ri (por ejemplo
+# generador.iterar_bloques(...)) y los vuelca al archivo sin acumularlos en memoria.
+import json
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+
+def exportar_csv_bloques(ruta, bloques, delimitador=","):
+    """Escribe un CSV "Iteracion,Ri" bloque a bloque. Devuelve la cantidad de filas."""
+    total = 0
+    with open(ruta, mode="w", newline="", encoding="utf-8") as f:
+        f.write(f"Iteracion{delimitador}Ri\n")
+        for ri in bloques:
+            ri = np.asarray(ri, dtype=np.float64)
+            iteraciones = np.arange(total + 1, total + len(ri) + 1)
+            np.savetxt(f, np.column_stack((iteraciones, ri)), fmt=["%d", "%.8f"], delimiter=delimitador)
+            total += len(ri)
+    return total
+
+
+def exportar_binario_bloques(ruta, bloques):
+    """Escribe los Ri como float64 little-endian crudos, bloque a bloque. Devuelve la cantidad de valores."""
+    total = 0
+    with open(ruta, mode="wb") as f:
+        for ri in bloques:
+            np.asarray(ri, dtype="<f8").tofile(f)
+            total += len(ri)
+    return total
+
+
+# ------------------ SECUENCIAS BINARIAS (.npy + metadatos) ------------------
+# El array va en un .npy estándar (se abre con np.load(..., mmap_mode="r") sin
+# leerlo completo) y los metadatos (algoritmo, parámetros, estado inicial) en
+# un JSON al lado: "secuencia.npy" -> "secuencia.npy.json".
+VERSION_SECUENCIA = 1
+
+
+def ruta_secuencia(ruta) -> str:
+    """np.save agrega ".npy" si falta; se normaliza aquí para que el JSON quede al lado."""
+    ruta = str(ruta)
+    return ruta if ruta.endswith(".npy") else f"{ruta}.npy"
+
+
+def ruta_metadatos(ruta) -> str:
+    return f"{ruta_secuencia(ruta)}.json"
+
+
+def _escribir_metadatos(ruta, total, algoritmo, parametros, estado, extra):
+    metadatos = {
+        "version": VERSION_SECUENCIA,
+        "algoritmo": algoritmo,
+        "parametros": parametros or {},
+        "estado": estado or {},
+        "n": total,
+        "dtype": "<f8",
+    }
+    metadatos.update(extra)
+    with open(ruta_metadatos(ruta), mode="w", encoding="utf-8") as f:
+        json.dump(metadatos, f, ensure_ascii=False, indent=2, default=lambda v: v.item() if isinstance(v, np.generic) else str(v))
+    return metadatos
+
+
+def exportar_secuencia(ruta, ri, algoritmo=None, parametros=None, estado=None, **extra):
+    """Guarda los Ri en ruta (.npy, float64) y sus metadatos en ruta + ".json". Devuelve la cantidad de valores."""
+    ri = np.ascontiguousarray(ri, dtype="<f8")
+    ruta = ruta_secuencia(ruta)
+    np.save(ruta, ri, allow_pickle=False)
+    _escribir_metadatos(ruta, len(ri), algoritmo, parametros, estado, extra)
+    return len(ri)
+
+
+def exportar_secuencia_bloques(ruta, bloques, total: int, algoritmo=None, parametros=None, estado=None, **extra):
+    """
+    Como exportar_secuencia, pero escribiendo bloque a bloque sobre un .npy
+    mapeado en memoria de total valores (para secuencias que no caben en RAM).
+    """
+    ruta = ruta_secuencia(ruta)
+    destino = open_memmap(ruta, mode="w+", dtype="<f8", shape=(total,))
+    escritos = 0
+    for ri in bloques:
+        ri = np.asarray(ri, dtype="<f8")
+        if escritos + len(ri) > total:
+            raise ValueError(f"Los bloques superan los {total} valores declarados")
+        destino[escritos:escritos + len(ri)] = ri
+        escritos += len(ri)
+    destino.flush()
+    del destino
+    if escritos != total:
+        raise ValueError(f"Se escribieron {escritos} valores de los {total} declarados")
+    _escribir_metadatos(ruta, total, algoritmo, parametros, estado, extra)
+    return total
+
+
+def cargar_secuencia(ruta, mapear: bool = True):
+    """
+    Abre una secuencia guardada con exportar_secuencia. Con mapear=True el array
+    es un memmap de solo lectura: las pruebas lo recorren sin cargarlo en RAM.
+    Devuelve (ri, metadatos); metadatos es {} si falta el JSON.
+    """
+    ri = np.load(ruta_secuencia(ruta), mmap_mode="r" if mapear else None, allow_pickle=False)
+    if ri.ndim != 1:
+        raise ValueError("La secuencia debe ser un array de una dimensión")
+    try:
+        with open(ruta_metadatos(ruta), encoding="utf-8") as f:
+            metadatos = json.load(f)
+    except FileNotFoundError:
+        metadatos = {}
+    return ri, metadatos